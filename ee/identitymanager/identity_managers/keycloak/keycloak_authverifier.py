@@ -1,8 +1,12 @@
+import hashlib
 import logging
 import os
+import time
 
 from fastapi import Depends, HTTPException
+from jwcrypto import jwk
 
+from keep.api.core.cache import TenantCache
 from keep.api.core.config import config
 from keep.api.core.db import create_tenant, get_tenants
 from keep.identitymanager.authenticatedentity import AuthenticatedEntity
@@ -44,6 +48,25 @@ def patched_init(
 
 ConnectionManager.__init__ = patched_init
 
+# the realm public key, to validate the tokens locally instead of fetching it on
+# every request. it's fetched again when a token fails the validation (key rotation)
+keycloak_public_keys_cache = TenantCache(
+    "keycloak_public_keys",
+    max_size=16,
+    ttl=config("KEYCLOAK_PUBLIC_KEY_CACHE_TTL", default=3600, cast=int),
+)
+# the UMA decisions by token, resource and scope, never kept past the token expiration
+KEYCLOAK_UMA_DECISIONS_CACHE_TTL = config(
+    "KEYCLOAK_UMA_DECISIONS_CACHE_TTL", default=30, cast=int
+)
+uma_decisions_cache = TenantCache(
+    "keycloak_uma_decisions",
+    max_size=config("KEYCLOAK_UMA_DECISIONS_CACHE_SIZE", default=10000, cast=int),
+    ttl=KEYCLOAK_UMA_DECISIONS_CACHE_TTL,
+)
+# the public keys are not tenant specific
+_PARTITION = "*"
+
 
 class KeycloakAuthVerifier(AuthVerifierBase):
     """Handles authentication and authorization for Keycloak"""
@@ -202,7 +225,7 @@ class KeycloakAuthVerifier(AuthVerifierBase):
                 active_tenant = active_tenant.split("=")[1]
             else:
                 active_tenant = None
-            payload = self.keycloak_client.decode_token(token, validate=True)
+            payload = self._decode_token(token)
         except Exception as e:
             if "Expired" in str(e):
                 raise HTTPException(status_code=401, detail="Expired Keycloak token")
@@ -334,12 +357,83 @@ class KeycloakAuthVerifier(AuthVerifierBase):
             org_id=org_id,
             org_realm=org_realm,
             token=token,
+            token_id=payload.get("jti") or hashlib.sha256(token.encode()).hexdigest(),
+            token_expires_at=payload.get("exp"),
         )
         if user_orgs:
             authenticated_entity.user_orgs = user_orgs
 
         return authenticated_entity
 
+    def _get_public_key(self, refresh: bool = False) -> jwk.JWK:
+        cache_key = (self.keycloak_url, self.keycloak_realm)
+        if not refresh:
+            public_key = keycloak_public_keys_cache.get(_PARTITION, cache_key)
+            if public_key is not None:
+                return public_key
+
+        public_key = jwk.JWK.from_pem(
+            (
+                "-----BEGIN PUBLIC KEY-----\n"
+                + self.keycloak_client.public_key()
+                + "\n-----END PUBLIC KEY-----"
+            ).encode("utf-8")
+        )
+        keycloak_public_keys_cache.set(_PARTITION, cache_key, public_key)
+        return public_key
+
+    def _decode_token(self, token: str) -> dict:
+        """Validate the token with the cached realm public key and return its claims"""
+        try:
+            return self.keycloak_client.decode_token(
+                token, validate=True, key=self._get_public_key()
+            )
+        except Exception as e:
+            if "Expired" in str(e):
+                raise
+            # the realm keys may have been rotated since the key was cached
+            return self.keycloak_client.decode_token(
+                token, validate=True, key=self._get_public_key(refresh=True)
+            )
+
+    def _permissions_check(
+        self,
+        authenticated_entity: AuthenticatedEntity,
+        resource: str,
+        scope: str | None = None,
+    ) -> bool:
+        """
+        Check the permission with Keycloak's UMA, the decision is cached for the token
+        for KEYCLOAK_UMA_DECISIONS_CACHE_TTL seconds (at most until it expires).
+        """
+        token_id = getattr(authenticated_entity, "token_id", None)
+        cache_key = (token_id, resource, scope)
+        if token_id:
+            allowed = uma_decisions_cache.get(authenticated_entity.tenant_id, cache_key)
+            if allowed is not None:
+                return allowed
+
+        permission = (
+            UMAPermission(resource=resource, scope=scope)
+            if scope
+            else UMAPermission(resource=resource)
+        )
+        self.logger.info(f"Checking permission {permission}")
+        allowed = self.keycloak_uma.permissions_check(
+            token=authenticated_entity.token, permissions=[permission]
+        )
+        self.logger.info(f"Permission check result: {allowed}")
+
+        ttl = KEYCLOAK_UMA_DECISIONS_CACHE_TTL
+        token_expires_at = getattr(authenticated_entity, "token_expires_at", None)
+        if token_expires_at:
+            ttl = min(ttl, token_expires_at - time.time())
+        if token_id and ttl > 0:
+            uma_decisions_cache.set(
+                authenticated_entity.tenant_id, cache_key, allowed, ttl=ttl
+            )
+        return allowed
+
     def _authorize(self, authenticated_entity: AuthenticatedEntity) -> None:
 
         # multi org does not support UMA for now:
@@ -348,15 +442,11 @@ class KeycloakAuthVerifier(AuthVerifierBase):
 
         # for single tenant Keycloaks, use Keycloak's UMA to authorize
         try:
-            permission = UMAPermission(
+            allowed = self._permissions_check(
+                authenticated_entity,
                 resource=self.protected_resource,
                 scope=self.scopes[0],  # todo: handle multiple scopes per resource
             )
-            self.logger.info(f"Checking permission {permission}")
-            allowed = self.keycloak_uma.permissions_check(
-                token=authenticated_entity.token, permissions=[permission]
-            )
-            self.logger.info(f"Permission check result: {allowed}")
             if not allowed:
                 raise HTTPException(status_code=403, detail="Permission check failed")
         # secure fallback
@@ -371,11 +461,8 @@ class KeycloakAuthVerifier(AuthVerifierBase):
     ) -> None:
         # use Keycloak's UMA to authorize
         try:
-            permission = UMAPermission(
-                resource=resource_id,
-            )
-            allowed = self.keycloak_uma.permissions_check(
-                token=authenticated_entity.token, permissions=[permission]
+            allowed = self._permissions_check(
+                authenticated_entity, resource=resource_id
             )
             if not allowed:
                 raise HTTPException(status_code=401, detail="Permission check failed")
@@ -9,6 +9,7 @@ from fastapi import HTTPException
 from keep.api.core.config import config
 from keep.api.core.db import (
     create_deduplication_event,
+    create_deduplication_events,
     create_deduplication_rule,
     delete_deduplication_rule,
     get_alerts_fields,
@@ -24,6 +25,7 @@ from keep.api.models.alert import (
     DeduplicationRuleDto,
     DeduplicationRuleRequestDto,
 )
+from keep.providers.base.base_provider import invalidate_format_alert_cache
 from keep.providers.providers_factory import ProvidersFactory
 
 DEFAULT_RULE_UUID = "00000000-0000-0000-0000-000000000000"
@@ -177,6 +179,134 @@ class AlertDeduplicator:
 
         return alert
 
+    def apply_deduplication_batch(
+        self,
+        events: list[AlertDto],
+        rules: list["DeduplicationRuleDto"] | None = None,
+        last_alert_fingerprint_to_hash: dict[str, str] | None = None,
+    ) -> list[AlertDto]:
+        """
+        Batch version of apply_deduplication, gives the exact same alert hashes.
+
+        Each alert is serialized once and the ignore fields of every rule are
+        removed from that serialization instead of from deep copies of the alert.
+        The last alert hashes are fetched with one query (unless given) and the
+        deduplication events are written with one commit.
+
+        Args:
+            events (list[AlertDto]): the alerts, with their fingerprint already set.
+            rules (list[DeduplicationRuleDto], optional): the rules to apply,
+                resolved per alert provider if not given.
+            last_alert_fingerprint_to_hash (dict[str, str], optional): hash of
+                the last alert per fingerprint.
+
+        Returns:
+            list[AlertDto]: the same alerts, with alert_hash and the duplicate flags set.
+        """
+        if not events:
+            return events
+        if last_alert_fingerprint_to_hash is None:
+            last_alert_fingerprint_to_hash = get_last_alert_hashes_by_fingerprints(
+                self.tenant_id, list({event.fingerprint for event in events})
+            )
+
+        rules_by_provider = {}
+        ignore_paths_by_rule = {}
+        deduplication_events = []
+        for alert in events:
+            alert_rules = rules
+            if not alert_rules:
+                provider_key = (alert.providerId, alert.providerType)
+                if provider_key not in rules_by_provider:
+                    rules_by_provider[provider_key] = self.get_deduplication_rules(
+                        self.tenant_id, alert.providerId, alert.providerType
+                    )
+                alert_rules = rules_by_provider[provider_key]
+
+            alert_dict = alert.dict()
+            last_alert_hash = last_alert_fingerprint_to_hash.get(alert.fingerprint)
+            for rule in alert_rules:
+                if id(rule) not in ignore_paths_by_rule:
+                    ignore_paths_by_rule[id(rule)] = [
+                        field.split(".") for field in rule.ignore_fields
+                    ]
+                alert_hash = hashlib.sha256(
+                    json.dumps(
+                        self._without_fields(
+                            alert_dict, ignore_paths_by_rule[id(rule)]
+                        ),
+                        default=str,
+                        sort_keys=True,
+                    ).encode()
+                ).hexdigest()
+                alert.alert_hash = alert_hash
+                if last_alert_hash and last_alert_hash == alert_hash:
+                    self.logger.info(
+                        "Alert is deduplicated",
+                        extra={
+                            "alert_id": alert.id,
+                            "rule_id": rule.id,
+                            "tenant_id": self.tenant_id,
+                        },
+                    )
+                    alert.isFullDuplicate = True
+                elif last_alert_hash:
+                    self.logger.info(
+                        "Alert is partially deduplicated",
+                        extra={
+                            "alert_id": alert.id,
+                            "tenant_id": self.tenant_id,
+                        },
+                    )
+                    alert.isPartialDuplicate = True
+                # the next rule sees the alert as apply_deduplication would
+                alert_dict["alert_hash"] = alert.alert_hash
+                alert_dict["isFullDuplicate"] = alert.isFullDuplicate
+                alert_dict["isPartialDuplicate"] = alert.isPartialDuplicate
+
+                if AlertDeduplicator.DEDUPLICATION_DISTRIBUTION_ENABLED:
+                    is_duplicate = alert.isFullDuplicate or alert.isPartialDuplicate
+                    deduplication_events.append(
+                        {
+                            "deduplication_rule_id": rule.id,
+                            "deduplication_type": (
+                                "full"
+                                if alert.isFullDuplicate
+                                else "partial" if is_duplicate else "none"
+                            ),
+                            "provider_id": alert.providerId,
+                            "provider_type": alert.providerType,
+                        }
+                    )
+                    # we don't need to check the other rules
+                    if is_duplicate:
+                        break
+
+        if deduplication_events:
+            create_deduplication_events(self.tenant_id, deduplication_events)
+        return events
+
+    def _without_fields(self, alert_dict: dict, ignore_paths: list[list[str]]) -> dict:
+        """The dict equivalent of applying _remove_field for every ignore path."""
+        # only the top level and the nested dicts on the removed paths are copied
+        alert_dict = dict(alert_dict)
+        for field_parts in ignore_paths:
+            if len(field_parts) == 1:
+                if field_parts[0] in alert_dict:
+                    del alert_dict[field_parts[0]]
+                else:
+                    self.logger.warning(
+                        f"Failed to delete attribute {field_parts[0]} from alert"
+                    )
+            else:
+                d = copy.deepcopy(alert_dict[field_parts[0]])
+                for part in field_parts[1:-1]:
+                    d = d[part]
+                del d[field_parts[-1]]
+                # same as _remove_field, which sets the innermost dict back
+                alert_dict[field_parts[0]] = d
+        return alert_dict
+
     def _remove_field(self, field, alert: AlertDto) -> AlertDto:
         alert = copy.deepcopy(alert)
         field_parts = field.split(".")
@@ -516,6 +646,7 @@ class AlertDeduplicator:
             ignore_fields=rule.ignore_fields or [],
             priority=0,
         )
+        invalidate_format_alert_cache(self.tenant_id)
 
         return new_rule
 
@@ -573,6 +704,7 @@ class AlertDeduplicator:
             ignore_fields=rule.ignore_fields or [],
             priority=0,
         )
+        invalidate_format_alert_cache(self.tenant_id)
 
         return updated_rule
 
@@ -606,5 +738,6 @@ class AlertDeduplicator:
             )
 
         success = delete_deduplication_rule(rule_id=rule_id, tenant_id=self.tenant_id)
+        invalidate_format_alert_cache(self.tenant_id)
 
         return success
@@ -4,6 +4,7 @@ import re
 
 import keep.api.core.db as db
 from keep.api.core.config import config
+from keep.providers.base.base_provider import invalidate_format_alert_cache
 from keep.providers.providers_factory import ProvidersFactory
 
 logger = logging.getLogger(__name__)
@@ -97,6 +98,8 @@ def provision_deduplication_rules(deduplication_rules: dict[str, any], tenant_id
             is_provisioned=True,
         )
 
+    invalidate_format_alert_cache(tenant_id)
+
 
 def provision_deduplication_rules_from_env(tenant_id: str):
     """
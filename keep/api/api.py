@@ -24,6 +24,7 @@ from starlette_context.middleware import RawContextMiddleware
 import keep.api.logging
 import keep.api.observability
 import keep.api.utils.import_ee
+from keep.api.consts import KEEP_PULL_SCHEDULER_ENABLED
 from keep.api.core.config import config
 from keep.api.core.db import dispose_session
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
@@ -63,6 +64,7 @@ from keep.identitymanager.identitymanagerfactory import (
     IdentityManagerFactory,
     IdentityManagerTypes,
 )
+from keep.providers.providers_pull_scheduler import ProvidersPullScheduler
 from keep.topologies.topology_processor import TopologyProcessor
 
 # load all providers into cache
@@ -155,6 +157,15 @@ async def startup():
             logger.info("Topology processor started successfully")
         except Exception:
             logger.exception("Failed to start the topology processor")
+    # Start the providers pull scheduler
+    if KEEP_PULL_SCHEDULER_ENABLED:
+        try:
+            logger.info("Starting the providers pull scheduler")
+            providers_pull_scheduler = ProvidersPullScheduler.get_instance()
+            await providers_pull_scheduler.start()
+            logger.info("Providers pull scheduler started successfully")
+        except Exception:
+            logger.exception("Failed to start the providers pull scheduler")
 
     logger.info("Services started successfully")
 
@@ -184,6 +195,10 @@ async def shutdown():
         except TypeError:
             pass
         logger.info("Consumer stopped successfully")
+    if KEEP_PULL_SCHEDULER_ENABLED:
+        logger.info("Stopping the providers pull scheduler")
+        ProvidersPullScheduler.get_instance().stop()
+        logger.info("Providers pull scheduler stopped successfully")
 
     logger.info("Keep shutdown complete")
 
@@ -6,7 +6,7 @@ from typing import Optional
 from uuid import uuid4
 
 import redis
-from arq import Worker
+from arq import Retry, Worker
 from arq.worker import create_worker
 from dotenv import find_dotenv, load_dotenv
 from pydantic.utils import import_string
@@ -21,7 +21,11 @@ from keep.api.consts import (
 )
 from keep.api.core.config import config
 from keep.api.redis_settings import get_redis_settings
-from keep.api.tasks.process_event_task import process_event
+from keep.api.tasks.process_event_task import (
+    TIMES_TO_RETRY_JOB,
+    EventsNotSavedException,
+    process_event,
+)
 
 # Load environment variables
 load_dotenv(find_dotenv())
@@ -65,6 +69,147 @@ FUNCTIONS: list = (
 )
 
 
+KEEP_EVENT_COALESCING_ENABLED = config(
+    "KEEP_EVENT_COALESCING_ENABLED", default="false", cast=bool
+)
+KEEP_EVENT_COALESCING_WINDOW_MS = config(
+    "KEEP_EVENT_COALESCING_WINDOW_MS", default=50, cast=int
+)
+KEEP_EVENT_COALESCING_MAX_SIZE = config(
+    "KEEP_EVENT_COALESCING_MAX_SIZE", default=100, cast=int
+)
+
+
+class EventCoalescer:
+    """
+    Coalesces the process_event jobs of the same tenant and provider into micro-batches.
+
+    Jobs are buffered per (tenant_id, provider_type, provider_id) - and the other
+    arguments that apply to all the events of a process_event call - until the
+    window elapses or the batch is full. The batch is then processed with a single
+    process_event call, so the per call work (session, maintenance windows,
+    deduplication rules, workflows, presets, pusher...) is done once per batch.
+
+    If the batch fails before its events were saved (e.g. a malformed event), every
+    job of the batch is processed on its own, so a bad event only fails its own job.
+    If it fails later, the saved events must not go through the workflows, rules
+    engine and incidents again, so every job of the batch is retried by arq, and
+    the already saved events are deduplicated by the retry.
+    """
+
+    def __init__(self, window_ms: int, max_size: int):
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self.batches: dict[tuple, list[tuple[dict, dict, asyncio.Future]]] = {}
+        self.flush_handles: dict[tuple, asyncio.TimerHandle] = {}
+        # keep a reference to the running batches so they are not garbage collected
+        self.tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def can_coalesce(provider_type, event) -> bool:
+        # only single provider payloads, they are formatted by the provider one by
+        # one exactly like a list of payloads
+        return provider_type is not None and isinstance(event, dict)
+
+    async def submit(self, ctx: dict, process_event_kwargs: dict):
+        loop = asyncio.get_running_loop()
+        key = (
+            process_event_kwargs["tenant_id"],
+            process_event_kwargs["provider_type"],
+            process_event_kwargs["provider_id"],
+            process_event_kwargs["fingerprint"],
+            process_event_kwargs["api_key_name"],
+            process_event_kwargs["notify_client"],
+            process_event_kwargs["timestamp_forced"],
+        )
+        future = loop.create_future()
+        batch = self.batches.setdefault(key, [])
+        batch.append((ctx, process_event_kwargs, future))
+        if len(batch) >= self.max_size:
+            self.flush(key)
+        elif len(batch) == 1:
+            self.flush_handles[key] = loop.call_later(self.window, self.flush, key)
+        return await future
+
+    def flush(self, key: tuple):
+        flush_handle = self.flush_handles.pop(key, None)
+        if flush_handle is not None:
+            flush_handle.cancel()
+        batch = self.batches.pop(key, None)
+        if batch:
+            task = asyncio.create_task(self._process_batch(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _process_batch(self, batch: list[tuple[dict, dict, asyncio.Future]]):
+        if len(batch) == 1:
+            await self._process_job(*batch[0])
+            return
+
+        ctx, process_event_kwargs, _ = batch[0]
+        job_ids = [job_ctx.get("job_id") for job_ctx, _, _ in batch]
+        extra = {
+            "tenant_id": process_event_kwargs["tenant_id"],
+            "provider_type": process_event_kwargs["provider_type"],
+            "provider_id": process_event_kwargs["provider_id"],
+            "job_ids": job_ids,
+        }
+        logger.info("Processing coalesced events in worker", extra=extra)
+        process_event_func_sync = functools.partial(
+            process_event,
+            ctx={"job_id": ",".join(str(job_id) for job_id in job_ids)},
+            **{
+                **process_event_kwargs,
+                "event": [kwargs["event"] for _, kwargs, _ in batch],
+            },
+            raise_on_error=True,
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(ctx["pool"], process_event_func_sync)
+        except EventsNotSavedException:
+            logger.exception(
+                "Failed to process coalesced events, processing them one by one",
+                extra=extra,
+            )
+            await asyncio.gather(*(self._process_job(*job) for job in batch))
+            return
+        except Exception:
+            logger.exception(
+                "Failed to process coalesced events, retrying the jobs", extra=extra
+            )
+            for job_ctx, _, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        Retry(defer=job_ctx.get("job_try", 1) * TIMES_TO_RETRY_JOB)
+                    )
+            return
+        logger.info("Coalesced events processed in worker", extra=extra)
+        for _, _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    @staticmethod
+    async def _process_job(ctx: dict, process_event_kwargs: dict, future):
+        loop = asyncio.get_running_loop()
+        try:
+            resp = await loop.run_in_executor(
+                ctx["pool"],
+                functools.partial(process_event, ctx=ctx, **process_event_kwargs),
+            )
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(resp)
+
+
+event_coalescer = EventCoalescer(
+    KEEP_EVENT_COALESCING_WINDOW_MS, KEEP_EVENT_COALESCING_MAX_SIZE
+)
+
+
 async def process_event_in_worker(
     ctx,
     tenant_id,
@@ -87,6 +232,24 @@ async def process_event_in_worker(
             "tract_id": trace_id,
         },
     )
+    if KEEP_EVENT_COALESCING_ENABLED and EventCoalescer.can_coalesce(
+        provider_type, event
+    ):
+        # the job waits for the micro-batch it is part of
+        return await event_coalescer.submit(
+            ctx,
+            {
+                "tenant_id": tenant_id,
+                "provider_type": provider_type,
+                "provider_id": provider_id,
+                "fingerprint": fingerprint,
+                "api_key_name": api_key_name,
+                "trace_id": trace_id,
+                "event": event,
+                "notify_client": notify_client,
+                "timestamp_forced": timestamp_forced,
+            },
+        )
     # Create a new context that includes both the arq ctx and any other parameters
     process_event_func_sync = functools.partial(
         process_event,
@@ -154,6 +317,10 @@ class WorkerSettings:
     on_shutdown = shutdown
     redis_settings = get_redis_settings()
     timeout = 30
+    # jobs waiting for their micro-batch hold a job slot
+    max_jobs: int = (
+        max(10, KEEP_EVENT_COALESCING_MAX_SIZE) if KEEP_EVENT_COALESCING_ENABLED else 10
+    )
     functions: list = FUNCTIONS
     queue_name: str
     health_check_interval: int = 10
@@ -2,6 +2,7 @@ import datetime
 import html
 import json
 import logging
+import random
 import re
 import uuid
 from uuid import UUID
@@ -9,12 +10,14 @@ from uuid import UUID
 import celpy
 import chevron
 import json5
+from chevron.tokenizer import tokenize
 from elasticsearch import NotFoundError
 from fastapi import HTTPException
 from sqlalchemy import func
 from sqlalchemy_utils import UUIDType
 from sqlmodel import Session, select
 
+from keep.api.core.cache import TenantCache
 from keep.api.core.config import config
 from keep.api.core.db import batch_enrich
 from keep.api.core.db import enrich_entity as enrich_alert_db
@@ -26,13 +29,14 @@ from keep.api.core.db import (
     get_last_alert_by_fingerprint,
     get_mapping_rule_by_id,
     get_session_sync,
-    get_topology_data_by_dynamic_matcher,
     is_all_alerts_resolved,
 )
+from keep.api.core.dependencies import SINGLE_TENANT_UUID
 from keep.api.core.elastic import ElasticClient
+from keep.api.core.tenant_configuration import TenantConfiguration
 from keep.api.models.action_type import ActionType
 from keep.api.models.alert import AlertDto
-from keep.api.models.db.alert import Alert
+from keep.api.models.db.alert import Alert, AlertAudit, AlertEnrichment
 from keep.api.models.db.enrichment_event import (
     EnrichmentEvent,
     EnrichmentLog,
@@ -44,6 +48,7 @@ from keep.api.models.db.incident import IncidentStatus
 from keep.api.models.db.mapping import MappingRule
 from keep.api.models.db.rule import ResolveOn
 from keep.identitymanager.authenticatedentity import AuthenticatedEntity
+from keep.topologies.topology_index import get_topology_services_index
 
 
 def is_valid_uuid(uuid_str):
@@ -88,6 +93,292 @@ def get_nested_attribute(obj: AlertDto, attr_path: str):
     return obj
 
 
+# the active mapping rules of a tenant (with their row indexes), keyed by "rules".
+# invalidated by the mapping rules routes, the ttl bounds the staleness in the
+# other processes (e.g. workers)
+mapping_rules_cache = TenantCache(
+    "mapping_rules",
+    ttl=config("KEEP_MAPPING_RULES_CACHE_TTL", default=60, cast=int),
+)
+
+# a cell without any of these characters is a plain string for re.search
+_REGEX_SPECIAL_CHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def invalidate_mapping_rules_cache(tenant_id: str):
+    mapping_rules_cache.invalidate(tenant_id)
+
+
+def _is_plain_pattern(cell) -> bool:
+    return isinstance(cell, str) and _REGEX_SPECIAL_CHARACTERS.isdisjoint(cell)
+
+
+class MappingRuleIndex:
+    """
+    Index of the rows of a csv mapping rule, so matching an alert doesn't check every row.
+
+    A cell is matched with re.search (see EnrichmentsBl._check_matcher), so a plain
+    cell matches every value that contains it. For each matcher, the rows whose
+    first attribute is a plain string are indexed by that string and found by looking
+    up the substrings of the alert value (one lookup per distinct cell length); the
+    other rows (regexes, wildcards, non string cells) are always candidates.
+    Candidates are then checked, in row order, with the same semantics as
+    _check_matcher, using precompiled regexes.
+    For multi-level rules the rows are indexed by the exact value of the key.
+    """
+
+    def __init__(self, rule: MappingRule):
+        self.rows: list[dict] = rule.rows or []
+        self.matchers: list[list[str]] = [
+            [attribute.strip() for attribute in matcher] for matcher in rule.matchers
+        ]
+        # per matcher: plain cell of the first attribute -> row indexes
+        self.plain_rows: list[dict[str, list[int]]] = []
+        self.plain_lengths: list[list[int]] = []
+        # per matcher: rows that have to be checked for every alert
+        self.scan_rows: list[list[int]] = []
+        self.patterns: dict[str, re.Pattern | None] = {}
+        # multi-level mapping: key value -> first row with this value
+        self.explicit_rows: dict = {}
+
+        if rule.is_multi_level:
+            key = self.matchers[0][0]
+            for row in self.rows:
+                value = row.get(key)
+                if value is not None and not isinstance(value, (dict, list)):
+                    self.explicit_rows.setdefault(value, row)
+            return
+
+        for matcher in self.matchers:
+            plain_rows = {}
+            scan_rows = []
+            for i, row in enumerate(self.rows):
+                cell = row.get(matcher[0])
+                if _is_plain_pattern(cell):
+                    plain_rows.setdefault(cell, []).append(i)
+                else:
+                    scan_rows.append(i)
+                for attribute in matcher:
+                    self._compile(row.get(attribute))
+            self.plain_rows.append(plain_rows)
+            self.plain_lengths.append(sorted({len(cell) for cell in plain_rows}))
+            self.scan_rows.append(scan_rows)
+
+    def _compile(self, cell):
+        if not isinstance(cell, str) or _is_plain_pattern(cell):
+            return
+        if cell not in self.patterns:
+            try:
+                self.patterns[cell] = re.compile(cell)
+            except re.error:
+                # re.search raises it again when the cell is checked
+                self.patterns[cell] = None
+
+    def _candidates(self, values: dict) -> list[int]:
+        candidates = set()
+        for i, matcher in enumerate(self.matchers):
+            candidates.update(self.scan_rows[i])
+            value = values[matcher[0]]
+            if not isinstance(value, str):
+                # None never matches a plain cell, other types raise in re.search
+                continue
+            plain_rows = self.plain_rows[i]
+            for length in self.plain_lengths[i]:
+                if length > len(value):
+                    break
+                for start in range(len(value) - length + 1):
+                    candidates.update(plain_rows.get(value[start : start + length], ()))
+        return sorted(candidates)
+
+    def _cell_matches(self, value, cell) -> bool:
+        if value is not None and cell is not None:
+            if isinstance(value, str) and isinstance(cell, str):
+                if _is_plain_pattern(cell):
+                    if cell in value:
+                        return True
+                else:
+                    pattern = self.patterns.get(cell)
+                    if pattern is None:
+                        pattern = re.compile(cell)
+                    if pattern.search(value) is not None:
+                        return True
+            elif re.search(cell, value) is not None:
+                return True
+        return value == cell or cell == "*"  # Wildcard match
+
+    def find_row(self, get_value, on_error=None) -> dict | None:
+        """
+        Return the first row matching any of the matchers, like checking every row with _check_matcher.
+
+        Args:
+            get_value (callable): returns the alert value of an attribute.
+            on_error (callable, optional): called with the matcher that raised a TypeError.
+        """
+        values = {
+            attribute: get_value(attribute)
+            for matcher in self.matchers
+            for attribute in matcher
+        }
+        for i in self._candidates(values):
+            row = self.rows[i]
+            for matcher in self.matchers:
+                try:
+                    if all(
+                        self._cell_matches(values[attribute], row.get(attribute))
+                        for attribute in matcher
+                    ):
+                        return row
+                except TypeError:
+                    if on_error:
+                        on_error(matcher)
+        return None
+
+    def find_explicit_row(self, explicit_value: str) -> dict | None:
+        """Return the first row whose key equals the value (multi-level mapping)."""
+        return self.explicit_rows.get(explicit_value.strip())
+
+
+# the compiled extraction rules of a tenant, keyed by ("rules", pre).
+# invalidated by the extraction rules routes, the ttl bounds the staleness in the
+# other processes (e.g. workers)
+extraction_rules_cache = TenantCache(
+    "extraction_rules",
+    ttl=config("KEEP_EXTRACTION_RULES_CACHE_TTL", default=60, cast=int),
+)
+
+
+def invalidate_extraction_rules_cache(tenant_id: str):
+    extraction_rules_cache.invalidate(tenant_id)
+
+
+class CompiledExtractionRule:
+    """
+    An extraction rule with its attribute template, CEL condition and regex compiled once.
+
+    A part that fails to compile keeps its exception, which is raised when the
+    part is used, just like when the rule was compiled for every event.
+    """
+
+    def __init__(self, rule: ExtractionRule):
+        self.rule = rule
+        attribute = rule.attribute
+        if attribute.startswith("{{") is False and attribute.endswith("}}") is False:
+            # Wrap the attribute in {{ }} to make it a valid chevron template
+            attribute = f"{{{{ {attribute} }}}}"
+        self.template = self._compile(lambda: list(tokenize(attribute)))
+        self.has_condition = rule.condition not in (None, "*", "")
+        self.program = (
+            self._compile(self._compile_condition) if self.has_condition else None
+        )
+        self.pattern = self._compile(lambda: re.compile(rule.regex))
+
+    @staticmethod
+    def _compile(compile_function):
+        try:
+            return compile_function()
+        except Exception as e:
+            return e
+
+    def _compile_condition(self) -> celpy.Runner:
+        env = celpy.Environment()
+        return env.program(env.compile(self.rule.condition))
+
+    @staticmethod
+    def _compiled(part):
+        if isinstance(part, Exception):
+            raise part.with_traceback(None)
+        return part
+
+    def render(self, event: dict) -> str:
+        # chevron renders a list of tokens without tokenizing the template again
+        return html.unescape(chevron.render(self._compiled(self.template), event))
+
+    def evaluate(self, activation) -> bool:
+        return self._compiled(self.program).evaluate(activation)
+
+    def search(self, attribute_value: str) -> re.Match | None:
+        return self._compiled(self.pattern).search(attribute_value)
+
+
+class EnrichmentEventsTracker:
+    """
+    Which enrichment events (the result of a mapping/extraction rule on an alert) of a
+    tenant are tracked while buffering (i.e. by the event pipeline), and the tracked
+    events with their logs, so they are written with one bulk insert instead of a
+    transaction per rule and alert. Rules run on their own are always tracked.
+
+    The tracked statuses and the sample rate of the skipped events are set by
+    KEEP_ENRICHMENT_EVENTS_STATUSES and KEEP_ENRICHMENT_EVENTS_SKIPPED_SAMPLE_RATE, and
+    per tenant by the "enrichment_events" tenant configuration, e.g.
+    {"statuses": ["success", "failure", "skipped"], "skipped_sample_rate": 0.1}.
+    """
+
+    STATUSES = config(
+        "KEEP_ENRICHMENT_EVENTS_STATUSES", default="success,failure,skipped"
+    )
+    SKIPPED_SAMPLE_RATE = config(
+        "KEEP_ENRICHMENT_EVENTS_SKIPPED_SAMPLE_RATE", default=1.0, cast=float
+    )
+
+    def __init__(self, tenant_id: str):
+        self.logger = logging.getLogger(__name__)
+        self.tenant_id = tenant_id
+        tenant_policy = self._get_tenant_policy()
+        statuses = tenant_policy.get("statuses", EnrichmentEventsTracker.STATUSES)
+        if isinstance(statuses, str):
+            statuses = statuses.split(",")
+        self.statuses = {status.strip().lower() for status in statuses}
+        self.skipped_sample_rate = float(
+            tenant_policy.get(
+                "skipped_sample_rate", EnrichmentEventsTracker.SKIPPED_SAMPLE_RATE
+            )
+        )
+        self.buffering = False
+        self.events: list[EnrichmentEvent] = []
+        self.logs: list[EnrichmentLog] = []
+
+    def _get_tenant_policy(self) -> dict:
+        # the single tenant is configured by the env vars only
+        if self.tenant_id == SINGLE_TENANT_UUID:
+            return {}
+        try:
+            return (
+                TenantConfiguration().get_configuration(
+                    self.tenant_id, "enrichment_events"
+                )
+                or {}
+            )
+        except Exception:
+            self.logger.exception(
+                "Failed to get the enrichment events configuration of the tenant",
+                extra={"tenant_id": self.tenant_id},
+            )
+            return {}
+
+    def should_track(self, status: EnrichmentStatus) -> bool:
+        if status.value not in self.statuses:
+            return False
+        if status == EnrichmentStatus.SKIPPED and self.skipped_sample_rate < 1:
+            return random.random() < self.skipped_sample_rate
+        return True
+
+    def add(self, enrichment_event: EnrichmentEvent, logs: list[EnrichmentLog]):
+        self.events.append(enrichment_event)
+        self.logs.extend(logs)
+
+    def flush(self, session: Session) -> int:
+        """Write the buffered events and their logs, returns the number of events"""
+        events, logs = self.events, self.logs
+        self.events, self.logs = [], []
+        if not events:
+            return 0
+        # events first, the logs reference them
+        session.bulk_save_objects(events)
+        session.bulk_save_objects(logs)
+        session.commit()
+        return len(events)
+
+
 class EnrichmentsBl:
 
     ENRICHMENT_DISABLED = config("KEEP_ENRICHMENT_DISABLED", default="false", cast=bool)
@@ -96,6 +387,7 @@ class EnrichmentsBl:
         self.logger = logging.getLogger(__name__)
         self.tenant_id = tenant_id
         self.__logs: list[EnrichmentLog] = []
+        self.__events_tracker: EnrichmentEventsTracker | None = None
         self.enrichment_event_id: UUID | None = None
         if not EnrichmentsBl.ENRICHMENT_DISABLED:
             self.db_session = db or get_session_sync()
@@ -104,6 +396,37 @@ class EnrichmentsBl:
             self.db_session = None
             self.elastic_client = None
 
+    @property
+    def enrichment_events_tracker(self) -> EnrichmentEventsTracker:
+        if self.__events_tracker is None:
+            self.__events_tracker = EnrichmentEventsTracker(self.tenant_id)
+        return self.__events_tracker
+
+    def buffer_enrichment_events(self):
+        """
+        Buffer the tracked enrichment events until flush_enrichment_events is called,
+        e.g. for the alerts of a batch.
+        """
+        self.enrichment_events_tracker.buffering = True
+
+    def flush_enrichment_events(self):
+        """Write the buffered enrichment events and stop buffering them"""
+        tracker = self.enrichment_events_tracker
+        tracker.buffering = False
+        try:
+            events_count = tracker.flush(self.db_session)
+            if events_count:
+                self.logger.debug(
+                    "Tracked enrichment events",
+                    extra={"tenant_id": self.tenant_id, "events_count": events_count},
+                )
+        except Exception:
+            self.db_session.rollback()
+            self.logger.exception(
+                "Failed to track enrichment events",
+                extra={"tenant_id": self.tenant_id},
+            )
+
     def run_mapping_rule_by_id(self, rule_id: int, alert_id: UUID) -> AlertDto:
         rule = get_mapping_rule_by_id(self.tenant_id, rule_id, session=self.db_session)
         if not rule:
@@ -137,6 +460,53 @@ class EnrichmentsBl:
             self.logger.debug("Enrichment is disabled, skipping extraction rules")
             return event
 
+        if rules:
+            compiled_rules = [CompiledExtractionRule(rule) for rule in rules]
+        else:
+            compiled_rules = self._get_extraction_rules(pre)
+        return self._run_compiled_extraction_rules(event, pre, compiled_rules)
+
+    def run_extraction_rules_batch(
+        self, events: list[AlertDto | dict], pre=False
+    ) -> list[AlertDto | dict]:
+        """
+        Run the extraction rules for a batch of events, the rules are loaded once for the batch
+        """
+        if EnrichmentsBl.ENRICHMENT_DISABLED:
+            self.logger.debug("Enrichment is disabled, skipping extraction rules")
+            return events
+
+        compiled_rules = self._get_extraction_rules(pre)
+        return [
+            self._run_compiled_extraction_rules(event, pre, compiled_rules)
+            for event in events
+        ]
+
+    def _get_extraction_rules(self, pre: bool) -> list[CompiledExtractionRule]:
+        def get_compiled_rules():
+            rules: list[ExtractionRule] = (
+                self.db_session.query(ExtractionRule)
+                .filter(ExtractionRule.tenant_id == self.tenant_id)
+                .filter(ExtractionRule.disabled == False)
+                .filter(ExtractionRule.pre == pre)
+                .order_by(ExtractionRule.priority.desc())
+                .all()
+            )
+            # detached copies, so the cached rules are not expired by later commits
+            return [
+                CompiledExtractionRule(ExtractionRule(**rule.dict())) for rule in rules
+            ]
+
+        return extraction_rules_cache.get_or_set(
+            self.tenant_id, ("rules", pre), get_compiled_rules
+        )
+
+    def _run_compiled_extraction_rules(
+        self,
+        event: AlertDto | dict,
+        pre: bool,
+        compiled_rules: list[CompiledExtractionRule],
+    ) -> AlertDto | dict:
         fingerprint = (
             event.get("fingerprint")
             if isinstance(event, dict)
@@ -157,16 +527,8 @@ class EnrichmentsBl:
                 "pre": pre,
             },
         )
-        rules: list[ExtractionRule] = rules or (
-            self.db_session.query(ExtractionRule)
-            .filter(ExtractionRule.tenant_id == self.tenant_id)
-            .filter(ExtractionRule.disabled == False)
-            .filter(ExtractionRule.pre == pre)
-            .order_by(ExtractionRule.priority.desc())
-            .all()
-        )
 
-        if not rules:
+        if not compiled_rules:
             self._add_enrichment_log(
                 f"No extraction rules found (pre: {pre})",
                 "debug",
@@ -187,16 +549,11 @@ class EnrichmentsBl:
             is_alert_dto = True
             event = json.loads(json.dumps(event.dict(), default=str))
 
-        for rule in rules:
-            attribute = rule.attribute
-            if (
-                attribute.startswith("{{") is False
-                and attribute.endswith("}}") is False
-            ):
-                # Wrap the attribute in {{ }} to make it a valid chevron template
-                attribute = f"{{{{ {attribute} }}}}"
-            attribute_value = chevron.render(attribute, event)
-            attribute_value = html.unescape(attribute_value)
+        # the CEL activation is only rebuilt after the event was enriched
+        activation = None
+        for compiled_rule in compiled_rules:
+            rule = compiled_rule.rule
+            attribute_value = compiled_rule.render(event)
 
             if not attribute_value:
                 self._add_enrichment_log(
@@ -213,7 +570,7 @@ class EnrichmentsBl:
                 )
                 continue
 
-            if rule.condition is None or rule.condition == "*" or rule.condition == "":
+            if not compiled_rule.has_condition:
                 self._add_enrichment_log(
                     f"No condition specified for rule {rule.name}, enriching...",
                     "info",
@@ -224,11 +581,9 @@ class EnrichmentsBl:
                     },
                 )
             else:
-                env = celpy.Environment()
-                ast = env.compile(rule.condition)
-                prgm = env.program(ast)
-                activation = celpy.json_to_cel(event)
-                relevant = prgm.evaluate(activation)
+                if activation is None:
+                    activation = celpy.json_to_cel(event)
+                relevant = compiled_rule.evaluate(activation)
                 if not relevant:
                     self._add_enrichment_log(
                         f"Condition did not match, skipping extraction for rule {rule.name} with condition {rule.condition}",
@@ -244,12 +599,13 @@ class EnrichmentsBl:
                     )
                     continue
 
-            match_result = re.search(rule.regex, attribute_value)
+            match_result = compiled_rule.search(attribute_value)
             if match_result:
                 match_dict = match_result.groupdict()
                 # we don't override source
                 match_dict.pop("source", None)
                 event.update(match_dict)
+                activation = None
                 self.enrich_entity(
                     fingerprint,
                     match_dict,
@@ -315,12 +671,10 @@ class EnrichmentsBl:
         )
 
         # Retrieve all active mapping rules for the current tenant, ordered by priority
-        rules: list[MappingRule] = (
-            self.db_session.query(MappingRule)
-            .filter(MappingRule.tenant_id == self.tenant_id)
-            .filter(MappingRule.disabled == False)
-            .order_by(MappingRule.priority.desc())
-            .all()
+        rules: list[tuple[MappingRule, MappingRuleIndex | None]] = (
+            mapping_rules_cache.get_or_set(
+                self.tenant_id, "rules", self._get_mapping_rules
+            )
         )
 
         if not rules:
@@ -332,12 +686,33 @@ class EnrichmentsBl:
             )
             return alert
 
-        for rule in rules:
-            self.check_if_match_and_enrich(alert, rule)
+        for rule, rule_index in rules:
+            self.check_if_match_and_enrich(alert, rule, rule_index)
 
         return alert
 
-    def check_if_match_and_enrich(self, alert: AlertDto, rule: MappingRule) -> bool:
+    def _get_mapping_rules(self) -> list[tuple[MappingRule, MappingRuleIndex | None]]:
+        rules: list[MappingRule] = (
+            self.db_session.query(MappingRule)
+            .filter(MappingRule.tenant_id == self.tenant_id)
+            .filter(MappingRule.disabled == False)
+            .order_by(MappingRule.priority.desc())
+            .all()
+        )
+        compiled_rules = []
+        for rule in rules:
+            # detached copy, so the cached rule is not expired by later commits
+            rule = MappingRule(**rule.dict())
+            rule_index = MappingRuleIndex(rule) if rule.type == "csv" else None
+            compiled_rules.append((rule, rule_index))
+        return compiled_rules
+
+    def check_if_match_and_enrich(
+        self,
+        alert: AlertDto,
+        rule: MappingRule,
+        rule_index: MappingRuleIndex | None = None,
+    ) -> bool:
         """
         Check if the alert matches the conditions specified in the mapping rule.
         If a match is found, enrich the alert and log the enrichment.
@@ -345,6 +720,7 @@ class EnrichmentsBl:
         Args:
         - alert (AlertDto): The incoming alert to be processed.
         - rule (MappingRule): The mapping rule to be checked against.
+        - rule_index (MappingRuleIndex, optional): The index of the rule rows, built if not given.
 
         Returns:
         - bool: True if alert matches the rule, False otherwise.
@@ -400,49 +776,46 @@ class EnrichmentsBl:
             for matcher in rule.matchers:
                 # [0] because topology is always 1 matcher
                 matcher_value[matcher[0]] = get_nested_attribute(alert, matcher[0])
-            topology_service = get_topology_data_by_dynamic_matcher(
-                self.tenant_id, matcher_value
-            )
+            # matched in memory, the index is rebuilt when the topology changes
+            topology_service_enrichments = get_topology_services_index(
+                self.tenant_id
+            ).get_service_enrichments(matcher_value)
 
-            if not topology_service:
+            if not topology_service_enrichments:
                 self._add_enrichment_log(
                     "No topology service found to match on",
                     "debug",
                     {"matcher_value": matcher_value},
                 )
             else:
-                enrichments = topology_service.dict(exclude_none=True)
-                # repository could be taken from application too
-                if not topology_service.repository and topology_service.applications:
-                    for application in topology_service.applications:
-                        if application.repository:
-                            enrichments["repository"] = application.repository
-                # Remove redundant fields
-                enrichments.pop("tenant_id", None)
-                enrichments.pop("id", None)
+                enrichments = topology_service_enrichments
         elif rule.type == "csv":
+            if rule_index is None:
+                rule_index = MappingRuleIndex(rule)
             if not rule.is_multi_level:
-                for row in rule.rows:
-                    if any(
-                        self._check_matcher(alert, row, matcher)
-                        for matcher in rule.matchers
-                    ):
-                        # Extract enrichments from the matched row
-                        enrichments = {}
-                        for key, value in row.items():
-                            if value is not None:
-                                is_matcher = False
-                                for matcher in rule.matchers:
-                                    if key in matcher:
-                                        is_matcher = True
-                                        break
-                                if not is_matcher:
-                                    # If the key has . (dot) in it, it'll be added as is while it needs to be nested.
-                                    # @tb: fix when somebody will be complaining about this.
-                                    if isinstance(value, str):
-                                        value = value.strip()
-                                    enrichments[key.strip()] = value
-                        break
+                row = rule_index.find_row(
+                    lambda attribute: get_nested_attribute(alert, attribute),
+                    on_error=lambda matcher: self._add_enrichment_log(
+                        "Error while checking matcher",
+                        "error",
+                        {"fingerprint": alert.fingerprint, "matcher": matcher},
+                    ),
+                )
+                if row is not None:
+                    # Extract enrichments from the matched row
+                    for key, value in row.items():
+                        if value is not None:
+                            is_matcher = False
+                            for matcher in rule.matchers:
+                                if key in matcher:
+                                    is_matcher = True
+                                    break
+                            if not is_matcher:
+                                # If the key has . (dot) in it, it'll be added as is while it needs to be nested.
+                                # @tb: fix when somebody will be complaining about this.
+                                if isinstance(value, str):
+                                    value = value.strip()
+                                enrichments[key.strip()] = value
             else:
                 # Multi-level mapping
                 # We can assume that the matcher is only a single key. i.e., [['customers']]
@@ -457,20 +830,19 @@ class EnrichmentsBl:
                     for matcher in matcher_values:
                         if rule.prefix_to_remove:
                             matcher = matcher.replace(rule.prefix_to_remove, "")
-                        for row in rule.rows:
-                            if self._check_explicit_match(row, key, matcher):
-                                if rule.new_property_name not in enrichments:
-                                    enrichments[rule.new_property_name] = {}
-
-                                if matcher not in enrichments[rule.new_property_name]:
-                                    enrichments[rule.new_property_name][matcher] = {}
-
-                                for enrichment_key, enrichment_value in row.items():
-                                    if enrichment_value is not None:
-                                        enrichments[rule.new_property_name][matcher][
-                                            enrichment_key.strip()
-                                        ] = enrichment_value.strip()
-                                break
+                        row = rule_index.find_explicit_row(matcher)
+                        if row is not None:
+                            if rule.new_property_name not in enrichments:
+                                enrichments[rule.new_property_name] = {}
+
+                            if matcher not in enrichments[rule.new_property_name]:
+                                enrichments[rule.new_property_name][matcher] = {}
+
+                            for enrichment_key, enrichment_value in row.items():
+                                if enrichment_value is not None:
+                                    enrichments[rule.new_property_name][matcher][
+                                        enrichment_key.strip()
+                                    ] = enrichment_value.strip()
         if enrichments:
             # Enrich the alert with the matched data from the row
             for key, matcher in enrichments.items():
@@ -865,20 +1237,11 @@ class EnrichmentsBl:
                 "no enrichments to dispose", extra={"fingerprint": fingerprint}
             )
             return
-        # Remove all disposable enrichments
-        new_enrichments = {}
-        disposed = False
-        for key, val in enrichments.enrichments.items():
-            if key.startswith("disposable_"):
-                disposed = True
-                continue
-            elif f"disposable_{key}" not in enrichments.enrichments:
-                new_enrichments[key] = val
-        # Only update the alert if there are disposable enrichments to dispose
-        disposed_keys = set(enrichments.enrichments.keys()) - set(
-            new_enrichments.keys()
+        new_enrichments, disposed_keys = self._without_disposable_enrichments(
+            enrichments.enrichments
         )
-        if disposed:
+        # Only update the alert if there are disposable enrichments to dispose
+        if disposed_keys:
             enrich_alert_db(
                 self.tenant_id,
                 fingerprint,
@@ -894,6 +1257,62 @@ class EnrichmentsBl:
                 "enrichments disposed", extra={"fingerprint": fingerprint}
             )
 
+    def dispose_enrichments_batch(
+        self, alert_enrichments: list[AlertEnrichment]
+    ) -> dict[str, dict]:
+        """
+        Dispose of enrichments for a batch of already fetched alert enrichments.
+
+        Unlike dispose_enrichments, this does not query nor commit: the enrichments
+        are updated on the (session attached) objects and audited in the session,
+        so they are written with the caller's next flush.
+
+        Returns:
+            dict[str, dict]: fingerprint -> enrichments left after disposal
+        """
+        remaining = {}
+        for alert_enrichment in alert_enrichments:
+            fingerprint = alert_enrichment.alert_fingerprint
+            new_enrichments, disposed_keys = self._without_disposable_enrichments(
+                alert_enrichment.enrichments or {}
+            )
+            remaining[fingerprint] = new_enrichments
+            if EnrichmentsBl.ENRICHMENT_DISABLED or not disposed_keys:
+                continue
+            alert_enrichment.enrichments = new_enrichments
+            self.db_session.add(alert_enrichment)
+            self.db_session.add(
+                AlertAudit(
+                    tenant_id=self.tenant_id,
+                    fingerprint=fingerprint,
+                    user_id="system",
+                    action=ActionType.DISPOSE_ENRICHED_ALERT.value,
+                    description=f"Disposing enrichments from alert - {disposed_keys}",
+                )
+            )
+            self.elastic_client.enrich_alert(fingerprint, new_enrichments)
+            self.logger.debug(
+                "enrichments disposed", extra={"fingerprint": fingerprint}
+            )
+        return remaining
+
+    @staticmethod
+    def _without_disposable_enrichments(enrichments: dict) -> tuple[dict, set]:
+        """
+        Remove the disposable enrichments, and the enrichments they shadow.
+
+        Returns:
+            tuple[dict, set]: the remaining enrichments and the disposed keys
+        """
+        new_enrichments = {}
+        for key, val in enrichments.items():
+            if key.startswith("disposable_"):
+                continue
+            elif f"disposable_{key}" not in enrichments:
+                new_enrichments[key] = val
+        disposed_keys = set(enrichments.keys()) - set(new_enrichments.keys())
+        return new_enrichments, disposed_keys
+
     def _track_enrichment_event(
         self,
         alert_id: UUID | None,
@@ -903,8 +1322,10 @@ class EnrichmentsBl:
         enriched_fields: dict,
     ) -> None:
         """
-        Track an enrichment event in the database
+        Track an enrichment event in the database, or in the buffer while the events
+        are buffered (see buffer_enrichment_events)
         """
+        self.enrichment_event_id = None
 
         if alert_id is None or not is_valid_uuid(alert_id):
             self.__logs = []
@@ -914,6 +1335,12 @@ class EnrichmentsBl:
             )
             return
 
+        logs, self.__logs = self.__logs, []
+        tracker = self.enrichment_events_tracker
+        # explicit rule runs are always tracked, their event is shown to the user
+        if tracker.buffering and not tracker.should_track(status):
+            return
+
         try:
             enrichment_event = EnrichmentEvent(
                 tenant_id=self.tenant_id,
@@ -923,17 +1350,18 @@ class EnrichmentsBl:
                 alert_id=alert_id,
                 enriched_fields=enriched_fields,
             )
-            self.db_session.add(enrichment_event)
-            self.db_session.flush()
-            if self.__logs:
-                for log in self.__logs:
-                    log.enrichment_event_id = enrichment_event.id
+            for log in logs:
+                log.enrichment_event_id = enrichment_event.id
+            if tracker.buffering:
+                tracker.add(enrichment_event, logs)
+            else:
+                self.db_session.add(enrichment_event)
+                self.db_session.flush()
+                for log in logs:
                     self.db_session.add(log)
-            self.db_session.commit()
-            self.__logs = []
+                self.db_session.commit()
             self.enrichment_event_id = enrichment_event.id
         except Exception:
-            self.__logs = []
             self.logger.exception(
                 "Failed to track enrichment event",
                 extra={
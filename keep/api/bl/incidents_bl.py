@@ -31,7 +31,7 @@ from keep.api.core.db import (
     update_incident_severity,
 )
 from keep.api.core.elastic import ElasticClient
-from keep.api.core.incidents import get_last_incidents_by_cel
+from keep.api.core.incidents import get_last_incidents_page_by_cel
 from keep.api.models.action_type import ActionType
 from keep.api.models.db.incident import Incident, IncidentSeverity, IncidentStatus
 from keep.api.models.db.rule import ResolveOn
@@ -406,8 +406,14 @@ class IncidentBl:
         is_predicted: bool = None,
         cel: str = None,
         allowed_incident_ids: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
     ):
-        incidents, total_count = get_last_incidents_by_cel(
+        (
+            incidents,
+            total_count,
+            next_cursor,
+            count_strategy,
+        ) = get_last_incidents_page_by_cel(
             tenant_id=tenant_id,
             limit=limit,
             offset=offset,
@@ -420,13 +426,19 @@ class IncidentBl:
             is_predicted=is_predicted,
             cel=cel,
             allowed_incident_ids=allowed_incident_ids,
+            cursor=cursor,
         )
         incidents_dto = []
         for incident in incidents:
             incidents_dto.append(IncidentDto.from_db_incident(incident))
 
         return IncidentsPaginatedResultsDto(
-            limit=limit, offset=offset, count=total_count, items=incidents_dto
+            limit=limit,
+            offset=offset,
+            count=total_count,
+            items=incidents_dto,
+            next_cursor=next_cursor,
+            count_strategy=count_strategy.value,
         )
 
     def resolve_incident_if_require(
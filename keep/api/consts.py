@@ -9,6 +9,10 @@ RUNNING_IN_CLOUD_RUN = os.environ.get("K_SERVICE") is not None
 PROVIDER_PULL_INTERVAL_MINUTE = int(
     os.environ.get("KEEP_PULL_INTERVAL", 10080)
 )  # maximum once a week
+# pull the providers with the providers pull scheduler instead of on the alerts reads
+KEEP_PULL_SCHEDULER_ENABLED = (
+    os.environ.get("KEEP_PULL_SCHEDULER", "true").lower() == "true"
+)
 STATIC_PRESETS = {
     "feed": PresetDto(
         id=StaticPresetsId.FEED_PRESET_ID.value,
@@ -2,25 +2,36 @@ import datetime
 import json
 import logging
 import os
-from typing import Tuple
+from typing import Optional, Tuple
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.exc import OperationalError
 from sqlmodel import Session, text
 
+from keep.api.core.cache import TenantCache
 from keep.api.core.cel_to_sql.ast_nodes import DataType
 from keep.api.core.cel_to_sql.properties_metadata import (
     FieldMappingConfiguration,
     PropertiesMetadata,
     PropertyMetadataInfo,
+    SimpleFieldMapping,
 )
 from keep.api.core.cel_to_sql.sql_providers.get_cel_to_sql_provider_for_dialect import (
     get_cel_to_sql_provider,
 )
+from keep.api.core.cursor import (
+    InvalidCursorException,
+    decode_cursor,
+    encode_cursor,
+    get_cursor_values,
+    get_keyset_columns,
+    keyset_condition,
+)
 from keep.api.core.db import engine
 
 # This import is required to create the tables
 from keep.api.core.facets import get_facet_options, get_facets
+from keep.api.core.query_count import CountStrategy, get_total_count
 from keep.api.models.alert import AlertSeverity, AlertStatus
 from keep.api.models.db.alert import (
     Alert,
@@ -39,6 +50,15 @@ logger = logging.getLogger(__name__)
 
 alerts_hard_limit = int(os.environ.get("KEEP_LAST_ALERTS_LIMIT", 50000))
 
+# facet options per (facet id, cel, facet cel), dropped in every process when alerts
+# of the tenant are processed and expiring anyway to catch up with enrichments
+alert_facets_cache = TenantCache(
+    "alert_facets",
+    max_size=int(os.environ.get("KEEP_ALERT_FACETS_CACHE_SIZE", 4096)),
+    ttl=int(os.environ.get("KEEP_ALERT_FACETS_CACHE_TTL", 30)),
+    broadcast_invalidations=True,
+)
+
 alert_field_configurations = [
     FieldMappingConfiguration(
         map_from_pattern="id", map_to="lastalert.alert_id", data_type=DataType.UUID
@@ -88,12 +108,11 @@ alert_field_configurations = [
         ],
         data_type=DataType.STRING,
     ),
+    # severity, status and lastReceived are materialized on lastalert (effective
+    #   values after enrichment) so filtering on them can use its indexes
     FieldMappingConfiguration(
         map_from_pattern="severity",
-        map_to=[
-            "JSON(alertenrichment.enrichments).*",
-            "JSON(alert.event).*",
-        ],
+        map_to="lastalert.severity",
         enum_values=[
             severity.value
             for severity in sorted(
@@ -105,18 +124,12 @@ alert_field_configurations = [
     ),
     FieldMappingConfiguration(
         map_from_pattern="lastReceived",
-        map_to=[
-            "JSON(alertenrichment.enrichments).*",
-            "JSON(alert.event).*",
-        ],
+        map_to="lastalert.last_received",
         data_type=DataType.DATETIME,
     ),
     FieldMappingConfiguration(
         map_from_pattern="status",
-        map_to=[
-            "JSON(alertenrichment.enrichments).*",
-            "JSON(alert.event).*",
-        ],
+        map_to="lastalert.status",
         enum_values=list(reversed([item.value for _, item in enumerate(AlertStatus)])),
         data_type=DataType.STRING,
     ),
@@ -209,6 +222,13 @@ static_facets = [
 ]
 static_facets_dict = {facet.id: facet for facet in static_facets}
 
+# sort fields that can be paginated with a seek predicate (non nullable columns)
+keyset_columns_mapping = {
+    "lastalert.timestamp": LastAlert.timestamp,
+    "lastalert.first_timestamp": LastAlert.first_timestamp,
+    "lastalert.fingerprint": LastAlert.fingerprint,
+}
+
 
 def get_threeshold_query(tenant_id: str):
     return func.coalesce(
@@ -223,6 +243,18 @@ def get_threeshold_query(tenant_id: str):
     )
 
 
+def _needs_alerts_data(involved_fields: list[PropertyMetadataInfo]) -> bool:
+    """Whether filtering on the fields needs the alert and alertenrichment joins."""
+    return any(
+        not (
+            isinstance(mapping, SimpleFieldMapping)
+            and mapping.map_to.startswith(("lastalert.", "incident."))
+        )
+        for field in involved_fields
+        for mapping in field.field_mappings
+    )
+
+
 def __build_query_for_filtering(
     tenant_id: str,
     select_args: list,
@@ -231,6 +263,7 @@ def __build_query_for_filtering(
     fetch_alerts_data=True,
     fetch_incidents=False,
     force_fetch=False,
+    threshold=None,
 ):
     fetch_incidents = fetch_incidents or (cel and "incident." in cel)
     cel_to_sql_instance = get_cel_to_sql_provider(properties_metadata)
@@ -249,6 +282,7 @@ def __build_query_for_filtering(
             ),
             False,
         )
+        fetch_alerts_data = fetch_alerts_data or _needs_alerts_data(involved_fields)
 
     sql_query = select(*select_args).select_from(LastAlert)
 
@@ -282,8 +316,10 @@ def __build_query_for_filtering(
             ),
         )
 
+    if threshold is None:
+        threshold = get_threeshold_query(tenant_id)
     sql_query = sql_query.filter(LastAlert.tenant_id == tenant_id).filter(
-        LastAlert.timestamp >= get_threeshold_query(tenant_id)
+        LastAlert.timestamp >= threshold
     )
     involved_fields = []
 
@@ -296,27 +332,43 @@ def __build_query_for_filtering(
     }
 
 
-def build_total_alerts_query(tenant_id, query: QueryDto):
+def build_total_alerts_query(tenant_id, query: QueryDto, threshold=None):
     fetch_incidents = query.cel and "incident." in query.cel
-    fetch_alerts_data = query.cel is not None or query.cel != ""
 
     count_funct = (
         func.count(func.distinct(LastAlert.alert_id))
         if fetch_incidents
         else func.count(1)
     )
+    return build_filtered_alerts_query(
+        tenant_id, query, threshold=threshold, select_args=[count_funct]
+    )
+
+
+def build_filtered_alerts_query(
+    tenant_id, query: QueryDto, threshold=None, select_args=None
+):
+    """Select (by default the alert ids of) the alerts matching the query cel."""
     built_query_result = __build_query_for_filtering(
         tenant_id=tenant_id,
         cel=query.cel,
-        select_args=[count_funct],
+        select_args=select_args or [LastAlert.alert_id],
         limit=query.limit,
-        fetch_alerts_data=fetch_alerts_data,
+        # the alert and alertenrichment joins are added only if the cel needs them
+        fetch_alerts_data=False,
+        threshold=threshold,
     )
 
     return built_query_result["query"]
 
 
-def build_alerts_query(tenant_id, query: QueryDto):
+def build_alerts_query(
+    tenant_id,
+    query: QueryDto,
+    threshold=None,
+    keyset_columns: Optional[list[tuple]] = None,
+    cursor_values: Optional[list] = None,
+):
     cel_to_sql_instance = get_cel_to_sql_provider(properties_metadata)
     sort_by_exp = cel_to_sql_instance.get_order_by_expression(
         [
@@ -329,22 +381,38 @@ def build_alerts_query(tenant_id, query: QueryDto):
         for sort_option in query.sort_options
     ]
 
+    select_args = [
+        Alert,
+        AlertEnrichment,
+        LastAlert.first_timestamp.label("startedAt"),
+    ] + distinct_columns
+    if keyset_columns:
+        # the sort keys of the last row are used to build the next cursor
+        select_args += [
+            column.label(f"keyset_{i}") for i, (column, _) in enumerate(keyset_columns)
+        ]
+
     built_query_result = __build_query_for_filtering(
         tenant_id,
-        select_args=[
-            Alert,
-            AlertEnrichment,
-            LastAlert.first_timestamp.label("startedAt"),
-        ]
-        + distinct_columns,
+        select_args=select_args,
         cel=query.cel,
+        threshold=threshold,
     )
     sql_query = built_query_result["query"]
     fetch_incidents = built_query_result["fetch_incidents"]
     sql_query = sql_query.order_by(text(sort_by_exp))
+    unique_column = Alert.id
+
+    if keyset_columns:
+        unique_column, direction = keyset_columns[-1]
+        sql_query = sql_query.order_by(
+            unique_column.desc() if direction == "desc" else unique_column.asc()
+        )
+        if cursor_values:
+            sql_query = sql_query.where(keyset_condition(keyset_columns, cursor_values))
 
     if fetch_incidents:
-        sql_query = sql_query.distinct(*(distinct_columns + [Alert.id]))
+        sql_query = sql_query.distinct(*(distinct_columns + [unique_column]))
 
     if query.limit is not None:
         sql_query = sql_query.limit(query.limit)
@@ -356,6 +424,26 @@ def build_alerts_query(tenant_id, query: QueryDto):
 
 
 def query_last_alerts(tenant_id, query: QueryDto) -> Tuple[list[Alert], int]:
+    alerts, total_count, _, _ = query_last_alerts_page(tenant_id, query)
+    return alerts, total_count
+
+
+def query_last_alerts_page(
+    tenant_id, query: QueryDto
+) -> Tuple[list[Alert], int, Optional[str], CountStrategy]:
+    """
+    Same as query_last_alerts, with the cursor of the next page if query.cursor is set
+    and the strategy that produced the total count (see KEEP_QUERY_COUNT_STRATEGY).
+
+    In cursor mode, sorting on non nullable lastalert columns (the default sorting
+    by timestamp) is paginated with a seek predicate on the sort keys and the alert
+    id, other sort fields fall back to an offset kept in the cursor. The threshold
+    of the alerts hard limit is computed on every page, never read from the cursor.
+
+    Raises:
+        InvalidCursorException: if the cursor is malformed or doesn't match the
+            sort options.
+    """
     query_with_defaults = query.copy()
 
     # Shahar: this happens when the frontend query builder fails to build a query
@@ -378,18 +466,60 @@ def query_last_alerts(tenant_id, query: QueryDto) -> Tuple[list[Alert], int]:
             SortOptionsDto(sort_by="timestamp", sort_dir="desc")
         ]
 
+    cursor = None
+    keyset_columns = None
+    cursor_values = None
+    sort = [
+        [sort_option.sort_by, sort_option.sort_dir]
+        for sort_option in query_with_defaults.sort_options
+    ]
+    if query_with_defaults.cursor is not None:
+        cursor = (
+            decode_cursor(query_with_defaults.cursor)
+            if query_with_defaults.cursor
+            else {}
+        )
+        if cursor and cursor.get("sort") != sort:
+            raise InvalidCursorException(
+                "The cursor doesn't match the sort options of the query"
+            )
+        keyset_columns = get_keyset_columns(
+            properties_metadata,
+            sort,
+            keyset_columns_mapping,
+            LastAlert.alert_id,
+        )
+        if keyset_columns:
+            query_with_defaults.offset = 0
+            if cursor:
+                cursor_values = get_cursor_values(cursor, keyset_columns)
+        else:
+            query_with_defaults.offset = cursor.get("offset", 0)
+
     with Session(engine) as session:
         try:
-            total_count_query = build_total_alerts_query(
-                tenant_id=tenant_id, query=query_with_defaults
+            threshold = None
+            if cursor is not None:
+                threshold_query = select(get_threeshold_query(tenant_id))
+                threshold = session.exec(threshold_query).one()[0]
+
+            total_count, count_strategy = get_total_count(
+                session,
+                tenant_id,
+                ("alerts", query_with_defaults.cel or "", threshold),
+                lambda: build_total_alerts_query(
+                    tenant_id=tenant_id, query=query_with_defaults, threshold=threshold
+                ),
+                build_rows_query=lambda: build_filtered_alerts_query(
+                    tenant_id, query_with_defaults, threshold=threshold
+                ),
             )
-            total_count = session.exec(total_count_query).one()[0]
 
             if not query_with_defaults.limit:
-                return [], total_count
+                return [], total_count, None, count_strategy
 
             if query_with_defaults.offset >= alerts_hard_limit:
-                return [], total_count
+                return [], total_count, None, count_strategy
 
             if (
                 query_with_defaults.offset + query_with_defaults.limit
@@ -399,13 +529,41 @@ def query_last_alerts(tenant_id, query: QueryDto) -> Tuple[list[Alert], int]:
                     alerts_hard_limit - query_with_defaults.offset
                 )
 
-            data_query = build_alerts_query(tenant_id, query_with_defaults)
+            data_query = build_alerts_query(
+                tenant_id,
+                query_with_defaults,
+                threshold=threshold,
+                keyset_columns=keyset_columns,
+                cursor_values=cursor_values,
+            )
             alerts_with_start = session.execute(data_query).all()
         except OperationalError as e:
             logger.warning(
                 f"Failed to query alerts for query object '{json.dumps(query_with_defaults.dict(exclude_unset=True))}': {e}"
             )
-            return [], 0
+            return [], 0, None, CountStrategy.EXACT
+
+        # a full page means there may be a next one
+        next_cursor = None
+        page_size = query_with_defaults.limit
+        if cursor is not None and len(alerts_with_start) == page_size:
+            if keyset_columns:
+                last_row = alerts_with_start[-1]._mapping
+                next_cursor = encode_cursor(
+                    {
+                        "sort": sort,
+                        "values": [
+                            last_row[f"keyset_{i}"] for i in range(len(keyset_columns))
+                        ],
+                    }
+                )
+            elif query_with_defaults.offset + page_size < alerts_hard_limit:
+                next_cursor = encode_cursor(
+                    {
+                        "sort": sort,
+                        "offset": query_with_defaults.offset + page_size,
+                    }
+                )
 
         # Process results based on dialect
         alerts = []
@@ -419,7 +577,7 @@ def query_last_alerts(tenant_id, query: QueryDto) -> Tuple[list[Alert], int]:
             alert.event["event_id"] = str(alert.id)
             alerts.append(alert)
 
-        return alerts, total_count
+        return alerts, total_count, next_cursor, count_strategy
 
 
 def get_alert_facets_data(
@@ -447,13 +605,51 @@ def get_alert_facets_data(
             fetch_incidents=fetch_incidents,
         )["query"]
 
-    return get_facet_options(
-        base_query_factory=base_query_factory,
-        entity_id_column=LastAlert.alert_id,
-        facets=facets,
-        facet_options_query=facet_options_query,
-        properties_metadata=properties_metadata,
-    )
+    cel = facet_options_query.cel if facet_options_query else None
+    facet_queries = (
+        facet_options_query.facet_queries if facet_options_query else None
+    ) or {}
+    facets_by_id = {facet.id: facet for facet in facets}
+
+    def load_facet_options(facet_ids: list[str]) -> dict[str, list[FacetOptionDto]]:
+        # a single query for all the facets missing in the cache
+        return get_facet_options(
+            base_query_factory=base_query_factory,
+            entity_id_column=LastAlert.alert_id,
+            facets=[facets_by_id[facet_id] for facet_id in facet_ids],
+            facet_options_query=(
+                FacetOptionsQueryDto(
+                    cel=cel,
+                    facet_queries={
+                        facet_id: facet_queries[facet_id]
+                        for facet_id in facet_ids
+                        if facet_id in facet_queries
+                    },
+                )
+                if facet_queries
+                else facet_options_query
+            ),
+            properties_metadata=properties_metadata,
+            raise_on_error=True,
+        )
+
+    try:
+        facet_options = alert_facets_cache.get_or_set_many(
+            tenant_id,
+            {
+                facet_id: (facet_id, cel, facet_queries.get(facet_id))
+                for facet_id in facets_by_id
+            },
+            load_facet_options,
+        )
+    except OperationalError:
+        # empty options of a failed load aren't cached, the next request retries
+        return {facet_id: [] for facet_id in facets_by_id}
+    return {facet_id: facet_options[facet_id] for facet_id in facets_by_id}
+
+
+def invalidate_alert_facets_cache(tenant_id: str):
+    alert_facets_cache.invalidate(tenant_id)
 
 
 def get_alert_facets(
@@ -0,0 +1,267 @@
+"""
+Small in-process caches used on the event processing hot path.
+
+Every cache is partitioned by tenant so that CRUD routes can drop the
+entries of a single tenant without affecting the others. With Redis, the
+invalidations of the caches written by other processes than the ones reading
+them (e.g. the API and the arq workers) are published to every process.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from keep.api.consts import REDIS
+from keep.api.core.metrics import cache_hits_total, cache_misses_total
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "keep:tenant-caches:invalidate"
+
+_MISSING = object()
+
+# all the caches created in this process, used by clear_all_caches()
+_registry: list["TenantCache"] = []
+_registry_lock = threading.Lock()
+_subscriber_started = False
+
+
+class TenantCache:
+    """Thread-safe, bounded LRU cache keyed by (tenant_id, key) with an optional TTL.
+
+    Args:
+        name (str): name of the cache, used as the `cache` label of the hit/miss metrics.
+        max_size (int): maximum number of entries (across all tenants) before the least recently used is evicted.
+        ttl (float, optional): seconds after which an entry expires. None means entries never expire.
+        broadcast_invalidations (bool): with Redis, also invalidate the tenant in the other processes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        broadcast_invalidations: bool = False,
+    ):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.broadcast_invalidations = broadcast_invalidations
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+        # keys being computed by get_or_set_many, and a counter per tenant bumped
+        # on invalidation so values computed before it are not stored
+        self._in_flight: dict[tuple[str, Hashable], threading.Event] = {}
+        self._generations: dict[str, int] = {}
+        with _registry_lock:
+            _registry.append(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, tenant_id: str, key: Hashable) -> Any:
+        if self.broadcast_invalidations:
+            _start_invalidation_subscriber()
+        cache_key = (tenant_id, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(cache_key)
+                    self.hits += 1
+                    cache_hits_total.labels(cache=self.name).inc()
+                    return value
+                del self._entries[cache_key]
+            self.misses += 1
+        cache_misses_total.labels(cache=self.name).inc()
+        return _MISSING
+
+    def get(self, tenant_id: str, key: Hashable, default: Any = None) -> Any:
+        value = self._lookup(tenant_id, key)
+        return default if value is _MISSING else value
+
+    def set(
+        self, tenant_id: str, key: Hashable, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[(tenant_id, key)] = (expires_at, value)
+            self._entries.move_to_end((tenant_id, key))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_set(
+        self, tenant_id: str, key: Hashable, factory: Callable[[], Any]
+    ) -> Any:
+        """Return the cached value, computing and storing it with `factory` on a miss."""
+        value = self._lookup(tenant_id, key)
+        if value is _MISSING:
+            value = factory()
+            self.set(tenant_id, key, value)
+        return value
+
+    def get_or_set_many(
+        self,
+        tenant_id: str,
+        keys: dict[Hashable, Hashable],
+        factory: Callable[[list[Hashable]], dict[Hashable, Any]],
+    ) -> dict[Hashable, Any]:
+        """Return the values of `keys` ({item id: cache key}), computing the missing ones
+        with a single `factory(missing item ids) -> {item id: value}` call.
+
+        Concurrent calls missing the same key wait for the call computing it instead of
+        computing it again.
+        """
+        results = {}
+        to_compute: dict[Hashable, Hashable] = {}
+        to_wait: dict[Hashable, tuple[Hashable, threading.Event]] = {}
+        for item_id, key in keys.items():
+            value = self._lookup(tenant_id, key)
+            if value is not _MISSING:
+                results[item_id] = value
+                continue
+            with self._lock:
+                event = self._in_flight.get((tenant_id, key))
+                if event is None:
+                    self._in_flight[(tenant_id, key)] = threading.Event()
+                    to_compute[item_id] = key
+                else:
+                    to_wait[item_id] = (key, event)
+
+        if to_compute:
+            generation = self._generations.get(tenant_id, 0)
+            try:
+                computed = factory(list(to_compute))
+                with self._lock:
+                    if self._generations.get(tenant_id, 0) == generation:
+                        for item_id, key in to_compute.items():
+                            if item_id in computed:
+                                self.set(tenant_id, key, computed[item_id])
+                results.update(computed)
+            finally:
+                with self._lock:
+                    for key in to_compute.values():
+                        self._in_flight.pop((tenant_id, key)).set()
+
+        not_computed = []
+        for item_id, (key, event) in to_wait.items():
+            event.wait()
+            with self._lock:
+                entry = self._entries.get((tenant_id, key))
+            if entry is None:
+                # the other call failed or was invalidated meanwhile
+                not_computed.append(item_id)
+            else:
+                results[item_id] = entry[1]
+        if not_computed:
+            results.update(factory(not_computed))
+        return results
+
+    def invalidate(self, tenant_id: str, key: Hashable = _MISSING) -> None:
+        """Drop a single key of a tenant, or all of its keys if no key is given.
+
+        With broadcast_invalidations, the other processes drop all the keys of the tenant.
+        """
+        self._invalidate_locally(tenant_id, key)
+        if self.broadcast_invalidations:
+            _publish_invalidation(self.name, tenant_id)
+
+    def _invalidate_locally(self, tenant_id: str, key: Hashable = _MISSING) -> None:
+        with self._lock:
+            self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+            if key is not _MISSING:
+                self._entries.pop((tenant_id, key), None)
+                return
+            for cache_key in [k for k in self._entries if k[0] == tenant_id]:
+                del self._entries[cache_key]
+        logger.debug(
+            "Tenant cache invalidated",
+            extra={"cache": self.name, "tenant_id": tenant_id},
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def clear_all_caches() -> None:
+    """Clear every TenantCache of this process (used by tests and on tenant teardown)."""
+    with _registry_lock:
+        caches = list(_registry)
+    for cache in caches:
+        cache.clear()
+
+
+def _publish_invalidation(cache_name: str, tenant_id: str):
+    if not REDIS:
+        return
+    try:
+        from keep.api.redis_settings import get_redis_client
+
+        get_redis_client().publish(
+            INVALIDATION_CHANNEL,
+            json.dumps({"cache": cache_name, "tenant_id": tenant_id}),
+        )
+    except Exception:
+        logger.exception(
+            "Failed to publish tenant cache invalidation, other processes will "
+            "catch up when the cached entries expire",
+            extra={"cache": cache_name, "tenant_id": tenant_id},
+        )
+
+
+def handle_invalidation(message: dict):
+    """Invalidate the tenant in the caches of this process named in the message."""
+    with _registry_lock:
+        caches = [cache for cache in _registry if cache.name == message.get("cache")]
+    for cache in caches:
+        cache._invalidate_locally(message["tenant_id"])
+
+
+def _start_invalidation_subscriber():
+    global _subscriber_started
+    if not REDIS or _subscriber_started:
+        return
+    with _registry_lock:
+        if _subscriber_started:
+            return
+        threading.Thread(
+            target=_listen_for_invalidations,
+            name="tenant-caches-invalidation",
+            daemon=True,
+        ).start()
+        _subscriber_started = True
+
+
+def _listen_for_invalidations():
+    from keep.api.redis_settings import get_redis_client
+
+    while True:
+        try:
+            pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            # invalidations may have been missed while not subscribed
+            with _registry_lock:
+                caches = [cache for cache in _registry if cache.broadcast_invalidations]
+            for cache in caches:
+                cache.clear()
+            for message in pubsub.listen():
+                if message.get("type") == "message":
+                    handle_invalidation(json.loads(message["data"]))
+        except Exception:
+            logger.exception("Tenant caches invalidation subscriber failed, retrying")
+            time.sleep(5)
@@ -0,0 +1,173 @@
+"""
+Opaque cursors for keyset (seek) pagination.
+
+A cursor is the url-safe base64 of a small json payload, usually the sort keys
+of the last row of the page. The next page is then selected with a seek
+predicate on the sort columns instead of an OFFSET, so deep pages cost the same
+as the first one.
+
+Cursors come from the client and are not signed: they only carry the position of
+the page, and their content is validated before it is used in a query.
+"""
+
+import base64
+import binascii
+import datetime
+import json
+import operator
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+
+from keep.api.core.cel_to_sql.properties_metadata import (
+    PropertiesMetadata,
+    SimpleFieldMapping,
+)
+
+
+class InvalidCursorException(Exception):
+    pass
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "datetime" in value:
+            return datetime.datetime.fromisoformat(value["datetime"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+    return value
+
+
+def encode_cursor(payload: dict) -> str:
+    """Encode the payload, values (and items of "values") may be datetimes or UUIDs."""
+    payload = {
+        key: (
+            [_encode_value(item) for item in value]
+            if key == "values"
+            else _encode_value(value)
+        )
+        for key, value in payload.items()
+    }
+    data = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode a cursor built with encode_cursor.
+
+    Raises:
+        InvalidCursorException: if the cursor is malformed.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(payload, dict):
+            raise ValueError("cursor payload is not an object")
+        offset = payload.get("offset", 0)
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            raise ValueError("cursor offset is not a non negative integer")
+        if not isinstance(payload.get("values", []), list):
+            raise ValueError("cursor values are not a list")
+        return {
+            key: (
+                [_decode_value(item) for item in value]
+                if key == "values"
+                else _decode_value(value)
+            )
+            for key, value in payload.items()
+        }
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorException(f"Invalid cursor: {cursor}") from e
+
+
+def get_cursor_values(cursor: dict, columns: list[tuple[Any, str]]) -> list[Any]:
+    """Get the values of the cursor to seek after, checked against the keyset columns.
+
+    Raises:
+        InvalidCursorException: if the values don't match the columns.
+    """
+    values = cursor.get("values")
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursorException("The cursor doesn't match the sort options")
+    for (column, _), value in zip(columns, values):
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = (str, int, float)
+        if isinstance(value, bool) or not isinstance(value, python_type):
+            raise InvalidCursorException("The cursor doesn't match the sort options")
+    return values
+
+
+def keyset_condition(columns: list[tuple[Any, str]], values: list[Any]):
+    """
+    Build the seek predicate selecting the rows after `values` in the order of
+    `columns` ((column, "asc" | "desc") pairs, the last one must be unique).
+
+    The columns must not be nullable.
+    """
+    conditions = []
+    for i, (column, direction) in enumerate(columns):
+        compare = operator.lt if direction.lower() == "desc" else operator.gt
+        conditions.append(
+            and_(
+                *[
+                    previous_column == value
+                    for (previous_column, _), value in zip(columns[:i], values[:i])
+                ],
+                compare(column, values[i]),
+            )
+        )
+
+    # redundant bound on the first column alone, so its index can be used
+    first_column, first_direction = columns[0]
+    if first_direction.lower() == "desc":
+        bound = first_column <= values[0]
+    else:
+        bound = first_column >= values[0]
+    return and_(bound, or_(*conditions))
+
+
+def get_keyset_columns(
+    properties_metadata: PropertiesMetadata,
+    sort_options: list[tuple[str, str]],
+    columns_mapping: dict[str, Any],
+    unique_column: Any,
+) -> Optional[list[tuple[Any, str]]]:
+    """
+    Get the (column, direction) pairs to paginate the sort options with a seek
+    predicate, ending with the unique column as a tiebreaker.
+
+    Args:
+        properties_metadata (PropertiesMetadata): The metadata the sort fields map with.
+        sort_options (list[tuple[str, str]]): (sort_by, sort_dir) pairs.
+        columns_mapping (dict): Mapped field (e.g. "lastalert.timestamp") -> column,
+            only for the non nullable columns.
+        unique_column: The tiebreaker column.
+
+    Returns:
+        The columns, or None if a sort field is not one of columns_mapping.
+    """
+    columns = []
+    for sort_by, sort_dir in sort_options:
+        metadata = properties_metadata.get_property_metadata_for_str(sort_by)
+        mappings = metadata.field_mappings if metadata else []
+        if (
+            len(mappings) != 1
+            or not isinstance(mappings[0], SimpleFieldMapping)
+            or mappings[0].map_to not in columns_mapping
+        ):
+            return None
+        direction = "asc" if sort_dir.lower() == "asc" else "desc"
+        columns.append((columns_mapping[mappings[0].map_to], direction))
+
+    columns.append((unique_column, columns[-1][1] if columns else "desc"))
+    return columns
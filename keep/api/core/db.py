@@ -8,12 +8,13 @@ import hashlib
 import json
 import logging
 import random
+import threading
 import uuid
 from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from functools import wraps
-from typing import Any, Callable, Dict, Iterator, List, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Type, Union
 from uuid import UUID, uuid4
 
 from dateutil.parser import parse
@@ -46,6 +47,7 @@ from sqlalchemy.sql.functions import count
 from sqlmodel import Session, SQLModel, col, or_, select, text
 
 from keep.api.consts import STATIC_PRESETS
+from keep.api.core.cache import TenantCache
 from keep.api.core.config import config
 from keep.api.core.db_utils import (
     create_db_engine,
@@ -54,6 +56,7 @@ from keep.api.core.db_utils import (
     get_or_create,
 )
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
+from keep.api.core.query_count import invalidate_query_counts_cache
 
 # This import is required to create the tables
 from keep.api.models.action_type import ActionType
@@ -81,6 +84,7 @@ from keep.api.models.db.topology import *  # pylint: disable=unused-wildcard-imp
 from keep.api.models.db.workflow import *  # pylint: disable=unused-wildcard-import
 from keep.api.models.incident import IncidentDto, IncidentDtoIn, IncidentSorting
 from keep.api.models.time_stamp import TimeStampFilter
+from keep.api.utils.cel_utils import invalidate_cel_programs
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +110,18 @@ KEEP_AUDIT_EVENTS_ENABLED = config("KEEP_AUDIT_EVENTS_ENABLED", cast=bool, defau
 INTERVAL_WORKFLOWS_RELAUNCH_TIMEOUT = timedelta(minutes=60)
 WORKFLOWS_TIMEOUT = timedelta(minutes=120)
 
+# presets of a tenant, see get_all_presets_dtos_cached. invalidated by the preset
+# routes, the ttl bounds the staleness in the other processes (e.g. workers)
+presets_dtos_cache = TenantCache(
+    "presets_dtos", ttl=config("KEEP_PRESETS_CACHE_TTL", cast=int, default=60)
+)
+
+# (field_name, provider_id, provider_type) already upserted to AlertField, per
+# tenant, see upsert_new_alert_fields. warmed from the db on first use, the cached
+# frozensets are replaced (under the lock) once new fields are committed
+known_alert_fields_cache = TenantCache("known_alert_fields")
+_known_alert_fields_lock = threading.Lock()
+
 
 def dispose_session():
     logger.info("Disposing engine pool")
@@ -829,6 +845,25 @@ def get_all_workflows(tenant_id: str, exclude_disabled: bool = False) -> List[Wo
     return workflows
 
 
+def get_all_workflows_revisions(
+    tenant_id: str, exclude_disabled: bool = False
+) -> dict[str, int]:
+    """Same filter as get_all_workflows but only returns {workflow_id: revision}."""
+    with Session(engine) as session:
+        query = (
+            select(Workflow.id, Workflow.revision)
+            .where(Workflow.tenant_id == tenant_id)
+            .where(Workflow.is_deleted == False)
+            .where(Workflow.is_test == False)
+        )
+
+        if exclude_disabled:
+            query = query.where(Workflow.is_disabled == False)
+
+        revisions = session.exec(query).all()
+    return {workflow_id: revision for workflow_id, revision in revisions}
+
+
 def get_all_provisioned_workflows(tenant_id: str):
     with Session(engine) as session:
         workflows = session.exec(
@@ -960,6 +995,15 @@ def get_consumer_providers() -> List[Provider]:
     return providers
 
 
+def get_pulling_providers() -> List[Provider]:
+    # get all the providers of all the tenants with pulling enabled
+    with Session(engine) as session:
+        providers = session.exec(
+            select(Provider).where(Provider.pulling_enabled == True)
+        ).all()
+    return providers
+
+
 def finish_workflow_execution(tenant_id, workflow_id, execution_id, status, error):
     with Session(engine) as session:
         workflow_execution = session.exec(
@@ -1308,6 +1352,9 @@ def _enrich_entity(
             .values(enrichments=new_enrichment_data)
         )
         session.execute(stmt)
+        refresh_last_alerts_hot_fields(
+            session, tenant_id, {fingerprint: new_enrichment_data}
+        )
         if audit_enabled:
             # add audit event
             audit = AlertAudit(
@@ -1330,6 +1377,9 @@ def _enrich_entity(
                 enrichments=enrichments,
             )
             session.add(alert_enrichment)
+            refresh_last_alerts_hot_fields(
+                session, tenant_id, {fingerprint: enrichments}
+            )
             # add audit event
             if audit_enabled:
                 audit = AlertAudit(
@@ -1442,6 +1492,11 @@ def batch_enrich(
         if audit_entries:
             session.add_all(audit_entries)
 
+        refresh_last_alerts_hot_fields(
+            session,
+            tenant_id,
+            {fingerprint: enrichments for fingerprint in fingerprints},
+        )
         session.commit()
 
         # Get all updated/created enrichments
@@ -1556,16 +1611,17 @@ def get_enrichment_with_session(session, tenant_id, fingerprint, refresh=False):
 
 
 def get_enrichments(
-    tenant_id: int, fingerprints: List[str]
+    tenant_id: int, fingerprints: List[str], session: Optional[Session] = None
 ) -> List[Optional[AlertEnrichment]]:
     """
     Get a list of alert enrichments for a list of fingerprints using a single DB query.
 
     :param tenant_id: The tenant ID to filter the alert enrichments by.
     :param fingerprints: A list of fingerprints to get the alert enrichments for.
+    :param session: An optional session to run the query in.
     :return: A list of AlertEnrichment objects or None for each fingerprint.
     """
-    with Session(engine) as session:
+    with existed_or_new_session(session) as session:
         result = session.exec(
             select(AlertEnrichment)
             .where(AlertEnrichment.tenant_id == tenant_id)
@@ -2016,9 +2072,12 @@ def get_previous_alert_by_fingerprint(tenant_id: str, fingerprint: str) -> Alert
 
 
 def get_api_key(api_key: str) -> TenantApiKey:
+    return get_api_key_by_hash(hashlib.sha256(api_key.encode()).hexdigest())
+
+
+def get_api_key_by_hash(key_hash: str) -> TenantApiKey:
     with Session(engine) as session:
-        api_key_hashed = hashlib.sha256(api_key.encode()).hexdigest()
-        statement = select(TenantApiKey).where(TenantApiKey.key_hash == api_key_hashed)
+        statement = select(TenantApiKey).where(TenantApiKey.key_hash == key_hash)
         tenant_api_key = session.exec(statement).first()
     return tenant_api_key
 
@@ -2235,6 +2294,7 @@ def create_rule(
         session.add(rule)
         session.commit()
         session.refresh(rule)
+        invalidate_cel_programs(tenant_id)
         return rule
 
 
@@ -2287,6 +2347,7 @@ def update_rule(
             rule.assignee = assignee
             session.commit()
             session.refresh(rule)
+            invalidate_cel_programs(tenant_id)
             return rule
         else:
             return None
@@ -2338,6 +2399,7 @@ def delete_rule(tenant_id, rule_id):
         if rule and not rule.is_deleted:
             rule.is_deleted = True
             session.commit()
+            invalidate_cel_programs(tenant_id)
             return True
         return False
 
@@ -2409,6 +2471,7 @@ def create_incident_for_grouping_rule(
             incident.user_generated_name = f"{rule.incident_prefix}-{incident.running_number} - {incident.user_generated_name}"
         session.commit()
         session.refresh(incident)
+    invalidate_query_counts_cache(tenant_id)
     return incident
 
 
@@ -2704,6 +2767,45 @@ def create_deduplication_event(
         )
 
 
+def create_deduplication_events(tenant_id, deduplication_events: list[dict]):
+    """
+    Bulk version of create_deduplication_event, one commit for the whole batch.
+
+    Args:
+        deduplication_events (list[dict]): dicts with deduplication_rule_id,
+            deduplication_type, provider_id and provider_type.
+    """
+    now = datetime.now(tz=timezone.utc)
+    date_hour = now.replace(minute=0, second=0, microsecond=0)
+    events_to_add = []
+    for event in deduplication_events:
+        deduplication_rule_id = event["deduplication_rule_id"]
+        if isinstance(deduplication_rule_id, str):
+            deduplication_rule_id = __convert_to_uuid(deduplication_rule_id)
+            if not deduplication_rule_id:
+                continue
+        events_to_add.append(
+            AlertDeduplicationEvent(
+                tenant_id=tenant_id,
+                deduplication_rule_id=deduplication_rule_id,
+                deduplication_type=event["deduplication_type"],
+                provider_id=event["provider_id"],
+                provider_type=event["provider_type"],
+                timestamp=now,
+                date_hour=date_hour,
+            )
+        )
+    if not events_to_add:
+        return
+    with Session(engine) as session:
+        session.add_all(events_to_add)
+        session.commit()
+    logger.debug(
+        "Deduplication events added",
+        extra={"count": len(events_to_add), "tenant_id": tenant_id},
+    )
+
+
 def get_all_deduplication_stats(tenant_id):
     with Session(engine) as session:
         # Query to get all-time deduplication stats
@@ -3367,6 +3469,17 @@ def get_all_presets_dtos(tenant_id: str) -> List[PresetDto]:
     return [PresetDto(**preset.to_dict()) for preset in presets] + static_presets_dtos
 
 
+def get_all_presets_dtos_cached(tenant_id: str) -> List[PresetDto]:
+    """Same as get_all_presets_dtos, cached until the presets of the tenant change."""
+    return presets_dtos_cache.get_or_set(
+        tenant_id, "presets", lambda: get_all_presets_dtos(tenant_id)
+    )
+
+
+def invalidate_presets_cache(tenant_id: str):
+    presets_dtos_cache.invalidate(tenant_id)
+
+
 def get_dashboards(tenant_id: str, email=None) -> List[Dict[str, Any]]:
     with Session(engine) as session:
         statement = (
@@ -3829,30 +3942,44 @@ def enrich_incidents_with_alerts(
 def enrich_alerts_with_incidents(
     tenant_id: str, alerts: List[Alert], session: Optional[Session] = None
 ):
+    """
+    Set the incidents of each alert (alert._incidents) in two queries, whatever the
+    number of alerts: the links of the alerts, then each of their incidents once.
+    Alerts of the same incident share the same Incident instance.
+    """
+    if not alerts:
+        return alerts
+
     with existed_or_new_session(session) as session:
-        alert_incidents = session.exec(
-            select(LastAlertToIncident.fingerprint, Incident)
-            .select_from(LastAlert)
-            .join(
-                LastAlertToIncident,
-                and_(
-                    LastAlertToIncident.tenant_id == LastAlert.tenant_id,
-                    LastAlertToIncident.fingerprint == LastAlert.fingerprint,
-                    LastAlertToIncident.deleted_at == NULL_FOR_DELETED_AT,
-                ),
-            )
-            .join(Incident, LastAlertToIncident.incident_id == Incident.id)
-            .where(
-                LastAlert.tenant_id == tenant_id,
+        alert_incident_ids = session.exec(
+            select(
+                LastAlertToIncident.fingerprint, LastAlertToIncident.incident_id
+            ).where(
+                LastAlertToIncident.tenant_id == tenant_id,
+                LastAlertToIncident.deleted_at == NULL_FOR_DELETED_AT,
                 LastAlertToIncident.fingerprint.in_(
-                    [alert.fingerprint for alert in alerts]
+                    list({alert.fingerprint for alert in alerts})
                 ),
             )
         ).all()
 
+        incidents = {}
+        incident_ids = {incident_id for _, incident_id in alert_incident_ids}
+        if incident_ids:
+            incidents = {
+                incident.id: incident
+                for incident in session.exec(
+                    select(Incident).where(
+                        Incident.tenant_id == tenant_id,
+                        Incident.id.in_(list(incident_ids)),
+                    )
+                ).all()
+            }
+
         incidents_per_alert = defaultdict(list)
-        for fingerprint, incident in alert_incidents:
-            incidents_per_alert[fingerprint].append(incident)
+        for fingerprint, incident_id in alert_incident_ids:
+            if incident_id in incidents:
+                incidents_per_alert[fingerprint].append(incidents[incident_id])
 
         for alert in alerts:
             alert._incidents = incidents_per_alert[alert.fingerprint]
@@ -4076,6 +4203,7 @@ def create_incident_from_dict(
         session.add(new_incident)
         session.commit()
         session.refresh(new_incident)
+    invalidate_query_counts_cache(tenant_id)
     return new_incident
 
 
@@ -4166,7 +4294,8 @@ def delete_incident_by_id(
         )
 
         session.commit()
-        return True
+    invalidate_query_counts_cache(tenant_id)
+    return True
 
 
 def get_incidents_count(
@@ -4830,7 +4959,8 @@ def merge_incidents_to_id(
 
         session.commit()
         session.refresh(destination_incident)
-        return merged_incident_ids, failed_incident_ids
+    invalidate_query_counts_cache(tenant_id)
+    return merged_incident_ids, failed_incident_ids
 
 
 def get_alerts_count(
@@ -4894,7 +5024,8 @@ def confirm_predicted_incident_by_id(
         session.commit()
         session.refresh(incident)
 
-        return incident
+    invalidate_query_counts_cache(tenant_id)
+    return incident
 
 
 def get_tenant_config(tenant_id: str) -> dict:
@@ -4990,19 +5121,16 @@ def update_incident_severity(
         return incident
 
 
-def get_topology_data_by_dynamic_matcher(
-    tenant_id: str, matchers_value: dict[str, str]
-) -> TopologyService | None:
+def get_topology_services_with_applications(tenant_id: str) -> list[TopologyService]:
     with Session(engine) as session:
-        query = select(TopologyService).where(TopologyService.tenant_id == tenant_id)
-        for matcher in matchers_value:
-            query = query.where(
-                getattr(TopologyService, matcher) == matchers_value[matcher]
-            )
-        # Add joinedload for applications to avoid detached instance error
-        query = query.options(joinedload(TopologyService.applications))
-        service = session.exec(query).first()
-        return service
+        # load the applications to avoid detached instance error
+        query = (
+            select(TopologyService)
+            .where(TopologyService.tenant_id == tenant_id)
+            .options(subqueryload(TopologyService.applications))
+            .order_by(TopologyService.id)
+        )
+        return session.exec(query).all()
 
 
 def get_tags(tenant_id):
@@ -5065,6 +5193,68 @@ def bulk_upsert_alert_fields(
     session: Optional[Session] = None,
     max_retries=3,
 ):
+    _upsert_alert_fields(
+        tenant_id,
+        [(field, provider_id, provider_type) for field in fields],
+        session=session,
+        max_retries=max_retries,
+    )
+
+
+def upsert_new_alert_fields(
+    tenant_id: str,
+    fields: set[tuple[str, str, str]],
+    session: Optional[Session] = None,
+) -> int:
+    """
+    Upsert the (field_name, provider_id, provider_type) fields that were not
+    upserted yet, in a single statement.
+
+    The fields already upserted are kept in memory per tenant (warmed from
+    AlertField), so in the steady state this doesn't write anything.
+
+    Returns:
+        int: The number of upserted fields.
+
+    Raises:
+        OperationalError: if the fields couldn't be upserted, they are upserted
+            again on the next call.
+    """
+    new_fields = fields - _get_known_alert_fields(tenant_id)
+    if not new_fields:
+        return 0
+
+    _upsert_alert_fields(tenant_id, new_fields, session=session)
+    # only once committed
+    with _known_alert_fields_lock:
+        known_alert_fields_cache.set(
+            tenant_id, "fields", _get_known_alert_fields(tenant_id) | new_fields
+        )
+    return len(new_fields)
+
+
+def _get_known_alert_fields(tenant_id: str) -> frozenset[tuple[str, str, str]]:
+    return known_alert_fields_cache.get_or_set(
+        tenant_id,
+        "fields",
+        lambda: frozenset(
+            (field.field_name, field.provider_id, field.provider_type)
+            for field in get_alerts_fields(tenant_id)
+        ),
+    )
+
+
+def _upsert_alert_fields(
+    tenant_id: str,
+    fields: Iterable[tuple[str, str, str]],
+    session: Optional[Session] = None,
+    max_retries=3,
+):
+    # a field name can be upserted only once per statement, the last one wins
+    fields_by_name = {
+        field_name: (field_name, provider_id, provider_type)
+        for field_name, provider_id, provider_type in fields
+    }
     with existed_or_new_session(session) as session:
         for attempt in range(max_retries):
             try:
@@ -5076,7 +5266,7 @@ def bulk_upsert_alert_fields(
                         "provider_id": provider_id,
                         "provider_type": provider_type,
                     }
-                    for field in fields
+                    for field, provider_id, provider_type in fields_by_name.values()
                 ]
 
                 if engine.dialect.name == "postgresql":
@@ -5113,7 +5303,7 @@ def bulk_upsert_alert_fields(
                     # SQL Server requires a raw query with a MERGE statement
                     values = ", ".join(
                         f"('{tenant_id}', '{field}', '{provider_id}', '{provider_type}')"
-                        for field in fields
+                        for field, provider_id, provider_type in fields_by_name.values()
                     )
 
                     merge_query = text(
@@ -5149,7 +5339,7 @@ def bulk_upsert_alert_fields(
                     logger.info(
                         f"Deadlock found during bulk_upsert_alert_fields `{e}`, retry #{attempt}"
                     )
-                    if attempt >= max_retries:
+                    if attempt >= max_retries - 1:
                         raise e
                     continue
                 else:
@@ -5186,6 +5376,7 @@ def change_incident_status_by_id(
         )
         session.exec(stmt)
         session.commit()
+    invalidate_query_counts_cache(tenant_id)
 
 
 def get_workflow_executions_for_incident_or_alert(
@@ -5640,6 +5831,7 @@ def get_last_alerts_by_fingerprints(
     tenant_id: str,
     fingerprint: List[str],
     session: Optional[Session] = None,
+    for_update: bool = False,
 ) -> List[LastAlert]:
     with existed_or_new_session(session) as session:
         query = select(LastAlert).where(
@@ -5648,6 +5840,8 @@ def get_last_alerts_by_fingerprints(
                 LastAlert.fingerprint.in_(fingerprint),
             )
         )
+        if for_update:
+            query = query.with_for_update()
         return session.exec(query).all()
 
 
@@ -5669,6 +5863,52 @@ def get_last_alert_by_fingerprint(
         return session.exec(query).first()
 
 
+def _get_enrichments_dict(
+    session: Session, tenant_id: str, fingerprint: str
+) -> Optional[dict]:
+    alert_enrichment = get_enrichment_with_session(session, tenant_id, fingerprint)
+    return alert_enrichment.enrichments if alert_enrichment else None
+
+
+def _set_last_alert_hot_fields(
+    last_alert: LastAlert, event: dict, enrichments: Optional[dict]
+) -> None:
+    for field, value in get_last_alert_hot_fields(event, enrichments).items():
+        setattr(last_alert, field, value)
+
+
+def refresh_last_alerts_hot_fields(
+    session: Session, tenant_id: str, enrichments_by_fingerprint: dict[str, dict]
+) -> None:
+    """
+    Update the materialized hot fields (severity, status, last_received) of the
+    LastAlert rows of enriched fingerprints, in the caller's transaction.
+
+    Args:
+        session (Session): The session the enrichments are written in.
+        tenant_id (str): The tenant ID.
+        enrichments_by_fingerprint (dict[str, dict]): The new enrichments.
+    """
+    if not enrichments_by_fingerprint:
+        return
+    rows = session.exec(
+        select(LastAlert, Alert.event)
+        .join(
+            Alert,
+            and_(
+                Alert.id == LastAlert.alert_id, Alert.tenant_id == LastAlert.tenant_id
+            ),
+        )
+        .where(LastAlert.tenant_id == tenant_id)
+        .where(LastAlert.fingerprint.in_(list(enrichments_by_fingerprint)))
+    ).all()
+    for last_alert, event in rows:
+        _set_last_alert_hot_fields(
+            last_alert, event, enrichments_by_fingerprint[last_alert.fingerprint]
+        )
+        session.add(last_alert)
+
+
 def set_last_alert(
     tenant_id: str, alert: Alert, session: Optional[Session] = None, max_retries=3
 ) -> None:
@@ -5707,6 +5947,11 @@ def set_last_alert(
                     last_alert.timestamp = alert.timestamp
                     last_alert.alert_id = alert.id
                     last_alert.alert_hash = alert.alert_hash
+                    _set_last_alert_hot_fields(
+                        last_alert,
+                        alert.event,
+                        _get_enrichments_dict(session, tenant_id, fingerprint),
+                    )
                     session.add(last_alert)
 
                 elif not last_alert:
@@ -5719,6 +5964,11 @@ def set_last_alert(
                         alert_id=alert.id,
                         alert_hash=alert.alert_hash,
                     )
+                    _set_last_alert_hot_fields(
+                        last_alert,
+                        alert.event,
+                        _get_enrichments_dict(session, tenant_id, fingerprint),
+                    )
 
                 session.add(last_alert)
                 session.commit()
@@ -5763,6 +6013,99 @@ def set_last_alert(
             break
 
 
+def set_last_alerts(
+    tenant_id: str,
+    alerts: list[Alert],
+    session: Session,
+    last_alerts: Optional[list[LastAlert]] = None,
+) -> dict[str, LastAlert]:
+    """
+    Set-based version of set_last_alert for a batch of alerts.
+
+    The LastAlert rows of the batch are locked and read with a single query (unless
+    already fetched by the caller with for_update=True) and updated in memory, so the
+    inserts/updates are written in one flush. The caller is responsible for the commit.
+
+    Args:
+        tenant_id (str): The tenant ID.
+        alerts (list[Alert]): The new alerts, in the order they were received.
+        session (Session): The session the alerts were added to.
+        last_alerts (list[LastAlert], optional): LastAlert rows of the batch fingerprints.
+
+    Returns:
+        dict[str, LastAlert]: The LastAlert row of every fingerprint in the batch.
+    """
+    if last_alerts is None:
+        last_alerts = get_last_alerts_by_fingerprints(
+            tenant_id,
+            list({alert.fingerprint for alert in alerts}),
+            session=session,
+            for_update=True,
+        )
+    last_alerts_by_fingerprint = {
+        last_alert.fingerprint: last_alert for last_alert in last_alerts
+    }
+    # rows created or moved by this batch, a later alert of the batch always wins
+    #   even if it got the same (millisecond precision) timestamp
+    set_in_batch = set()
+    for alert in alerts:
+        fingerprint = alert.fingerprint
+        last_alert = last_alerts_by_fingerprint.get(fingerprint)
+        if not last_alert:
+            last_alert = LastAlert(
+                tenant_id=tenant_id,
+                fingerprint=fingerprint,
+                timestamp=alert.timestamp,
+                first_timestamp=alert.timestamp,
+                alert_id=alert.id,
+                alert_hash=alert.alert_hash,
+            )
+            last_alerts_by_fingerprint[fingerprint] = last_alert
+            session.add(last_alert)
+            set_in_batch.add(fingerprint)
+            continue
+
+        # same race condition protection as in set_last_alert
+        last_timestamp = last_alert.timestamp.replace(tzinfo=tz.UTC)
+        alert_timestamp = alert.timestamp.replace(tzinfo=tz.UTC)
+        if last_timestamp < alert_timestamp or (
+            fingerprint in set_in_batch and last_timestamp <= alert_timestamp
+        ):
+            last_alert.timestamp = alert.timestamp
+            last_alert.alert_id = alert.id
+            last_alert.alert_hash = alert.alert_hash
+            session.add(last_alert)
+            set_in_batch.add(fingerprint)
+
+    # materialized hot fields of the rows pointing to a new alert
+    if set_in_batch:
+        alerts_by_id = {alert.id: alert for alert in alerts}
+        enrichments_by_fingerprint = dict(
+            session.exec(
+                select(AlertEnrichment.alert_fingerprint, AlertEnrichment.enrichments)
+                .where(AlertEnrichment.tenant_id == tenant_id)
+                .where(AlertEnrichment.alert_fingerprint.in_(list(set_in_batch)))
+            ).all()
+        )
+        for fingerprint in set_in_batch:
+            last_alert = last_alerts_by_fingerprint[fingerprint]
+            _set_last_alert_hot_fields(
+                last_alert,
+                alerts_by_id[last_alert.alert_id].event,
+                enrichments_by_fingerprint.get(fingerprint),
+            )
+
+    logger.info(
+        "Set last alerts",
+        extra={
+            "tenant_id": tenant_id,
+            "num_of_alerts": len(alerts),
+            "num_of_last_alerts_set": len(set_in_batch),
+        },
+    )
+    return last_alerts_by_fingerprint
+
+
 def get_provider_logs(
     tenant_id: str, provider_id: str, limit: int = 100
 ) -> List[ProviderExecutionLog]:
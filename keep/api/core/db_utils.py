@@ -19,6 +19,7 @@ from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.ddl import CreateColumn
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from sqlalchemy.sql.functions import GenericFunction
 from sqlmodel import Session, SQLModel, create_engine, select
 
@@ -215,6 +216,64 @@ def _compile_json_table(element, compiler, **kw):
     )
 
 
+class explain(Executable, ClauseElement):
+    """EXPLAIN of a statement, with the plan as json (PostgreSQL and MySQL)."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(explain, "postgresql")
+def _compile_explain_postgresql(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+@compiles(explain, "mysql")
+def _compile_explain_mysql(element, compiler, **kw):
+    return "EXPLAIN FORMAT=JSON " + compiler.process(element.statement, **kw)
+
+
+def _get_mysql_plan_rows(query_block: dict) -> Optional[int]:
+    for operation in ("ordering_operation", "grouping_operation", "duplicates_removal"):
+        if operation in query_block:
+            return _get_mysql_plan_rows(query_block[operation])
+    if "nested_loop" in query_block:
+        # the rows produced by the last join are the rows of the result
+        table = query_block["nested_loop"][-1]["table"]
+    elif "table" in query_block:
+        table = query_block["table"]
+    else:
+        return None
+    return int(table["rows_produced_per_join"])
+
+
+def get_estimated_rows_count(session: Session, query) -> Optional[int]:
+    """
+    Get the planner estimate of the number of rows returned by a select.
+
+    Returns:
+        Optional[int]: The estimate, None if the dialect doesn't support it (e.g.
+            SQLite) or the plan couldn't be read.
+    """
+    dialect_name = session.bind.dialect.name
+    if dialect_name not in ("postgresql", "mysql"):
+        return None
+    try:
+        # savepoint, a failing EXPLAIN must not abort the caller's transaction
+        with session.begin_nested():
+            plan = session.connection().execute(explain(query)).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        if dialect_name == "postgresql":
+            return int(plan[0]["Plan"]["Plan Rows"])
+        return _get_mysql_plan_rows(plan["query_block"])
+    except Exception:
+        logger.warning("Failed to get the estimated rows count", exc_info=True)
+        return None
+
+
 T = TypeVar("T", bound=SQLModel)
 
 
@@ -1,16 +1,29 @@
+import atexit
 import logging
 import os
+import threading
+import time
+from collections import defaultdict
 
 from elasticsearch import ApiError, BadRequestError, Elasticsearch
 from elasticsearch.helpers import BulkIndexError, bulk
 
 from keep.api.core.db import get_enrichments
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
+from keep.api.core.metrics import (
+    elastic_buffer_depth,
+    elastic_index_failed_total,
+    elastic_indexed_total,
+)
 from keep.api.core.tenant_configuration import TenantConfiguration
 from keep.api.models.alert import AlertDto, AlertSeverity
 from keep.api.utils.cel_utils import preprocess_cel_expression
 from keep.api.utils.enrichment_helpers import parse_and_enrich_deleted_and_assignees
 
+ELASTIC_BULK_MAX_RETRIES = int(os.environ.get("ELASTIC_BULK_MAX_RETRIES", 3))
+# bulk items rejected with these statuses are retried (e.g. full write queue)
+ELASTIC_BULK_RETRYABLE_STATUSES = {429, 502, 503, 504}
+
 
 class ElasticClient:
 
@@ -200,16 +213,21 @@ class ElasticClient:
             self.logger.error(f"Failed to search alerts in Elastic: {e}")
             raise Exception(f"Failed to search alerts in Elastic: {e}")
 
+    @staticmethod
+    def alert_to_document(alert: AlertDto) -> dict:
+        alert_dict = alert.dict()
+        alert_dict["dismissed"] = bool(alert_dict["dismissed"])
+        # change severity to number so we can sort by it
+        alert_dict["severity"] = AlertSeverity(alert.severity.lower()).order
+        return alert_dict
+
     def index_alert(self, alert: AlertDto):
         if not self.enabled:
             return
 
         try:
             # query
-            alert_dict = alert.dict()
-            alert_dict["dismissed"] = bool(alert_dict["dismissed"])
-            # change severity to number so we can sort by it
-            alert_dict["severity"] = AlertSeverity(alert.severity.lower()).order
+            alert_dict = self.alert_to_document(alert)
             self._client.index(
                 index=self.alerts_index,
                 body=alert_dict,
@@ -259,6 +277,76 @@ class ElasticClient:
             self.logger.exception(f"Failed to index alerts to Elastic: {e}")
             raise Exception(f"Failed to index alerts to Elastic: {e}")
 
+    def bulk_index_documents(self, documents: dict[str, dict]) -> tuple[int, int]:
+        """
+        Index alert documents ({fingerprint: document}) with a bulk request, retrying
+        the documents rejected with a transient error.
+
+        Args:
+            documents (dict[str, dict]): The documents, see alert_to_document.
+
+        Returns:
+            tuple[int, int]: The number of indexed and failed documents.
+        """
+        if not self.enabled or not documents:
+            return 0, 0
+
+        indexed, failed = 0, 0
+        pending = documents
+        for attempt in range(ELASTIC_BULK_MAX_RETRIES + 1):
+            actions = [
+                {"_index": self.alerts_index, "_id": fingerprint, "_source": document}
+                for fingerprint, document in pending.items()
+            ]
+            try:
+                success, errors = bulk(
+                    self._client,
+                    actions,
+                    refresh=self.refresh_strategy,
+                    raise_on_error=False,
+                )
+            except ApiError as e:
+                elastic_index_failed_total.inc(len(pending))
+                self.logger.error(f"Failed to index alerts to Elastic: {e} {e.errors}")
+                raise Exception(f"Failed to index alerts to Elastic: {e} {e.errors}")
+            except Exception as e:
+                elastic_index_failed_total.inc(len(pending))
+                self.logger.exception(f"Failed to index alerts to Elastic: {e}")
+                raise Exception(f"Failed to index alerts to Elastic: {e}")
+            indexed += success
+            elastic_indexed_total.inc(success)
+
+            retryable = {}
+            for error in errors:
+                # {"index": {"_id": ..., "status": ..., "error": ...}}
+                item = next(iter(error.values()))
+                if (
+                    item.get("status") in ELASTIC_BULK_RETRYABLE_STATUSES
+                    and attempt < ELASTIC_BULK_MAX_RETRIES
+                ):
+                    retryable[item["_id"]] = pending[item["_id"]]
+                else:
+                    failed += 1
+                    elastic_index_failed_total.inc()
+                    self.logger.error(
+                        "Failed to index alert to Elastic",
+                        extra={
+                            "tenant_id": self.tenant_id,
+                            "fingerprint": item.get("_id"),
+                            "error": item.get("error"),
+                        },
+                    )
+            if not retryable:
+                break
+            pending = retryable
+            time.sleep(0.5 * 2**attempt)
+
+        self.logger.debug(
+            f"Indexed {indexed} alerts. Failed to index {failed} alerts.",
+            extra={"tenant_id": self.tenant_id},
+        )
+        return indexed, failed
+
     def enrich_alert(self, alert_fingerprint: str, alert_enrichments: dict):
         if not self.enabled:
             return
@@ -282,3 +370,97 @@ class ElasticClient:
             return
 
         self._client.indices.delete(index=self.alerts_index)
+
+
+class ElasticBulkFlusher:
+    """
+    Buffers the alert documents of the event processing jobs and indexes them from a
+    background thread, per tenant, when the buffer reaches flush_size documents or
+    every flush_interval seconds (KEEP_ELASTIC_BULK_FLUSHER_ENABLED).
+
+    A document replaces the buffered document of the same alert (fingerprint).
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @staticmethod
+    def get_instance() -> "ElasticBulkFlusher":
+        with ElasticBulkFlusher._instance_lock:
+            if ElasticBulkFlusher._instance is None:
+                ElasticBulkFlusher._instance = ElasticBulkFlusher()
+                ElasticBulkFlusher._instance.start()
+                # don't lose the buffered documents on shutdown
+                atexit.register(ElasticBulkFlusher._instance.stop)
+        return ElasticBulkFlusher._instance
+
+    def __init__(self, flush_size: int = None, flush_interval: float = None):
+        self.logger = logging.getLogger(__name__)
+        self.flush_size = flush_size or int(
+            os.environ.get("KEEP_ELASTIC_BULK_FLUSH_SIZE", 500)
+        )
+        self.flush_interval = flush_interval or float(
+            os.environ.get("KEEP_ELASTIC_BULK_FLUSH_INTERVAL", 1)
+        )
+        self._buffers: dict[str, dict[str, dict]] = defaultdict(dict)
+        self._lock = threading.Lock()
+        self._clients: dict[str, ElasticClient] = {}
+        self._flush_requested = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="elastic-bulk-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if not self._thread:
+            return
+        self._stop_event.set()
+        self._flush_requested.set()
+        self._thread.join(timeout=30)
+        self._thread = None
+
+    def add(self, tenant_id: str, documents: dict[str, dict]):
+        with self._lock:
+            buffer = self._buffers[tenant_id]
+            buffered = len(buffer)
+            buffer.update(documents)
+            elastic_buffer_depth.inc(len(buffer) - buffered)
+            if len(buffer) >= self.flush_size:
+                self._flush_requested.set()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            buffers, self._buffers = self._buffers, defaultdict(dict)
+
+        for tenant_id, documents in buffers.items():
+            elastic_buffer_depth.dec(len(documents))
+            try:
+                if tenant_id not in self._clients:
+                    self._clients[tenant_id] = ElasticClient(tenant_id=tenant_id)
+            except Exception:
+                elastic_index_failed_total.inc(len(documents))
+                self.logger.exception(
+                    "Failed to create Elastic client",
+                    extra={"tenant_id": tenant_id, "num_of_alerts": len(documents)},
+                )
+                continue
+            try:
+                self._clients[tenant_id].bulk_index_documents(documents)
+            except Exception:
+                # already counted as failed by bulk_index_documents
+                self.logger.exception(
+                    "Failed to flush alerts to Elastic",
+                    extra={"tenant_id": tenant_id, "num_of_alerts": len(documents)},
+                )
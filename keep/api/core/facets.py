@@ -60,6 +60,7 @@ def get_facet_options(
     facets: list[FacetDto],
     facet_options_query: FacetOptionsQueryDto,
     properties_metadata: PropertiesMetadata,
+    raise_on_error: bool = False,
 ) -> dict[str, list[FacetOptionDto]]:
     """
     Generates facet options based on the provided query and metadata.
@@ -68,6 +69,7 @@ def get_facet_options(
         cel (str): The CEL (Common Expression Language) string for filtering.
         facets (list[FacetDto]): A list of facet definitions.
         properties_metadata (PropertiesMetadata): Metadata about the properties.
+        raise_on_error (bool): Raise the OperationalError of the query instead of returning empty options.
     Returns:
         dict[str, list[FacetOptionDto]]: A dictionary where keys are facet IDs and values are lists of FacetOptionDto objects.
     """
@@ -104,6 +106,8 @@ def get_facet_options(
                     Error: {e}
                     """
                 )
+                if raise_on_error:
+                    raise
                 return {facet.id: [] for facet in facets}
 
             grouped_by_id_dict = {}
@@ -19,8 +19,17 @@ from keep.api.core.cel_to_sql.sql_providers.base import CelToSqlException
 from keep.api.core.cel_to_sql.sql_providers.get_cel_to_sql_provider_for_dialect import (
     get_cel_to_sql_provider,
 )
+from keep.api.core.cursor import (
+    InvalidCursorException,
+    decode_cursor,
+    encode_cursor,
+    get_cursor_values,
+    get_keyset_columns,
+    keyset_condition,
+)
 from keep.api.core.db import engine, enrich_incidents_with_alerts
 from keep.api.core.facets import get_facet_options, get_facets
+from keep.api.core.query_count import CountStrategy, get_total_count
 from keep.api.models.db.alert import (
     Alert,
     AlertEnrichment,
@@ -188,6 +197,13 @@ static_facets = [
 ]
 static_facets_dict = {facet.id: facet for facet in static_facets}
 
+# sort fields that can be paginated with a seek predicate (non nullable columns)
+keyset_columns_mapping = {
+    "incident.creation_time": Incident.creation_time,
+    "incident.severity": Incident.severity,
+    "incident.alerts_count": Incident.alerts_count,
+}
+
 
 def __build_base_incident_query(
     tenant_id: str,
@@ -304,6 +320,7 @@ def __build_last_incidents_total_count_query(
     is_predicted: bool = None,
     cel: str = None,
     allowed_incident_ids: Optional[List[str]] = None,
+    select_args: Optional[list] = None,
 ):
     """
     Builds a SQL query to retrieve the last incidents based on various filters and sorting options.
@@ -321,20 +338,22 @@ def __build_last_incidents_total_count_query(
         is_predicted (bool, optional): Filter for predicted incidents. Defaults to None.
         cel (str, optional): The CEL (Common Expression Language) string to convert to SQL. Defaults to None.
         allowed_incident_ids (Optional[List[str]], optional): List of allowed incident IDs to filter. Defaults to None.
+        select_args (Optional[list], optional): Selects these instead of the count (e.g. to estimate it). Defaults to None.
 
     Returns:
         sqlalchemy.sql.selectable.Select: The constructed SQL query.
     """
-    fetch_alerts = cel and "alert." in cel
-
-    count_funct = (
-        func.count(func.distinct(Incident.id)) if fetch_alerts else func.count(1)
-    )
+    if select_args is None:
+        fetch_alerts = cel and "alert." in cel
+        count_funct = (
+            func.count(func.distinct(Incident.id)) if fetch_alerts else func.count(1)
+        )
+        select_args = [count_funct]
 
     query = __build_base_incident_query(
         tenant_id=tenant_id,
         cel=cel,
-        select_args=[count_funct],
+        select_args=select_args,
     )["query"]
 
     query = query.filter(Incident.is_candidate == is_candidate)
@@ -363,6 +382,12 @@ def __build_last_incidents_total_count_query(
     return query
 
 
+def __get_sort_options(sorting: IncidentSorting) -> list[SortOptionsDto]:
+    sort_dir = "DESC" if "-" in sorting.value else "ASC"
+    sort_by = sorting.value.replace("-", "")
+    return [SortOptionsDto(sort_by=sort_by, sort_dir=sort_dir)]
+
+
 def __build_last_incidents_query(
     tenant_id: str,
     limit: int = 25,
@@ -375,6 +400,8 @@ def __build_last_incidents_query(
     is_predicted: bool = None,
     cel: str = None,
     allowed_incident_ids: Optional[List[str]] = None,
+    keyset_columns: Optional[list[tuple]] = None,
+    cursor_values: Optional[list] = None,
 ):
     """
     Builds a SQL query to retrieve the last incidents based on various filters and sorting options.
@@ -392,15 +419,13 @@ def __build_last_incidents_query(
         is_predicted (bool, optional): Filter for predicted incidents. Defaults to None.
         cel (str, optional): The CEL (Common Expression Language) string to convert to SQL. Defaults to None.
         allowed_incident_ids (Optional[List[str]], optional): List of allowed incident IDs to filter. Defaults to None.
+        keyset_columns (Optional[list[tuple]], optional): (column, direction) pairs to paginate with a seek predicate. Defaults to None.
+        cursor_values (Optional[list], optional): Sort keys of the last incident of the previous page. Defaults to None.
 
     Returns:
         sqlalchemy.sql.selectable.Select: The constructed SQL query.
     """
-    sort_dir = "DESC" if "-" in sorting.value else "ASC"
-    sort_by = sorting.value.replace("-", "")
-    sort_options: list[SortOptionsDto] = [
-        SortOptionsDto(sort_by=sort_by, sort_dir=sort_dir)
-    ]
+    sort_options = __get_sort_options(sorting)
     cel_to_sql_instance = get_cel_to_sql_provider(properties_metadata)
     sort_by_exp = cel_to_sql_instance.get_order_by_expression(
         [(sort_option.sort_by, sort_option.sort_dir) for sort_option in sort_options]
@@ -410,15 +435,30 @@ def __build_last_incidents_query(
         for sort_option in sort_options
     ]
 
+    select_args = [Incident, incident_enrichment]
+    if keyset_columns:
+        # the sort keys of the last row are used to build the next cursor
+        select_args += [
+            column.label(f"keyset_{i}") for i, (column, _) in enumerate(keyset_columns)
+        ]
+
     built_query_result = __build_base_incident_query(
         tenant_id=tenant_id,
         cel=cel,
-        select_args=[Incident, incident_enrichment],
+        select_args=select_args,
     )
     sql_query = built_query_result["query"]
     fetch_alerts = built_query_result["fetch_alerts"]
     sql_query = sql_query.order_by(text(sort_by_exp))
 
+    if keyset_columns:
+        unique_column, direction = keyset_columns[-1]
+        sql_query = sql_query.order_by(
+            unique_column.desc() if direction == "desc" else unique_column.asc()
+        )
+        if cursor_values:
+            sql_query = sql_query.where(keyset_condition(keyset_columns, cursor_values))
+
     sql_query = sql_query.filter(Incident.is_candidate == is_candidate)
 
     if allowed_incident_ids:
@@ -482,6 +522,74 @@ def get_last_incidents_by_cel(
     Returns:
         Tuple[list[Incident], int]: A tuple containing a list of incidents and the total count of incidents.
     """
+    incidents, total_count, _, _ = get_last_incidents_page_by_cel(
+        tenant_id=tenant_id,
+        limit=limit,
+        offset=offset,
+        timeframe=timeframe,
+        upper_timestamp=upper_timestamp,
+        lower_timestamp=lower_timestamp,
+        is_candidate=is_candidate,
+        sorting=sorting,
+        with_alerts=with_alerts,
+        is_predicted=is_predicted,
+        cel=cel,
+        allowed_incident_ids=allowed_incident_ids,
+    )
+    return incidents, total_count
+
+
+def get_last_incidents_page_by_cel(
+    tenant_id: str,
+    limit: int = 25,
+    offset: int = 0,
+    timeframe: int = None,
+    upper_timestamp: datetime = None,
+    lower_timestamp: datetime = None,
+    is_candidate: bool = False,
+    sorting: Optional[IncidentSorting] = IncidentSorting.creation_time,
+    with_alerts: bool = False,
+    is_predicted: bool = None,
+    cel: str = None,
+    allowed_incident_ids: Optional[List[str]] = None,
+    cursor: Optional[str] = None,
+) -> Tuple[list[Incident], int, Optional[str], CountStrategy]:
+    """
+    Same as get_last_incidents_by_cel, with the cursor of the next page if cursor is set
+    and the strategy that produced the total count.
+
+    In cursor mode ("" for the first page, offset is ignored), sorting on
+    creation_time, severity or alerts_count is paginated with a seek predicate on
+    the sort key and the incident id, other sortings fall back to an offset kept
+    in the cursor.
+
+    Raises:
+        InvalidCursorException: if the cursor is malformed or doesn't match the
+            sorting.
+    """
+    keyset_columns = None
+    cursor_values = None
+    if cursor is not None:
+        cursor_payload = decode_cursor(cursor) if cursor else {}
+        if cursor_payload and cursor_payload.get("sort") != sorting.value:
+            raise InvalidCursorException(
+                "The cursor doesn't match the sorting of the query"
+            )
+        keyset_columns = get_keyset_columns(
+            properties_metadata,
+            [
+                (sort_option.sort_by, sort_option.sort_dir)
+                for sort_option in __get_sort_options(sorting)
+            ],
+            keyset_columns_mapping,
+            Incident.id,
+        )
+        if keyset_columns:
+            offset = 0
+            if cursor_payload:
+                cursor_values = get_cursor_values(cursor_payload, keyset_columns)
+        else:
+            offset = cursor_payload.get("offset", 0)
 
     with Session(engine) as session:
         try:
@@ -507,15 +615,42 @@ def get_last_incidents_by_cel(
                 is_predicted=is_predicted,
                 cel=cel,
                 allowed_incident_ids=allowed_incident_ids,
+                keyset_columns=keyset_columns,
+                cursor_values=cursor_values,
             )
         except CelToSqlException as e:
             if isinstance(e.__cause__, PropertiesMappingException):
                 # if there is an error in mapping properties, return empty list
                 logger.error(f"Error mapping properties: {str(e)}")
-                return [], 0
+                return [], 0, None, CountStrategy.EXACT
             raise e
 
-        total_count = session.exec(total_count_query).one()[0]
+        total_count, count_strategy = get_total_count(
+            session,
+            tenant_id,
+            (
+                "incidents",
+                cel or "",
+                timeframe,
+                upper_timestamp,
+                lower_timestamp,
+                is_candidate,
+                is_predicted,
+                tuple(allowed_incident_ids or ()),
+            ),
+            lambda: total_count_query,
+            build_rows_query=lambda: __build_last_incidents_total_count_query(
+                tenant_id=tenant_id,
+                timeframe=timeframe,
+                upper_timestamp=upper_timestamp,
+                lower_timestamp=lower_timestamp,
+                is_candidate=is_candidate,
+                is_predicted=is_predicted,
+                cel=cel,
+                allowed_incident_ids=allowed_incident_ids,
+                select_args=[Incident.id],
+            ),
+        )
         all_records = session.exec(sql_query).all()
 
         incidents = []
@@ -532,7 +667,25 @@ def get_last_incidents_by_cel(
         if with_alerts:
             enrich_incidents_with_alerts(tenant_id, incidents, session)
 
-    return incidents, total_count
+        # a full page means there may be a next one
+        next_cursor = None
+        if cursor is not None and limit and len(all_records) == limit:
+            if keyset_columns:
+                last_row = all_records[-1]._mapping
+                next_cursor = encode_cursor(
+                    {
+                        "sort": sorting.value,
+                        "values": [
+                            last_row[f"keyset_{i}"] for i in range(len(keyset_columns))
+                        ],
+                    }
+                )
+            else:
+                next_cursor = encode_cursor(
+                    {"sort": sorting.value, "offset": offset + limit}
+                )
+
+    return incidents, total_count, next_cursor, count_strategy
 
 
 def get_incident_facets_data(
@@ -89,3 +89,39 @@ workflow_queue_size = Gauge(
     labelnames=["tenant_id"],
     multiprocess_mode="livesum",
 )
+
+### CACHES
+METRIC_PREFIX = "keep_cache_"
+
+# In-process cache metrics (see keep/api/core/cache.py)
+cache_hits_total = Counter(
+    f"{METRIC_PREFIX}hits_total",
+    "Total number of in-process cache hits",
+    labelnames=["cache"],
+)
+
+cache_misses_total = Counter(
+    f"{METRIC_PREFIX}misses_total",
+    "Total number of in-process cache misses",
+    labelnames=["cache"],
+)
+
+### ELASTIC
+METRIC_PREFIX = "keep_elastic_"
+
+# Bulk indexing metrics (see keep/api/core/elastic.py)
+elastic_indexed_total = Counter(
+    f"{METRIC_PREFIX}indexed_total",
+    "Total number of alerts indexed to Elasticsearch",
+)
+
+elastic_index_failed_total = Counter(
+    f"{METRIC_PREFIX}index_failed_total",
+    "Total number of alerts that failed to be indexed to Elasticsearch",
+)
+
+elastic_buffer_depth = Gauge(
+    f"{METRIC_PREFIX}buffer_depth",
+    "Current number of alerts buffered for Elasticsearch bulk indexing",
+    multiprocess_mode="livesum",
+)
@@ -0,0 +1,90 @@
+"""
+Total count strategies of the alerts and incidents list queries.
+
+- exact: COUNT over the filtered set on every request (default).
+- cached: the exact count, memoized per tenant and query for a few seconds and
+  dropped when alerts of the tenant are processed or its incidents are created,
+  merged, deleted or change status (in every process, with Redis).
+- estimated: the planner estimate of the filtered set on PostgreSQL/MySQL,
+  the exact count on other dialects.
+
+The strategy is set with KEEP_QUERY_COUNT_STRATEGY, the list responses report
+the strategy that actually produced the count.
+"""
+
+import enum
+import logging
+from typing import Any, Callable, Hashable, Optional
+
+from sqlmodel import Session
+
+from keep.api.core.cache import TenantCache
+from keep.api.core.config import config
+from keep.api.core.db_utils import get_estimated_rows_count
+
+logger = logging.getLogger(__name__)
+
+
+class CountStrategy(str, enum.Enum):
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+
+
+KEEP_QUERY_COUNT_STRATEGY = CountStrategy(
+    config("KEEP_QUERY_COUNT_STRATEGY", default=CountStrategy.EXACT.value)
+)
+
+query_counts_cache = TenantCache(
+    "query_counts",
+    max_size=config("KEEP_QUERY_COUNT_CACHE_SIZE", default=1024, cast=int),
+    ttl=config("KEEP_QUERY_COUNT_CACHE_TTL", default=10, cast=int),
+    broadcast_invalidations=True,
+)
+
+
+def invalidate_query_counts_cache(tenant_id: str):
+    query_counts_cache.invalidate(tenant_id)
+
+
+def get_total_count(
+    session: Session,
+    tenant_id: str,
+    cache_key: Hashable,
+    build_count_query: Callable[[], Any],
+    build_rows_query: Optional[Callable[[], Any]] = None,
+    strategy: Optional[CountStrategy] = None,
+) -> tuple[int, CountStrategy]:
+    """
+    Get the total count of a list query with the configured strategy.
+
+    The queries are built only if needed.
+
+    Args:
+        session (Session): The db session.
+        tenant_id (str): The tenant ID.
+        cache_key (Hashable): Identifies the query (its filters) in the cache.
+        build_count_query (Callable): Builds the select of the exact count.
+        build_rows_query (Callable, optional): Builds the select of the filtered
+            rows, used for the estimate.
+        strategy (CountStrategy, optional): Overrides KEEP_QUERY_COUNT_STRATEGY.
+
+    Returns:
+        tuple[int, CountStrategy]: The count and the strategy that produced it.
+    """
+    strategy = strategy or KEEP_QUERY_COUNT_STRATEGY
+
+    if strategy == CountStrategy.ESTIMATED and build_rows_query is not None:
+        estimated_count = get_estimated_rows_count(session, build_rows_query())
+        if estimated_count is not None:
+            return estimated_count, CountStrategy.ESTIMATED
+
+    if strategy == CountStrategy.CACHED:
+        cached_count = query_counts_cache.get(tenant_id, cache_key)
+        if cached_count is not None:
+            return cached_count, CountStrategy.CACHED
+
+    total_count = session.exec(build_count_query()).one()[0]
+    if strategy == CountStrategy.CACHED:
+        query_counts_cache.set(tenant_id, cache_key, total_count)
+    return total_count, CountStrategy.EXACT
@@ -2,6 +2,8 @@ import datetime
 import hashlib
 import json
 import logging
+import re
+import typing
 import urllib.parse
 import uuid
 from enum import Enum
@@ -54,6 +56,12 @@ class AlertStatus(Enum):
     PENDING = "pending"
 
 
+# lastReceived as normalized by AlertDto.validate_last_received
+NORMALIZED_LAST_RECEIVED_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z"
+)
+
+
 class DismissAlertRequest(BaseModel):
     alert_id: Optional[str] = None
 
@@ -297,6 +305,96 @@ class AlertDto(BaseModel):
         #     values["status"] = AlertStatus.SUPPRESSED
         return values
 
+    @classmethod
+    def _get_trusted_field_types(cls) -> dict[str, tuple[type, ...]]:
+        """The python types a value of each plain field can have without coercion."""
+        if "_trusted_field_types" not in cls.__dict__:
+            field_types = {}
+            for name, field in cls.__fields__.items():
+                field_type = typing.get_origin(field.outer_type_) or field.outer_type_
+                # deleted and dismissed are normalized by from_trusted
+                if name in ("deleted", "dismissed"):
+                    continue
+                if field_type in (str, int, bool, list, dict):
+                    field_types[name] = (field_type, type(None))
+            cls._trusted_field_types = field_types
+        return cls._trusted_field_types
+
+    @classmethod
+    def from_trusted(cls, event: dict) -> "AlertDto":
+        """
+        Build an AlertDto from an event that was already validated when it was
+        ingested (e.g. Alert.event with its enrichments), without running the pydantic
+        validation.
+
+        Only the normalizations the validators apply to valid events are applied, so the
+        result is the same as AlertDto(**event). Events with values that would need a
+        coercion or a full validation fall back to AlertDto(**event).
+        """
+        values = dict(event)
+        if not values.get("id"):
+            values["id"] = str(uuid.uuid4())
+
+        severity = values.get("severity")
+        try:
+            if isinstance(severity, int):
+                values["severity"] = AlertSeverity.from_number(severity).value
+            else:
+                values["severity"] = AlertSeverity(severity).value
+        except ValueError:
+            logging.warning(
+                f"Invalid severity value: {severity}, setting default.",
+                extra={"event": values},
+            )
+            values["severity"] = AlertSeverity.INFO.value
+
+        status = values.get("status")
+        try:
+            values["status"] = AlertStatus(status).value
+        except ValueError:
+            logging.warning(
+                f"Invalid status value: {status}, setting default.",
+                extra={"event": values},
+            )
+            values["status"] = AlertStatus.FIRING.value
+
+        values.pop("deletedAt", None)
+        last_received = values.get("lastReceived")
+        fingerprint = values.get("fingerprint")
+        deleted = values.get("deleted", False)
+        dismissed = values.get("dismissed", False)
+        url = values.get("url")
+        if (
+            not isinstance(last_received, str)
+            or not NORMALIZED_LAST_RECEIVED_PATTERN.fullmatch(last_received)
+            or not isinstance(fingerprint, str)
+            or not isinstance(deleted, (bool, list))
+            or not isinstance(dismissed, (bool, str))
+            or isinstance(values.get("assignees"), dict)
+            or values.get("description_format") not in (None, "markdown", "html")
+            or (url is not None and not isinstance(url, str))
+            or any(
+                not isinstance(values[name], field_types)
+                for name, field_types in cls._get_trusted_field_types().items()
+                if name in values
+            )
+        ):
+            return cls(**event)
+        values.pop("assignees", None)
+
+        values["fingerprint"] = fingerprint[:255]
+        if isinstance(deleted, list):
+            values["deleted"] = last_received in deleted
+        if url is not None:
+            values["url"] = cls.prepend_https(url)
+        if isinstance(dismissed, str) or dismissed:
+            try:
+                values["dismissed"] = cls.validate_dismissed(dismissed, values)
+            except ValueError:
+                return cls(**event)
+
+        return cls.construct(**values)
+
     class Config:
         extra = Extra.allow
         schema_extra = {
@@ -338,9 +436,11 @@ class AlertWithIncidentLinkMetadataDto(AlertDto):
 
     @classmethod
     def from_db_instance(cls, db_alert, db_alert_to_incident):
-        return cls(
-            is_created_by_ai=db_alert_to_incident.is_created_by_ai,
-            **db_alert.event,
+        return cls.from_trusted(
+            {
+                **db_alert.event,
+                "is_created_by_ai": db_alert_to_incident.is_created_by_ai,
+            }
         )
 
 
@@ -1,8 +1,10 @@
+import enum
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List
 from uuid import UUID, uuid4
 
+import dateutil.parser
 from pydantic import PrivateAttr
 from sqlalchemy import ForeignKey, ForeignKeyConstraint, UniqueConstraint
 from sqlalchemy_utils import UUIDType
@@ -48,6 +50,12 @@ class LastAlert(SQLModel, table=True):
     timestamp: datetime = Field(nullable=False, index=True)
     first_timestamp: datetime = Field(nullable=False, index=True)
     alert_hash: str | None = Field(nullable=True, index=True)
+    # Effective (enriched) values of the hot alert fields, materialized so that
+    # presets/queries on them don't need to extract them from the JSON columns
+    # Maintained by set_last_alert(s) and the enrichment paths in core/db.py
+    severity: str | None = Field(default=None, nullable=True)
+    status: str | None = Field(default=None, nullable=True)
+    last_received: datetime | None = Field(default=None, nullable=True)
 
     __table_args__ = (
         # Original indexes from MySQL
@@ -60,10 +68,56 @@ class LastAlert(SQLModel, table=True):
             "alert_id",
             "fingerprint",
         ),
+        Index(
+            "idx_lastalert_tenant_severity_status", "tenant_id", "severity", "status"
+        ),
+        Index("idx_lastalert_tenant_status", "tenant_id", "status"),
+        Index("idx_lastalert_tenant_last_received", "tenant_id", "last_received"),
         {},
     )
 
 
+def get_last_alert_hot_fields(event: dict, enrichments: dict | None) -> dict:
+    """
+    Get the effective values of the LastAlert hot fields of an alert.
+
+    Same precedence as the JSON field mappings of the alerts query: an enrichment
+    (if not None) overrides the value of the alert event.
+
+    Args:
+        event (dict): The alert event.
+        enrichments (dict | None): The alert enrichments.
+
+    Returns:
+        dict: severity, status and last_received, as stored on LastAlert.
+    """
+    enrichments = enrichments or {}
+    values = {}
+    for field in ("severity", "status", "lastReceived"):
+        value = enrichments.get(field)
+        if value is None:
+            value = (event or {}).get(field)
+        if isinstance(value, enum.Enum):
+            value = value.value
+        values[field] = value
+
+    last_received = values["lastReceived"]
+    if last_received is not None and not isinstance(last_received, datetime):
+        try:
+            last_received = dateutil.parser.isoparse(str(last_received))
+        except ValueError:
+            last_received = None
+    if last_received is not None and last_received.tzinfo is not None:
+        # stored as naive UTC, like the other LastAlert timestamps
+        last_received = last_received.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return {
+        "severity": None if values["severity"] is None else str(values["severity"]),
+        "status": None if values["status"] is None else str(values["status"]),
+        "last_received": last_received,
+    }
+
+
 class LastAlertToIncident(SQLModel, table=True):
     tenant_id: str = Field(foreign_key="tenant.id", nullable=False, primary_key=True)
     timestamp: datetime = Field(default_factory=datetime.utcnow)
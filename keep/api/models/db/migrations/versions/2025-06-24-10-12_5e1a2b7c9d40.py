@@ -0,0 +1,134 @@
+"""Materialize severity, status and last_received on lastalert
+
+Revision ID: 5e1a2b7c9d40
+Revises: 9dd1be4539e0
+Create Date: 2025-06-24 10:12:41.318207
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlmodel import Session
+
+from keep.api.models.db.alert import get_last_alert_hot_fields
+
+# revision identifiers, used by Alembic.
+revision = "5e1a2b7c9d40"
+down_revision = "9dd1be4539e0"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+migration_metadata = sa.MetaData()
+
+lastalert_table = sa.Table(
+    "lastalert",
+    migration_metadata,
+    sa.Column("tenant_id", sa.String, primary_key=True),
+    sa.Column("fingerprint", sa.String, primary_key=True),
+    sa.Column("alert_id", sa.String),
+    sa.Column("severity", sa.String),
+    sa.Column("status", sa.String),
+    sa.Column("last_received", sa.DateTime),
+)
+
+alert_table = sa.Table(
+    "alert",
+    migration_metadata,
+    sa.Column("id", sa.String, primary_key=True),
+    sa.Column("tenant_id", sa.String),
+    sa.Column("event", sa.JSON),
+)
+
+alertenrichment_table = sa.Table(
+    "alertenrichment",
+    migration_metadata,
+    sa.Column("tenant_id", sa.String),
+    sa.Column("alert_fingerprint", sa.String),
+    sa.Column("enrichments", sa.JSON),
+)
+
+
+def populate_db():
+    session = Session(op.get_bind())
+    last_key = None
+    while True:
+        query = (
+            sa.select(
+                lastalert_table.c.tenant_id,
+                lastalert_table.c.fingerprint,
+                alert_table.c.event,
+                alertenrichment_table.c.enrichments,
+            )
+            .select_from(lastalert_table)
+            .join(
+                alert_table,
+                sa.and_(
+                    alert_table.c.id == lastalert_table.c.alert_id,
+                    alert_table.c.tenant_id == lastalert_table.c.tenant_id,
+                ),
+            )
+            .outerjoin(
+                alertenrichment_table,
+                sa.and_(
+                    alertenrichment_table.c.tenant_id == lastalert_table.c.tenant_id,
+                    alertenrichment_table.c.alert_fingerprint
+                    == lastalert_table.c.fingerprint,
+                ),
+            )
+            .order_by(lastalert_table.c.tenant_id, lastalert_table.c.fingerprint)
+            .limit(BATCH_SIZE)
+        )
+        if last_key is not None:
+            query = query.where(
+                sa.tuple_(lastalert_table.c.tenant_id, lastalert_table.c.fingerprint)
+                > sa.tuple_(*last_key)
+            )
+        rows = session.execute(query).all()
+        if not rows:
+            break
+
+        for tenant_id, fingerprint, event, enrichments in rows:
+            session.execute(
+                sa.update(lastalert_table)
+                .where(lastalert_table.c.tenant_id == tenant_id)
+                .where(lastalert_table.c.fingerprint == fingerprint)
+                .values(**get_last_alert_hot_fields(event, enrichments))
+            )
+        session.commit()
+        last_key = (rows[-1][0], rows[-1][1])
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("lastalert", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("severity", sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column("status", sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column("last_received", sa.DateTime(), nullable=True))
+
+    populate_db()
+
+    with op.batch_alter_table("lastalert", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_lastalert_tenant_severity_status",
+            ["tenant_id", "severity", "status"],
+            unique=False,
+        )
+        batch_op.create_index(
+            "idx_lastalert_tenant_status", ["tenant_id", "status"], unique=False
+        )
+        batch_op.create_index(
+            "idx_lastalert_tenant_last_received",
+            ["tenant_id", "last_received"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("lastalert", schema=None) as batch_op:
+        batch_op.drop_index("idx_lastalert_tenant_last_received")
+        batch_op.drop_index("idx_lastalert_tenant_status")
+        batch_op.drop_index("idx_lastalert_tenant_severity_status")
+        batch_op.drop_column("last_received")
+        batch_op.drop_column("status")
+        batch_op.drop_column("severity")
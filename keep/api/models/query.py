@@ -14,3 +14,6 @@ class QueryDto(BaseModel):
     sort_by: Optional[str]  # must be deprecated because we have sort_options
     sort_dir: Optional[str]  # must be deprecated because we have sort_options
     sort_options: Optional[list[SortOptionsDto]]
+    # opt-in keyset pagination: "" for the first page, then the returned next_cursor
+    # (offset is ignored when a cursor is given)
+    cursor: Optional[str] = None
@@ -5,9 +5,19 @@ This module provides a centralized way to configure Redis connections,
 supporting both direct Redis and Redis Sentinel configurations.
 """
 
+import threading
+
+import redis
 from arq.connections import RedisSettings
+from redis.sentinel import Sentinel
+
 from keep.api.core.config import config
 
+REDIS_CONNECT_TIMEOUT = config("REDIS_CONNECT_TIMEOUT", cast=int, default=5)
+
+_redis_client: redis.Redis | None = None
+_redis_client_lock = threading.Lock()
+
 
 def get_redis_settings() -> RedisSettings:
     """
@@ -62,3 +72,41 @@ def get_redis_settings() -> RedisSettings:
             conn_retries=10,
             conn_retry_delay=10,
         )
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Get the synchronous Redis client of this process, with the same configuration
+    as the ARQ pool (e.g. for pub/sub between the processes).
+
+    The client is created on the first call and shared, so the publishers reuse
+    the connections of its pool instead of connecting for every message.
+
+    Returns:
+        redis.Redis: The client, connected lazily.
+    """
+    global _redis_client
+    if _redis_client is None:
+        with _redis_client_lock:
+            if _redis_client is None:
+                _redis_client = _create_redis_client()
+    return _redis_client
+
+
+def _create_redis_client() -> redis.Redis:
+    settings = get_redis_settings()
+    if settings.sentinel:
+        return Sentinel(
+            settings.host,
+            sentinel_kwargs={"socket_connect_timeout": REDIS_CONNECT_TIMEOUT},
+            username=settings.username,
+            password=settings.password,
+            socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        ).master_for(settings.sentinel_master)
+    return redis.Redis(
+        host=settings.host,
+        port=settings.port,
+        username=settings.username,
+        password=settings.password,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+    )
@@ -20,15 +20,18 @@ from sqlmodel import Session
 
 from keep.api.arq_pool import get_pool
 from keep.api.bl.enrichments_bl import EnrichmentsBl
-from keep.api.consts import KEEP_ARQ_QUEUE_BASIC
+from keep.api.consts import KEEP_ARQ_QUEUE_BASIC, KEEP_PULL_SCHEDULER_ENABLED
 from keep.api.core.alerts import (
+    alert_facets_cache,
     get_alert_facets,
     get_alert_facets_data,
     get_alert_potential_facet_fields,
     query_last_alerts,
+    query_last_alerts_page,
 )
 from keep.api.core.cel_to_sql.sql_providers.base import CelToSqlException
 from keep.api.core.config import config
+from keep.api.core.cursor import InvalidCursorException
 from keep.api.core.db import dismiss_error_alerts as dismiss_error_alerts_db
 from keep.api.core.db import enrich_alerts_with_incidents
 from keep.api.core.db import get_alert_audit as get_alert_audit_db
@@ -68,8 +71,8 @@ from keep.api.models.facet import FacetOptionsQueryDto
 from keep.api.models.query import QueryDto
 from keep.api.models.search_alert import SearchAlertsRequest
 from keep.api.models.time_stamp import TimeStampFilter
-from keep.api.routes.preset import pull_data_from_providers
 from keep.api.tasks.process_event_task import process_event
+from keep.api.tasks.process_pull_task import pull_data_from_providers
 from keep.api.utils.email_utils import EmailTemplates, send_email
 from keep.api.utils.enrichment_helpers import convert_db_alerts_to_dto_alerts
 from keep.api.utils.time_stamp_helpers import get_time_stamp_filter
@@ -127,6 +130,7 @@ def fetch_alert_facet_options(
         "Fetched alert facets from DB",
         extra={
             "tenant_id": tenant_id,
+            "facets_cache_hit_rate": alert_facets_cache.hit_rate,
         },
     )
 
@@ -204,14 +208,14 @@ def query_alerts(
         IdentityManagerFactory.get_auth_verifier(["read:alert"])
     ),
 ):
+    # The providers are pulled by the providers pull scheduler, unless it's disabled.
     # Gathering alerts may take a while and we don't care if it will finish before we return the response.
-    # In the worst case, gathered alerts will be pulled in the next request.
-    # This approach is not good. We should continuesly pull alerts without relying on whether request is done or not.
-    bg_tasks.add_task(
-        pull_data_from_providers,
-        authenticated_entity.tenant_id,
-        request.state.trace_id,
-    )
+    if not KEEP_PULL_SCHEDULER_ENABLED:
+        bg_tasks.add_task(
+            pull_data_from_providers,
+            authenticated_entity.tenant_id,
+            request.state.trace_id,
+        )
 
     tenant_id = authenticated_entity.tenant_id
     logger.info(
@@ -222,12 +226,16 @@ def query_alerts(
     )
 
     try:
-        db_alerts, total_count = query_last_alerts(tenant_id=tenant_id, query=query)
+        db_alerts, total_count, next_cursor, count_strategy = query_last_alerts_page(
+            tenant_id=tenant_id, query=query
+        )
     except CelToSqlException as e:
         logger.exception(f'Error parsing CEL expression "{query.cel}". {str(e)}')
         raise HTTPException(
             status_code=400, detail=f"Error parsing CEL expression: {query.cel}"
         ) from e
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     db_alerts = enrich_alerts_with_incidents(tenant_id, db_alerts)
     enriched_alerts_dto = convert_db_alerts_to_dto_alerts(
@@ -242,12 +250,16 @@ def query_alerts(
         },
     )
 
-    return {
+    response = {
         "limit": query.limit,
         "offset": query.offset,
         "count": total_count,
+        "count_strategy": count_strategy.value,
         "results": enriched_alerts_dto,
     }
+    if query.cursor is not None:
+        response["next_cursor"] = next_cursor
+    return response
 
 
 @router.get(
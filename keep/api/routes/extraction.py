@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
-from keep.api.bl.enrichments_bl import EnrichmentsBl
+from keep.api.bl.enrichments_bl import EnrichmentsBl, invalidate_extraction_rules_cache
 from keep.api.core.db import get_alert_by_event_id, get_session
 from keep.api.models.db.enrichment_event import EnrichmentEventWithLogs, EnrichmentType
 from keep.api.models.db.extraction import (
@@ -55,6 +55,7 @@ def create_extraction_rule(
     session.add(new_rule)
     session.commit()
     session.refresh(new_rule)
+    invalidate_extraction_rules_cache(authenticated_entity.tenant_id)
     return ExtractionRuleDtoOut(**new_rule.dict())
 
 
@@ -84,6 +85,7 @@ def update_extraction_rule(
     rule.updated_by = authenticated_entity.email
     session.commit()
     session.refresh(rule)
+    invalidate_extraction_rules_cache(authenticated_entity.tenant_id)
     return ExtractionRuleDtoOut(**rule.dict())
 
 
@@ -108,6 +110,7 @@ def delete_extraction_rule(
         raise HTTPException(status_code=404, detail="Extraction rule not found")
     session.delete(rule)
     session.commit()
+    invalidate_extraction_rules_cache(authenticated_entity.tenant_id)
     return {"message": "Extraction rule deleted successfully"}
 
 
@@ -23,6 +23,7 @@ from keep.api.bl.incident_reports import IncidentReportsBl
 from keep.api.bl.incidents_bl import IncidentBl
 from keep.api.consts import KEEP_ARQ_QUEUE_BASIC, REDIS
 from keep.api.core.cel_to_sql.sql_providers.base import CelToSqlException
+from keep.api.core.cursor import InvalidCursorException
 from keep.api.core.db import (
     DestinationIncidentNotFound,
     add_audit,
@@ -141,6 +142,10 @@ def get_all_incidents(
         IdentityManagerFactory.get_auth_verifier(["read:alert"])
     ),
     cel: str = Query(None),
+    cursor: Optional[str] = Query(
+        None,
+        description='Opt-in keyset pagination: "" for the first page, then the returned next_cursor',
+    ),
 ) -> IncidentsPaginatedResultsDto:
     tenant_id = authenticated_entity.tenant_id
 
@@ -189,6 +194,7 @@ def get_all_incidents(
             sorting=sorting,
             cel=cel,
             allowed_incident_ids=allowed_incident_ids,
+            cursor=cursor,
         )
         logger.info(
             "Fetched incidents from DB",
@@ -206,6 +212,8 @@ def get_all_incidents(
         raise HTTPException(
             status_code=400, detail=f"Error parsing CEL expression: {cel}"
         ) from e
+    except InvalidCursorException as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.post(
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
-from keep.api.bl.enrichments_bl import EnrichmentsBl
+from keep.api.bl.enrichments_bl import EnrichmentsBl, invalidate_mapping_rules_cache
 from keep.api.core.db import get_session
 from keep.api.models.db.enrichment_event import EnrichmentEventWithLogs
 from keep.api.models.db.mapping import (
@@ -119,6 +119,7 @@ def create_rule(
     session.add(new_rule)
     session.commit()
     session.refresh(new_rule)
+    invalidate_mapping_rules_cache(authenticated_entity.tenant_id)
     logger.info("Created a new mapping rule", extra={"rule_id": new_rule.id})
     return new_rule
 
@@ -143,6 +144,7 @@ def delete_rule(
 
     session.delete(rule)
     session.commit()
+    invalidate_mapping_rules_cache(authenticated_entity.tenant_id)
     logger.info("Deleted a mapping rule", extra={"rule_id": rule_id})
     return {"message": "Rule deleted successfully"}
 
@@ -178,6 +180,7 @@ def update_rule(
         existing_rule.rows = rule.rows
     session.commit()
     session.refresh(existing_rule)
+    invalidate_mapping_rules_cache(authenticated_entity.tenant_id)
     response = MappingRuleDtoOut(**existing_rule.dict())
     if rule.rows is not None:
         response.attributes = [
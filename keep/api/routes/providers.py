@@ -25,6 +25,7 @@ from keep.contextmanager.contextmanager import ContextManager
 from keep.exceptions.provider_exception import ProviderException
 from keep.identitymanager.authenticatedentity import AuthenticatedEntity
 from keep.identitymanager.identitymanagerfactory import IdentityManagerFactory
+from keep.providers.base.base_provider import invalidate_format_alert_cache
 from keep.providers.base.provider_exceptions import (
     GetAlertException,
     ProviderMethodException,
@@ -35,6 +36,7 @@ from keep.providers.providers_factory import (
 )
 from keep.providers.providers_service import ProvidersService
 from keep.secretmanager.secretmanagerfactory import SecretManagerFactory
+from keep.workflowmanager.workflowstore import parsed_workflows_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -45,6 +47,12 @@ PROVIDER_DISTRIBUTION_ENABLED = config(
 )
 
 
+def _invalidate_provider_caches(tenant_id: str):
+    # both the alert formatting and the parsed workflows hold installed providers
+    invalidate_format_alert_cache(tenant_id)
+    parsed_workflows_cache.invalidate(tenant_id)
+
+
 def _is_localhost():
     # TODO - there are more "advanced" cases that we don't catch here
     #        e.g. IP's that are not public but not localhost
@@ -376,6 +384,7 @@ def delete_provider(
     tenant_id = authenticated_entity.tenant_id
     try:
         ProvidersService.delete_provider(tenant_id, provider_id, session)
+        _invalidate_provider_caches(tenant_id)
         return JSONResponse(status_code=200, content={"message": "deleted"})
     except HTTPException as e:
         return JSONResponse(status_code=e.status_code, content={"message": e.detail})
@@ -459,6 +468,7 @@ async def update_provider(
         result = ProvidersService.update_provider(
             tenant_id, provider_id, provider_info, updated_by, session
         )
+        _invalidate_provider_caches(tenant_id)
         return JSONResponse(status_code=200, content=result)
     except HTTPException as e:
         return JSONResponse(status_code=e.status_code, content={"message": e.detail})
@@ -510,6 +520,7 @@ async def install_provider(
             provider_info,
             pulling_enabled=pulling_enabled,
         )
+        _invalidate_provider_caches(tenant_id)
         return JSONResponse(status_code=200, content=result)
     except HTTPException as e:
         if e.status_code == 412:
@@ -597,6 +608,7 @@ async def install_provider_oauth2(
         )
         session.add(provider)
         session.commit()
+        _invalidate_provider_caches(tenant_id)
 
         if install_webhook:
             install_provider_webhook(
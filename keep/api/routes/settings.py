@@ -26,6 +26,7 @@ from keep.api.utils.tenant_utils import (
     update_api_key_internal,
 )
 from keep.contextmanager.contextmanager import ContextManager
+from keep.identitymanager.api_key_cache import invalidate_api_keys
 from keep.identitymanager.authenticatedentity import AuthenticatedEntity
 from keep.identitymanager.identitymanagerfactory import IdentityManagerFactory
 from keep.identitymanager.rbac import get_role_by_role_name
@@ -390,6 +391,7 @@ def delete_api_key(
         try:
             api_key.is_deleted = True
             session.commit()
+            invalidate_api_keys(api_key.key_hash)
         except Exception:
             raise HTTPException(
                 status_code=500,
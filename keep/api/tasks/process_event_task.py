@@ -21,25 +21,31 @@ from keep.api.alert_deduplicator.alert_deduplicator import AlertDeduplicator
 from keep.api.bl.enrichments_bl import EnrichmentsBl
 from keep.api.bl.incidents_bl import IncidentBl
 from keep.api.bl.maintenance_windows_bl import MaintenanceWindowsBl
+from keep.api.core.alerts import invalidate_alert_facets_cache
 from keep.api.core.db import (
-    bulk_upsert_alert_fields,
     enrich_alerts_with_incidents,
     get_alerts_by_fingerprint,
-    get_all_presets_dtos,
+    get_alerts_by_ids,
+    get_all_presets_dtos_cached,
     get_enrichment_with_session,
+    get_enrichments,
     get_last_alert_hashes_by_fingerprints,
+    get_last_alerts_by_fingerprints,
     get_session_sync,
     get_started_at_for_alerts,
     set_last_alert,
+    set_last_alerts,
+    upsert_new_alert_fields,
 )
 from keep.api.core.dependencies import get_pusher_client
-from keep.api.core.elastic import ElasticClient
+from keep.api.core.elastic import ElasticBulkFlusher, ElasticClient
 from keep.api.core.metrics import (
     events_error_counter,
     events_in_counter,
     events_out_counter,
     processing_time_summary,
 )
+from keep.api.core.query_count import invalidate_query_counts_cache
 from keep.api.models.action_type import ActionType
 from keep.api.models.alert import AlertDto, AlertStatus
 from keep.api.models.db.alert import Alert, AlertAudit, AlertRaw
@@ -56,6 +62,7 @@ from keep.api.utils.enrichment_helpers import (
 )
 from keep.providers.providers_factory import ProvidersFactory
 from keep.rulesengine.rulesengine import RulesEngine
+from keep.topologies.topology_processor import TopologyProcessor
 from keep.workflowmanager.workflowmanager import WorkflowManager
 
 TIMES_TO_RETRY_JOB = 5  # the number of times to retry the job in case of failure
@@ -74,10 +81,28 @@ KEEP_AUDIT_EVENTS_ENABLED = (
 KEEP_CALCULATE_START_FIRING_TIME_ENABLED = (
     os.environ.get("KEEP_CALCULATE_START_FIRING_TIME_ENABLED", "true") == "true"
 )
+KEEP_BULK_SAVE_TO_DB_ENABLED = (
+    os.environ.get("KEEP_BULK_SAVE_TO_DB_ENABLED", "false") == "true"
+)
+# buffer the elasticsearch documents across jobs, see ElasticBulkFlusher
+KEEP_ELASTIC_BULK_FLUSHER_ENABLED = (
+    os.environ.get("KEEP_ELASTIC_BULK_FLUSHER_ENABLED", "false") == "true"
+)
+# publish the services of the alerts to the topology processor
+KEEP_TOPOLOGY_PROCESSOR_ENABLED = (
+    os.environ.get("KEEP_TOPOLOGY_PROCESSOR", "false").lower() == "true"
+)
 
 logger = logging.getLogger(__name__)
 
 
+class EventsNotSavedException(Exception):
+    """
+    Raised by process_event(raise_on_error=True) when it failed before deduplicating
+    and saving the events, so processing them again doesn't process them twice.
+    """
+
+
 def __internal_prepartion(
     alerts: list[AlertDto], fingerprint: str | None, api_key_name: str | None
 ):
@@ -126,6 +151,326 @@ def __validate_last_received(event):
             ).isoformat()
 
 
+def __save_formatted_events(
+    tenant_id,
+    provider_type,
+    session: Session,
+    enrichments_bl: EnrichmentsBl,
+    formatted_events: list[AlertDto],
+    provider_id: str | None = None,
+    timestamp_forced: datetime.datetime | None = None,
+) -> tuple[list[AlertDto], list[Alert]]:
+    """
+    Save the formatted events one by one (flush, commit and lookups per alert).
+    """
+    enriched_formatted_events = []
+    saved_alerts = []
+
+    fingerprints = [event.fingerprint for event in formatted_events]
+    started_at_for_fingerprints = get_started_at_for_alerts(
+        tenant_id, fingerprints, session=session
+    )
+
+    for formatted_event in formatted_events:
+        formatted_event.pushed = True
+
+        started_at = started_at_for_fingerprints.get(formatted_event.fingerprint, None)
+        if started_at:
+            formatted_event.startedAt = str(started_at)
+
+        if KEEP_CALCULATE_START_FIRING_TIME_ENABLED:
+            # calculate startFiring time
+            previous_alert = get_alerts_by_fingerprint(
+                tenant_id=tenant_id,
+                fingerprint=formatted_event.fingerprint,
+                limit=1,
+            )
+            previous_alert = convert_db_alerts_to_dto_alerts(previous_alert)
+            formatted_event.firingStartTime = calculated_start_firing_time(
+                formatted_event, previous_alert
+            )
+            formatted_event.firingStartTimeSinceLastResolved = (
+                calculate_firing_time_since_last_resolved(
+                    formatted_event, previous_alert
+                )
+            )
+
+            # we now need to update the firing and unresolved counters
+            formatted_event.firingCounter = calculated_firing_counter(
+                formatted_event, previous_alert
+            )
+
+            formatted_event.unresolvedCounter = calculated_unresolved_counter(
+                formatted_event, previous_alert
+            )
+
+        # Dispose enrichments that needs to be disposed
+        try:
+            enrichments_bl.dispose_enrichments(formatted_event.fingerprint)
+        except Exception:
+            logger.exception(
+                "Failed to dispose enrichments",
+                extra={
+                    "tenant_id": tenant_id,
+                    "fingerprint": formatted_event.fingerprint,
+                },
+            )
+
+        # Post format enrichment
+        try:
+            formatted_event = enrichments_bl.run_extraction_rules(formatted_event)
+        except Exception:
+            logger.exception(
+                "Failed to run post-formatting extraction rules",
+                extra={
+                    "tenant_id": tenant_id,
+                    "fingerprint": formatted_event.fingerprint,
+                },
+            )
+
+        __validate_last_received(formatted_event)
+
+        alert_args = {
+            "tenant_id": tenant_id,
+            "provider_type": (
+                provider_type if provider_type else formatted_event.source[0]
+            ),
+            "event": formatted_event.dict(),
+            "provider_id": provider_id,
+            "fingerprint": formatted_event.fingerprint,
+            "alert_hash": formatted_event.alert_hash,
+        }
+        alert_args = sanitize_alert(alert_args)
+        if timestamp_forced is not None:
+            alert_args["timestamp"] = timestamp_forced
+
+        alert = Alert(**alert_args)
+        session.add(alert)
+        session.flush()
+        saved_alerts.append(alert)
+        alert_id = alert.id
+        formatted_event.event_id = str(alert_id)
+
+        if KEEP_AUDIT_EVENTS_ENABLED:
+            audit = AlertAudit(
+                tenant_id=tenant_id,
+                fingerprint=formatted_event.fingerprint,
+                action=(
+                    ActionType.AUTOMATIC_RESOLVE.value
+                    if formatted_event.status == AlertStatus.RESOLVED.value
+                    else ActionType.TIGGERED.value
+                ),
+                user_id="system",
+                description=f"Alert recieved from provider with status {formatted_event.status}",
+            )
+            session.add(audit)
+
+        session.commit()
+        session.flush()
+        set_last_alert(tenant_id, alert, session=session)
+
+        # Mapping
+        try:
+            enrichments_bl.run_mapping_rules(formatted_event)
+        except Exception:
+            logger.exception("Failed to run mapping rules")
+
+        alert_enrichment = get_enrichment_with_session(
+            session=session,
+            tenant_id=tenant_id,
+            fingerprint=formatted_event.fingerprint,
+        )
+        if alert_enrichment:
+            for enrichment in alert_enrichment.enrichments:
+                # set the enrichment
+                value = alert_enrichment.enrichments[enrichment]
+                if isinstance(value, str):
+                    value = value.strip()
+                setattr(formatted_event, enrichment, value)
+        enriched_formatted_events.append(formatted_event)
+
+    return enriched_formatted_events, saved_alerts
+
+
+def __bulk_save_formatted_events(
+    tenant_id,
+    provider_type,
+    session: Session,
+    enrichments_bl: EnrichmentsBl,
+    formatted_events: list[AlertDto],
+    provider_id: str | None = None,
+    timestamp_forced: datetime.datetime | None = None,
+) -> tuple[list[AlertDto], list[Alert]]:
+    """
+    Set-based version of __save_formatted_events (KEEP_BULK_SAVE_TO_DB_ENABLED).
+
+    LastAlert rows, previous alerts and enrichments of the batch are prefetched with
+    one query each, Alert/AlertAudit/LastAlert rows are written in a single flush and
+    the batch is committed once. Per-alert results (startedAt, firing and unresolved
+    counters, firing start times) are the same as the per-alert path, including
+    alerts of the same fingerprint repeated in the batch.
+
+    Note: post-formatting extraction rules and mapping rules still enrich per alert,
+    mapping rules run after the batch is committed.
+    """
+    if not formatted_events:
+        return [], []
+
+    fingerprints = list({event.fingerprint for event in formatted_events})
+    last_alerts = get_last_alerts_by_fingerprints(
+        tenant_id, fingerprints, session=session, for_update=True
+    )
+    started_at_for_fingerprints = {
+        last_alert.fingerprint: last_alert.first_timestamp for last_alert in last_alerts
+    }
+
+    previous_alerts: dict[str, AlertDto] = {}
+    if KEEP_CALCULATE_START_FIRING_TIME_ENABLED and last_alerts:
+        previous_db_alerts = get_alerts_by_ids(
+            tenant_id,
+            [last_alert.alert_id for last_alert in last_alerts],
+            session=session,
+        )
+        previous_alerts = {
+            alert.fingerprint: alert
+            for alert in convert_db_alerts_to_dto_alerts(
+                previous_db_alerts, session=session
+            )
+        }
+
+    # Dispose enrichments that needs to be disposed
+    enrichments_by_fingerprint: dict[str, dict] = {}
+    try:
+        enrichments_by_fingerprint = enrichments_bl.dispose_enrichments_batch(
+            get_enrichments(tenant_id, fingerprints, session=session)
+        )
+    except Exception:
+        logger.exception(
+            "Failed to dispose enrichments",
+            extra={"tenant_id": tenant_id, "fingerprints": fingerprints},
+        )
+
+    saved_events = []
+    saved_alerts = []
+    audits = []
+    for formatted_event in formatted_events:
+        formatted_event.pushed = True
+
+        started_at = started_at_for_fingerprints.get(formatted_event.fingerprint, None)
+        if started_at:
+            formatted_event.startedAt = str(started_at)
+
+        if KEEP_CALCULATE_START_FIRING_TIME_ENABLED:
+            previous_alert = previous_alerts.get(formatted_event.fingerprint)
+            previous_alert = [previous_alert] if previous_alert else []
+            formatted_event.firingStartTime = calculated_start_firing_time(
+                formatted_event, previous_alert
+            )
+            formatted_event.firingStartTimeSinceLastResolved = (
+                calculate_firing_time_since_last_resolved(
+                    formatted_event, previous_alert
+                )
+            )
+            formatted_event.firingCounter = calculated_firing_counter(
+                formatted_event, previous_alert
+            )
+            formatted_event.unresolvedCounter = calculated_unresolved_counter(
+                formatted_event, previous_alert
+            )
+
+        # Post format enrichment
+        try:
+            formatted_event = enrichments_bl.run_extraction_rules(formatted_event)
+        except Exception:
+            logger.exception(
+                "Failed to run post-formatting extraction rules",
+                extra={
+                    "tenant_id": tenant_id,
+                    "fingerprint": formatted_event.fingerprint,
+                },
+            )
+
+        __validate_last_received(formatted_event)
+
+        alert_args = {
+            "tenant_id": tenant_id,
+            "provider_type": (
+                provider_type if provider_type else formatted_event.source[0]
+            ),
+            "event": formatted_event.dict(),
+            "provider_id": provider_id,
+            "fingerprint": formatted_event.fingerprint,
+            "alert_hash": formatted_event.alert_hash,
+        }
+        alert_args = sanitize_alert(alert_args)
+        if timestamp_forced is not None:
+            alert_args["timestamp"] = timestamp_forced
+
+        alert = Alert(**alert_args)
+        saved_alerts.append(alert)
+        formatted_event.event_id = str(alert.id)
+        saved_events.append(formatted_event)
+
+        if KEEP_AUDIT_EVENTS_ENABLED:
+            audits.append(
+                AlertAudit(
+                    tenant_id=tenant_id,
+                    fingerprint=formatted_event.fingerprint,
+                    action=(
+                        ActionType.AUTOMATIC_RESOLVE.value
+                        if formatted_event.status == AlertStatus.RESOLVED.value
+                        else ActionType.TIGGERED.value
+                    ),
+                    user_id="system",
+                    description=f"Alert recieved from provider with status {formatted_event.status}",
+                )
+            )
+
+        if KEEP_CALCULATE_START_FIRING_TIME_ENABLED:
+            # the next alert with the same fingerprint in this batch sees this one
+            #   (with its enrichments) as its previous alert, as if read from the db
+            previous_alerts[formatted_event.fingerprint] = AlertDto(
+                **{
+                    **alert_args["event"],
+                    **enrichments_by_fingerprint.get(formatted_event.fingerprint, {}),
+                }
+            )
+
+    session.add_all(saved_alerts)
+    session.add_all(audits)
+    # alerts first, LastAlert references them
+    session.flush()
+    set_last_alerts(tenant_id, saved_alerts, session=session, last_alerts=last_alerts)
+    session.commit()
+
+    # Mapping
+    for formatted_event in saved_events:
+        try:
+            enrichments_bl.run_mapping_rules(formatted_event)
+        except Exception:
+            logger.exception("Failed to run mapping rules")
+
+    alert_enrichments = {
+        alert_enrichment.alert_fingerprint: alert_enrichment
+        for alert_enrichment in get_enrichments(
+            tenant_id, fingerprints, session=session
+        )
+    }
+    enriched_formatted_events = []
+    for formatted_event in saved_events:
+        alert_enrichment = alert_enrichments.get(formatted_event.fingerprint)
+        if alert_enrichment:
+            for enrichment in alert_enrichment.enrichments:
+                # set the enrichment
+                value = alert_enrichment.enrichments[enrichment]
+                if isinstance(value, str):
+                    value = value.strip()
+                setattr(formatted_event, enrichment, value)
+        enriched_formatted_events.append(formatted_event)
+
+    return enriched_formatted_events, saved_alerts
+
+
 def __save_to_db(
     tenant_id,
     provider_type,
@@ -152,6 +497,8 @@ def __save_to_db(
                 session.add(alert)
 
         enrichments_bl = EnrichmentsBl(tenant_id, session)
+        # the enrichment events of the batch are written at once, after the alerts
+        enrichments_bl.buffer_enrichment_events()
         # add audit to the deduplicated events
         # TODO: move this to the alert deduplicator
         if KEEP_AUDIT_EVENTS_ENABLED:
@@ -176,133 +523,26 @@ def __save_to_db(
                     action_description="Alert lastReceived enriched on deduplication",
                 )
 
-        enriched_formatted_events = []
-        saved_alerts = []
-
-        fingerprints = [event.fingerprint for event in formatted_events]
-        started_at_for_fingerprints = get_started_at_for_alerts(
-            tenant_id, fingerprints, session=session
-        )
-
-        for formatted_event in formatted_events:
-            formatted_event.pushed = True
-
-            started_at = started_at_for_fingerprints.get(
-                formatted_event.fingerprint, None
+        if KEEP_BULK_SAVE_TO_DB_ENABLED:
+            enriched_formatted_events, saved_alerts = __bulk_save_formatted_events(
+                tenant_id,
+                provider_type,
+                session,
+                enrichments_bl,
+                formatted_events,
+                provider_id,
+                timestamp_forced,
             )
-            if started_at:
-                formatted_event.startedAt = str(started_at)
-
-            if KEEP_CALCULATE_START_FIRING_TIME_ENABLED:
-                # calculate startFiring time
-                previous_alert = get_alerts_by_fingerprint(
-                    tenant_id=tenant_id,
-                    fingerprint=formatted_event.fingerprint,
-                    limit=1,
-                )
-                previous_alert = convert_db_alerts_to_dto_alerts(previous_alert)
-                formatted_event.firingStartTime = calculated_start_firing_time(
-                    formatted_event, previous_alert
-                )
-                formatted_event.firingStartTimeSinceLastResolved = (
-                    calculate_firing_time_since_last_resolved(
-                        formatted_event, previous_alert
-                    )
-                )
-
-                # we now need to update the firing and unresolved counters
-                formatted_event.firingCounter = calculated_firing_counter(
-                    formatted_event, previous_alert
-                )
-
-                formatted_event.unresolvedCounter = calculated_unresolved_counter(
-                    formatted_event, previous_alert
-                )
-
-            # Dispose enrichments that needs to be disposed
-            try:
-                enrichments_bl.dispose_enrichments(formatted_event.fingerprint)
-            except Exception:
-                logger.exception(
-                    "Failed to dispose enrichments",
-                    extra={
-                        "tenant_id": tenant_id,
-                        "fingerprint": formatted_event.fingerprint,
-                    },
-                )
-
-            # Post format enrichment
-            try:
-                formatted_event = enrichments_bl.run_extraction_rules(formatted_event)
-            except Exception:
-                logger.exception(
-                    "Failed to run post-formatting extraction rules",
-                    extra={
-                        "tenant_id": tenant_id,
-                        "fingerprint": formatted_event.fingerprint,
-                    },
-                )
-
-            __validate_last_received(formatted_event)
-
-            alert_args = {
-                "tenant_id": tenant_id,
-                "provider_type": (
-                    provider_type if provider_type else formatted_event.source[0]
-                ),
-                "event": formatted_event.dict(),
-                "provider_id": provider_id,
-                "fingerprint": formatted_event.fingerprint,
-                "alert_hash": formatted_event.alert_hash,
-            }
-            alert_args = sanitize_alert(alert_args)
-            if timestamp_forced is not None:
-                alert_args["timestamp"] = timestamp_forced
-
-            alert = Alert(**alert_args)
-            session.add(alert)
-            session.flush()
-            saved_alerts.append(alert)
-            alert_id = alert.id
-            formatted_event.event_id = str(alert_id)
-
-            if KEEP_AUDIT_EVENTS_ENABLED:
-                audit = AlertAudit(
-                    tenant_id=tenant_id,
-                    fingerprint=formatted_event.fingerprint,
-                    action=(
-                        ActionType.AUTOMATIC_RESOLVE.value
-                        if formatted_event.status == AlertStatus.RESOLVED.value
-                        else ActionType.TIGGERED.value
-                    ),
-                    user_id="system",
-                    description=f"Alert recieved from provider with status {formatted_event.status}",
-                )
-                session.add(audit)
-
-            session.commit()
-            session.flush()
-            set_last_alert(tenant_id, alert, session=session)
-
-            # Mapping
-            try:
-                enrichments_bl.run_mapping_rules(formatted_event)
-            except Exception:
-                logger.exception("Failed to run mapping rules")
-
-            alert_enrichment = get_enrichment_with_session(
-                session=session,
-                tenant_id=tenant_id,
-                fingerprint=formatted_event.fingerprint,
+        else:
+            enriched_formatted_events, saved_alerts = __save_formatted_events(
+                tenant_id,
+                provider_type,
+                session,
+                enrichments_bl,
+                formatted_events,
+                provider_id,
+                timestamp_forced,
             )
-            if alert_enrichment:
-                for enrichment in alert_enrichment.enrichments:
-                    # set the enrichment
-                    value = alert_enrichment.enrichments[enrichment]
-                    if isinstance(value, str):
-                        value = value.strip()
-                    setattr(formatted_event, enrichment, value)
-            enriched_formatted_events.append(formatted_event)
 
         logger.info("Checking for incidents to resolve", extra={"tenant_id": tenant_id})
         try:
@@ -333,6 +573,7 @@ def __save_to_db(
                 extra={"tenant_id": tenant_id},
             )
         session.commit()
+        enrichments_bl.flush_enrichment_events()
 
         logger.info(
             "Added new alerts to the DB",
@@ -429,11 +670,10 @@ def __handle_formatted_events(
         last_alerts_fingerprint_to_hash = get_last_alert_hashes_by_fingerprints(
             tenant_id, [event.fingerprint for event in formatted_events]
         )
-        for event in formatted_events:
-            # apply_deduplication set alert_hash and isDuplicate on event
-            event = alert_deduplicator.apply_deduplication(
-                event, deduplication_rules, last_alerts_fingerprint_to_hash
-            )
+        # apply_deduplication_batch set alert_hash and isDuplicate on the events
+        alert_deduplicator.apply_deduplication_batch(
+            formatted_events, deduplication_rules, last_alerts_fingerprint_to_hash
+        )
 
         # filter out the deduplicated events
         deduplicated_events = list(
@@ -455,70 +695,94 @@ def __handle_formatted_events(
             provider_id,
             timestamp_forced,
         )
+        # the cached totals of the alerts/incidents lists and facets are stale now,
+        # in the API processes too (the invalidations are broadcast with Redis)
+        invalidate_query_counts_cache(tenant_id)
+        invalidate_alert_facets_cache(tenant_id)
+
+    if KEEP_TOPOLOGY_PROCESSOR_ENABLED:
+        # only the applications of these services will be recomputed
+        TopologyProcessor.publish_services_changed(
+            tenant_id, [event.service for event in enriched_formatted_events]
+        )
 
     # let's save all fields to the DB so that we can use them in the future such in deduplication fields suggestions
     # todo: also use it on correlation rules suggestions
     if KEEP_ALERT_FIELDS_ENABLED:
         with tracer.start_as_current_span("process_event_bulk_upsert_alert_fields"):
+            fields = set()
             for enriched_formatted_event in enriched_formatted_events:
-                logger.debug(
-                    "Bulk upserting alert fields",
-                    extra={
-                        "alert_event_id": enriched_formatted_event.event_id,
-                        "alert_fingerprint": enriched_formatted_event.fingerprint,
-                    },
-                )
-                fields = []
                 for key, value in enriched_formatted_event.dict().items():
                     if isinstance(value, dict):
-                        for nested_key in value.keys():
-                            fields.append(f"{key}.{nested_key}")
+                        field_names = [f"{key}.{nested_key}" for nested_key in value]
                     else:
-                        fields.append(key)
+                        field_names = [key]
+                    fields.update(
+                        (
+                            field_name,
+                            enriched_formatted_event.providerId,
+                            enriched_formatted_event.providerType,
+                        )
+                        for field_name in field_names
+                    )
 
-                bulk_upsert_alert_fields(
-                    tenant_id=tenant_id,
-                    fields=fields,
-                    provider_id=enriched_formatted_event.providerId,
-                    provider_type=enriched_formatted_event.providerType,
-                    session=session,
+            # only the fields not upserted yet, in one statement for the batch
+            try:
+                upserted_fields_count = upsert_new_alert_fields(
+                    tenant_id=tenant_id, fields=fields, session=session
                 )
-
                 logger.debug(
                     "Bulk upserted alert fields",
                     extra={
-                        "alert_event_id": enriched_formatted_event.event_id,
-                        "alert_fingerprint": enriched_formatted_event.fingerprint,
+                        "tenant_id": tenant_id,
+                        "upserted_fields_count": upserted_fields_count,
                     },
                 )
+            except Exception:
+                # the alerts are saved already, the fields are upserted next time
+                logger.exception(
+                    "Failed to upsert alert fields", extra={"tenant_id": tenant_id}
+                )
 
     # after the alert enriched and mapped, lets send it to the elasticsearch
     with tracer.start_as_current_span("process_event_push_to_elasticsearch"):
         elastic_client = ElasticClient(tenant_id=tenant_id)
-        if elastic_client.enabled:
+        if elastic_client.enabled and enriched_formatted_events:
+            # the last version of every alert, indexed with one bulk request
+            documents = {}
             for alert in enriched_formatted_events:
                 try:
-                    logger.debug(
-                        "Pushing alert to elasticsearch",
-                        extra={
-                            "alert_event_id": alert.event_id,
-                            "alert_fingerprint": alert.fingerprint,
-                        },
-                    )
-                    elastic_client.index_alert(
-                        alert=alert,
+                    documents[alert.fingerprint] = elastic_client.alert_to_document(
+                        alert
                     )
                 except Exception:
                     logger.exception(
-                        "Failed to push alerts to elasticsearch",
+                        "Failed to convert alert to elasticsearch document",
                         extra={
-                            "provider_type": provider_type,
-                            "num_of_alerts": len(formatted_events),
-                            "provider_id": provider_id,
+                            "alert_event_id": alert.event_id,
+                            "alert_fingerprint": alert.fingerprint,
                             "tenant_id": tenant_id,
                         },
                     )
-                    continue
+            try:
+                logger.debug(
+                    "Pushing alerts to elasticsearch",
+                    extra={"num_of_alerts": len(documents), "tenant_id": tenant_id},
+                )
+                if KEEP_ELASTIC_BULK_FLUSHER_ENABLED:
+                    ElasticBulkFlusher.get_instance().add(tenant_id, documents)
+                else:
+                    elastic_client.bulk_index_documents(documents)
+            except Exception:
+                logger.exception(
+                    "Failed to push alerts to elasticsearch",
+                    extra={
+                        "provider_type": provider_type,
+                        "num_of_alerts": len(formatted_events),
+                        "provider_id": provider_id,
+                        "tenant_id": tenant_id,
+                    },
+                )
 
     with tracer.start_as_current_span("process_event_push_to_workflows"):
         try:
@@ -595,18 +859,12 @@ def __handle_formatted_events(
         # send with pusher
 
         try:
-            presets = get_all_presets_dtos(tenant_id)
+            presets = get_all_presets_dtos_cached(tenant_id)
             rules_engine = RulesEngine(tenant_id=tenant_id)
-            presets_do_update = []
-            for preset_dto in presets:
-                # filter the alerts based on the search query
-                filtered_alerts = rules_engine.filter_alerts(
-                    enriched_formatted_events, preset_dto.cel_query
-                )
-                # if not related alerts, no need to update
-                if not filtered_alerts:
-                    continue
-                presets_do_update.append(preset_dto)
+            # if not related alerts, no need to update
+            presets_do_update = rules_engine.match_presets(
+                enriched_formatted_events, presets
+            )
             if pusher_cache.should_notify(tenant_id, "poll-presets"):
                 try:
                     pusher_client.trigger(
@@ -645,6 +903,7 @@ def process_event(
     ),  # the event to process, either plain (generic) or from a specific provider
     notify_client: bool = True,
     timestamp_forced: datetime.datetime | None = None,
+    raise_on_error: bool = False,  # raise instead of saving error alerts and retrying
 ) -> list[Alert]:
     start_time = time.time()
     job_id = ctx.get("job_id")
@@ -667,6 +926,8 @@ def process_event(
 
     raw_event = copy.deepcopy(event)
     events_in_counter.inc()
+    # from here on the events may have been (partially) written
+    handling_events = False
     try:
         with tracer.start_as_current_span("process_event_get_db_session"):
             # Create a session to be used across the processing task
@@ -675,10 +936,15 @@ def process_event(
         # Pre alert formatting extraction rules
         with tracer.start_as_current_span("process_event_pre_alert_formatting"):
             enrichments_bl = EnrichmentsBl(tenant_id, session)
+            enrichments_bl.buffer_enrichment_events()
             try:
-                event = enrichments_bl.run_extraction_rules(event, pre=True)
+                if isinstance(event, list):
+                    event = enrichments_bl.run_extraction_rules_batch(event, pre=True)
+                else:
+                    event = enrichments_bl.run_extraction_rules(event, pre=True)
             except Exception:
                 logger.exception("Failed to run pre-formatting extraction rules")
+            enrichments_bl.flush_enrichment_events()
 
         with tracer.start_as_current_span("process_event_provider_formatting"):
             if (
@@ -696,14 +962,17 @@ def process_event(
                     event_list = []
                     for event_item in event:
                         if not isinstance(event_item, AlertDto):
-                            event_list.append(
-                                provider_class.format_alert(
-                                    tenant_id=tenant_id,
-                                    event=event_item,
-                                    provider_id=provider_id,
-                                    provider_type=provider_type,
-                                )
+                            formatted_event_item = provider_class.format_alert(
+                                tenant_id=tenant_id,
+                                event=event_item,
+                                provider_id=provider_id,
+                                provider_type=provider_type,
                             )
+                            # a single event may be formatted into several alerts
+                            if isinstance(formatted_event_item, list):
+                                event_list.extend(formatted_event_item)
+                            elif formatted_event_item is not None:
+                                event_list.append(formatted_event_item)
                         else:
                             event_list.append(event_item)
                     event = event_list
@@ -752,6 +1021,7 @@ def process_event(
             with tracer.start_as_current_span("process_event_internal_preparation"):
                 __internal_prepartion(event, fingerprint, api_key_name)
 
+            handling_events = True
             formatted_events = __handle_formatted_events(
                 tenant_id,
                 provider_type,
@@ -771,7 +1041,11 @@ def process_event(
             )
             events_out_counter.inc()
             return formatted_events
-    except Exception:
+    except Exception as e:
+        if raise_on_error:
+            if not handling_events:
+                raise EventsNotSavedException(str(e)) from e
+            raise
         stacktrace = traceback.format_exc()
         tb = traceback.extract_tb(sys.exc_info()[2])
 
@@ -0,0 +1,189 @@
+import logging
+import os
+from datetime import datetime
+
+from keep.api.consts import PROVIDER_PULL_INTERVAL_MINUTE
+from keep.api.core.db import update_provider_last_pull_time
+from keep.api.tasks.process_event_task import process_event
+from keep.api.tasks.process_incident_task import process_incident
+from keep.api.tasks.process_topology_task import process_topology
+from keep.providers.base.base_provider import BaseIncidentProvider, BaseTopologyProvider
+from keep.providers.providers_factory import ProvidersFactory
+
+logger = logging.getLogger(__name__)
+
+
+def is_pull_data_enabled() -> bool:
+    return os.environ.get("KEEP_PULL_DATA_ENABLED", "true") == "true"
+
+
+# SHAHAR: this function runs as background tasks as a seperate thread
+#         DO NOT ADD async HERE as it will run in the main thread and block the whole server
+def pull_data_from_providers(
+    tenant_id: str,
+    trace_id: str,
+):
+    """
+    Pulls alerts from the providers of the tenant that weren't pulled in the last
+    KEEP_PULL_INTERVAL minutes and record them to the DB.
+
+    Only used when the providers pull scheduler is disabled (KEEP_PULL_SCHEDULER),
+    the scheduler pulls the due providers of all tenants on its own.
+    """
+    if not is_pull_data_enabled():
+        logger.debug("Pull data from providers is disabled")
+        return
+
+    providers = ProvidersFactory.get_installed_providers(
+        tenant_id=tenant_id, include_details=False
+    )
+
+    logger.info(
+        "Pulling data from providers",
+        extra={
+            "tenant_id": tenant_id,
+            "trace_id": trace_id,
+            "providers_len": len(providers),
+        },
+    )
+
+    for provider in providers:
+        extra = {
+            "provider_type": provider.type,
+            "provider_id": provider.id,
+            "tenant_id": tenant_id,
+            "trace_id": trace_id,
+        }
+
+        if not provider.pulling_enabled:
+            logger.debug("Pulling is disabled for this provider", extra=extra)
+            continue
+
+        if provider.last_pull_time is not None:
+            now = datetime.now()
+            minutes_passed = (now - provider.last_pull_time).total_seconds() / 60
+            if minutes_passed <= PROVIDER_PULL_INTERVAL_MINUTE:
+                logger.info(
+                    "Skipping provider data pulling since not enough time has passed",
+                    extra={
+                        **extra,
+                        "minutes_passed": minutes_passed,
+                        "provider_last_pull_time": str(provider.last_pull_time),
+                    },
+                )
+                continue
+
+        pull_data_from_provider(tenant_id, provider.id, provider.type, trace_id)
+
+    logger.info(
+        "Pulling data from providers completed",
+        extra={
+            "tenant_id": tenant_id,
+            "trace_id": trace_id,
+            "providers_len": len(providers),
+        },
+    )
+
+
+def pull_data_from_provider(
+    tenant_id: str,
+    provider_id: str,
+    provider_type: str,
+    trace_id: str,
+):
+    """
+    Pulls the alerts, incidents and topology of a provider and record them to the DB.
+    """
+    extra = {
+        "provider_type": provider_type,
+        "provider_id": provider_id,
+        "tenant_id": tenant_id,
+        "trace_id": trace_id,
+    }
+    try:
+        logger.info(
+            f"Pulling alerts from provider {provider_type} ({provider_id})",
+            extra=extra,
+        )
+        # Even if we failed at processing some event, lets save the last pull time to not iterate this process over and over again.
+        update_provider_last_pull_time(tenant_id=tenant_id, provider_id=provider_id)
+
+        provider_class = ProvidersFactory.get_installed_provider(
+            tenant_id=tenant_id,
+            provider_id=provider_id,
+            provider_type=provider_type,
+        )
+        sorted_provider_alerts_by_fingerprint = (
+            provider_class.get_alerts_by_fingerprint(tenant_id=tenant_id)
+        )
+        logger.info(
+            f"Pulling alerts from provider {provider_type} ({provider_id}) completed",
+            extra=extra,
+        )
+
+        # TODO: this should be moved somewhere else (@tb: too much logic in this function, wil handle it another time.)
+        if isinstance(provider_class, BaseIncidentProvider):
+            try:
+                incidents = provider_class.get_incidents()
+                process_incident(
+                    {},
+                    tenant_id=tenant_id,
+                    provider_id=provider_id,
+                    provider_type=provider_type,
+                    incidents=incidents,
+                    trace_id=trace_id,
+                )
+            except NotImplementedError:
+                logger.debug(
+                    f"Provider {provider_type} ({provider_id}) does not implement pulling incidents",
+                    extra=extra,
+                )
+            except Exception:
+                logger.exception(
+                    f"Unknown error pulling incidents from provider {provider_type} ({provider_id})",
+                    extra={**extra, "trace_id": trace_id},
+                )
+        else:
+            logger.debug(
+                f"Provider {provider_type} ({provider_id}) does not implement pulling incidents",
+                extra=extra,
+            )
+
+        try:
+            if isinstance(provider_class, BaseTopologyProvider):
+                logger.info("Pulling topology data", extra=extra)
+                topology_data, _ = provider_class.pull_topology()
+                logger.info(
+                    "Pulling topology data finished, processing",
+                    extra={**extra, "topology_length": len(topology_data)},
+                )
+                process_topology(tenant_id, topology_data, provider_id, provider_type)
+                logger.info("Finished processing topology data", extra=extra)
+        except NotImplementedError:
+            logger.debug(
+                f"Provider {provider_type} ({provider_id}) does not implement pulling topology data",
+                extra=extra,
+            )
+        except Exception as e:
+            logger.exception(
+                f"Unknown error pulling topology from provider {provider_type} ({provider_id})",
+                extra={**extra, "exception": str(e)},
+            )
+
+        for fingerprint, alert in sorted_provider_alerts_by_fingerprint.items():
+            process_event(
+                {},
+                tenant_id,
+                provider_type,
+                provider_id,
+                fingerprint,
+                None,
+                trace_id,
+                alert,
+                notify_client=False,
+            )
+    except Exception as e:
+        logger.exception(
+            f"Unknown error pulling from provider {provider_type} ({provider_id})",
+            extra={**extra, "exception": str(e)},
+        )
@@ -13,6 +13,7 @@ from keep.api.models.db.topology import (
     TopologyServiceInDto,
 )
 from keep.topologies.topologies_service import TopologiesService
+from keep.topologies.topology_index import invalidate_topology_index
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +123,7 @@ def process_topology(
             )
 
     session.commit()
+    invalidate_topology_index(tenant_id)
 
     # Now create or update the application
     for application_id in application_to_services:
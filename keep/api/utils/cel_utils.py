@@ -1,7 +1,20 @@
 import re
 
+import celpy
+
+from keep.api.core.cache import TenantCache
+from keep.api.core.config import config
 from keep.api.models.alert import AlertSeverity
 
+# Compiled CEL programs, keyed by the (already preprocessed) expression text.
+# Compiling a CEL expression means a full lark parse, which is by far the most
+# expensive part of evaluating it, so programs are compiled once and reused.
+cel_program_cache = TenantCache(
+    "cel_programs",
+    max_size=config("KEEP_CEL_PROGRAM_CACHE_SIZE", default=4096, cast=int),
+)
+_cel_env = celpy.Environment()
+
 
 def preprocess_cel_expression(cel_expression: str) -> str:
     """Preprocess CEL expressions to replace string-based comparisons with numeric values where applicable."""
@@ -41,3 +54,29 @@ def preprocess_cel_expression(cel_expression: str) -> str:
     )
 
     return modified_expression
+
+
+def get_cel_program(tenant_id: str, cel_expression: str) -> celpy.Runner:
+    """Return the compiled program of a CEL expression, compiling it on first use.
+
+    Args:
+        tenant_id (str): the tenant the expression belongs to
+        cel_expression (str): the CEL expression, exactly as it should be compiled
+
+    Returns:
+        celpy.Runner: the compiled program
+
+    Raises:
+        celpy.CELParseError: if the expression cannot be compiled (errors are not cached)
+    """
+
+    def _compile():
+        ast = _cel_env.compile(cel_expression)
+        return _cel_env.program(ast)
+
+    return cel_program_cache.get_or_set(tenant_id, cel_expression, _compile)
+
+
+def invalidate_cel_programs(tenant_id: str) -> None:
+    """Drop all the compiled CEL programs of a tenant."""
+    cel_program_cache.invalidate(tenant_id)
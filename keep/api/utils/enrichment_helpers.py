@@ -195,6 +195,8 @@ def convert_db_alerts_to_dto_alerts(
     """
     with existed_or_new_session(session) as session:
         alerts_dto = []
+        # alerts of the same incident share its IncidentDto
+        incidents_dto = {}
         with tracer.start_as_current_span("alerts_enrichment"):
             # enrich the alerts with the enrichment data
             for _object in alerts:
@@ -218,17 +220,23 @@ def convert_db_alerts_to_dto_alerts(
                         alert.event["incident"] = ",".join(
                             str(incident.id) for incident in alert._incidents
                         )
-                        alert.event["incident_dto"] = [
-                            IncidentDto.from_db_incident(incident)
-                            for incident in alert._incidents
-                        ]
+                        alert.event["incident_dto"] = []
+                        for incident in alert._incidents:
+                            if incident.id not in incidents_dto:
+                                incidents_dto[incident.id] = (
+                                    IncidentDto.from_db_incident(incident)
+                                )
+                            alert.event["incident_dto"].append(
+                                incidents_dto[incident.id]
+                            )
                 try:
                     if alert_to_incident is not None:
                         alert_dto = AlertWithIncidentLinkMetadataDto.from_db_instance(
                             alert, alert_to_incident
                         )
                     else:
-                        alert_dto = AlertDto(**alert.event)
+                        # the event was validated when the alert was ingested
+                        alert_dto = AlertDto.from_trusted(alert.event)
 
                     if enrichments:
                         parse_and_enrich_deleted_and_assignees(alert_dto, enrichments)
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 from pydantic import BaseModel
 
@@ -18,6 +18,10 @@ class PaginatedResultsDto(BaseModel):
 
 class IncidentsPaginatedResultsDto(PaginatedResultsDto):
     items: list[IncidentDto]
+    # set in cursor mode when there may be a next page
+    next_cursor: Optional[str] = None
+    # exact, cached or estimated, see keep.api.core.query_count
+    count_strategy: Optional[str] = None
 
 
 class AlertPaginatedResultsDto(PaginatedResultsDto):
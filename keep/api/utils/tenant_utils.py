@@ -10,6 +10,7 @@ from google.api_core.exceptions import InvalidArgument as GoogleAPIInvalidArgume
 from keep.api.core.config import config
 from keep.api.models.db.tenant import TenantApiKey
 from keep.contextmanager.contextmanager import ContextManager
+from keep.identitymanager.api_key_cache import invalidate_api_keys
 from keep.identitymanager.rbac import Admin as AdminRole
 from keep.identitymanager.rbac import Role
 from keep.identitymanager.rbac import Webhook as WebhookRole
@@ -89,10 +90,12 @@ def update_api_key_internal(
         )
 
         # Update API key hash in DB
+        previous_key_hash = tenant_api_key_entry.key_hash
         tenant_api_key_entry.key_hash = hashlib.sha256(
             api_key.encode("utf-8")
         ).hexdigest()
         session.commit()
+        invalidate_api_keys(previous_key_hash)
 
         return api_key
 
@@ -0,0 +1,123 @@
+"""
+Cache of the API keys verified on every request, by key hash.
+
+Unknown keys are cached too (for a shorter time), so a webhook sending a wrong
+key doesn't hit the db on every event. The API key routes invalidate the hashes
+they rotate or revoke in this process and, when Redis is configured, in the
+other processes through a Redis pub/sub channel.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+from keep.api.consts import REDIS
+from keep.api.core.cache import TenantCache
+from keep.api.core.config import config
+from keep.api.core.db import get_api_key_by_hash
+from keep.api.models.db.tenant import TenantApiKey
+
+logger = logging.getLogger(__name__)
+
+API_KEYS_CACHE_TTL = config("KEEP_API_KEYS_CACHE_TTL", default=60, cast=int)
+API_KEYS_NEGATIVE_CACHE_TTL = config(
+    "KEEP_API_KEYS_NEGATIVE_CACHE_TTL", default=10, cast=int
+)
+INVALIDATION_CHANNEL = "keep:api-keys:invalidate"
+
+# keys are resolved before their tenant is known, so they share one partition
+_PARTITION = "*"
+_NOT_CACHED = object()
+
+api_keys_cache = TenantCache(
+    "api_keys",
+    max_size=config("KEEP_API_KEYS_CACHE_SIZE", default=10000, cast=int),
+    ttl=API_KEYS_CACHE_TTL,
+)
+
+_subscriber_lock = threading.Lock()
+_subscriber_started = False
+
+
+def hash_api_key(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def get_cached_api_key(api_key: str) -> Optional[TenantApiKey]:
+    """
+    Same as keep.api.core.db.get_api_key, served from the cache.
+
+    The returned TenantApiKey is shared between requests and must not be modified.
+    """
+    if REDIS:
+        _start_invalidation_subscriber()
+
+    key_hash = hash_api_key(api_key)
+    tenant_api_key = api_keys_cache.get(_PARTITION, key_hash, default=_NOT_CACHED)
+    if tenant_api_key is not _NOT_CACHED:
+        return tenant_api_key
+
+    tenant_api_key = get_api_key_by_hash(key_hash)
+    api_keys_cache.set(
+        _PARTITION,
+        key_hash,
+        tenant_api_key,
+        ttl=None if tenant_api_key else API_KEYS_NEGATIVE_CACHE_TTL,
+    )
+    return tenant_api_key
+
+
+def invalidate_api_keys(*key_hashes: str):
+    """Drop the keys with these hashes from the cache of every process."""
+    _invalidate_locally(key_hashes)
+    if not REDIS:
+        return
+    try:
+        from keep.api.redis_settings import get_redis_client
+
+        get_redis_client().publish(INVALIDATION_CHANNEL, json.dumps(key_hashes))
+    except Exception:
+        logger.exception(
+            "Failed to publish API keys invalidation, other processes will "
+            "catch up when the cached keys expire"
+        )
+
+
+def _invalidate_locally(key_hashes):
+    for key_hash in key_hashes:
+        api_keys_cache.invalidate(_PARTITION, key_hash)
+
+
+def _start_invalidation_subscriber():
+    global _subscriber_started
+    if _subscriber_started:
+        return
+    with _subscriber_lock:
+        if _subscriber_started:
+            return
+        threading.Thread(
+            target=_listen_for_invalidations,
+            name="api-keys-invalidation",
+            daemon=True,
+        ).start()
+        _subscriber_started = True
+
+
+def _listen_for_invalidations():
+    from keep.api.redis_settings import get_redis_client
+
+    while True:
+        try:
+            pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            # invalidations may have been missed while not subscribed
+            api_keys_cache.invalidate(_PARTITION)
+            for message in pubsub.listen():
+                if message.get("type") == "message":
+                    _invalidate_locally(json.loads(message["data"]))
+        except Exception:
+            logger.exception("API keys invalidation subscriber failed, retrying")
+            time.sleep(5)
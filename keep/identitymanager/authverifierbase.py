@@ -12,8 +12,9 @@ from fastapi.security import (
 from starlette.datastructures import FormData
 
 from keep.api.core.config import config
-from keep.api.core.db import get_api_key, update_key_last_used
+from keep.api.core.db import update_key_last_used
 from keep.api.core.dependencies import extract_generic_body
+from keep.identitymanager.api_key_cache import get_cached_api_key
 from keep.identitymanager.authenticatedentity import AuthenticatedEntity
 from keep.identitymanager.rbac import Admin as AdminRole
 from keep.identitymanager.rbac import get_role_by_role_name
@@ -333,7 +334,7 @@ class AuthVerifierBase:
             HTTPException: If the API key is invalid.
         """
         self.logger.debug("Verifying API key")
-        tenant_api_key = get_api_key(api_key)
+        tenant_api_key = get_cached_api_key(api_key)
         if not tenant_api_key:
             self.logger.warning("Invalid API Key")
             raise HTTPException(status_code=401, detail="Invalid API Key")
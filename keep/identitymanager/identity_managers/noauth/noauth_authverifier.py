@@ -4,8 +4,8 @@ from typing import Optional
 from fastapi import Request
 from fastapi.security import HTTPAuthorizationCredentials
 
-from keep.api.core.db import get_api_key
 from keep.api.core.dependencies import SINGLE_TENANT_EMAIL, SINGLE_TENANT_UUID
+from keep.identitymanager.api_key_cache import get_cached_api_key
 from keep.identitymanager.authenticatedentity import AuthenticatedEntity
 from keep.identitymanager.authverifierbase import AuthVerifierBase
 from keep.identitymanager.rbac import Admin as AdminRole
@@ -48,7 +48,7 @@ class NoAuthVerifier(AuthVerifierBase):
         authorization: Optional[HTTPAuthorizationCredentials],
     ) -> AuthenticatedEntity:
 
-        tenant_api_key = get_api_key(api_key)
+        tenant_api_key = get_cached_api_key(api_key)
         # this is ok, since we are in noauth mode
         if not tenant_api_key:
             return AuthenticatedEntity(
@@ -22,6 +22,8 @@ import requests
 from dateutil.parser import parse
 
 from keep.api.bl.enrichments_bl import EnrichmentsBl
+from keep.api.core.cache import TenantCache
+from keep.api.core.config import config
 from keep.api.core.db import (
     get_custom_deduplication_rule,
     get_enrichments,
@@ -35,6 +37,7 @@ from keep.api.models.db.topology import TopologyServiceInDto
 from keep.api.models.incident import IncidentDto
 from keep.api.utils.enrichment_helpers import parse_and_enrich_deleted_and_assignees
 from keep.contextmanager.contextmanager import ContextManager
+from keep.iohandler.iohandler import IOHandler
 from keep.providers.models.provider_config import ProviderConfig, ProviderScope
 from keep.providers.models.provider_method import ProviderMethod
 
@@ -43,6 +46,21 @@ tracer = trace.get_tracer(__name__)
 SPAMMY_ALERTS_THRESHOLD_HOURS = 1
 SPAMMY_ALERTS_THRESHOLD = datetime.timedelta(hours=SPAMMY_ALERTS_THRESHOLD_HOURS)
 
+# Installed provider instances (None for linked or missing providers) and custom
+# deduplication rules used by format_alert, keyed by (kind, provider_id, provider_type).
+# Invalidated by the providers and deduplication rules CRUD, in the arq workers too
+# as the invalidations are broadcast. The TTL covers a lost invalidation.
+format_alert_cache = TenantCache(
+    "format_alert_providers",
+    max_size=config("KEEP_FORMAT_ALERT_CACHE_SIZE", default=4096, cast=int),
+    ttl=config("KEEP_FORMAT_ALERT_CACHE_TTL", default=60, cast=int),
+    broadcast_invalidations=True,
+)
+
+
+def invalidate_format_alert_cache(tenant_id: str):
+    format_alert_cache.invalidate(tenant_id)
+
 
 class BaseProvider(metaclass=abc.ABCMeta):
     OAUTH2_URL = None
@@ -146,6 +164,25 @@ class BaseProvider(metaclass=abc.ABCMeta):
         )
         return name_with_spaces.replace(" ", ".")
 
+    def with_context(self, context_manager: ContextManager) -> "BaseProvider":
+        """
+        Return a shallow copy of the provider bound to another context manager.
+
+        Used to reuse an already initialized provider (config, clients) in a new
+        workflow execution without sharing its per-execution state.
+        """
+        provider = copy.copy(self)
+        provider.context_manager = context_manager
+        provider.results = []
+        provider.step_id = None
+        # some providers (e.g. keep, bash, python) render with their own io handler
+        if hasattr(self, "io_handler"):
+            provider.io_handler = IOHandler(context_manager)
+        if isinstance(self.logger, ProviderLoggerAdapter):
+            provider.logger = copy.copy(self.logger)
+            provider.logger.provider_instance = provider
+        return provider
+
     @abc.abstractmethod
     def dispose(self):
         """
@@ -431,20 +468,14 @@ class BaseProvider(metaclass=abc.ABCMeta):
         provider_instance: BaseProvider | None = None
         if provider_id and provider_type and tenant_id:
             try:
-                if is_linked_provider(tenant_id, provider_id):
-                    logger.debug(
-                        "Provider is linked, skipping loading provider instance"
-                    )
-                    provider_instance = None
-                else:
-                    # To prevent circular imports
-                    from keep.providers.providers_factory import ProvidersFactory
-
-                    provider_instance: BaseProvider = (
-                        ProvidersFactory.get_installed_provider(
-                            tenant_id, provider_id, provider_type
-                        )
-                    )
+                # failures are not cached, the next payload will try again
+                provider_instance = format_alert_cache.get_or_set(
+                    tenant_id,
+                    ("provider", provider_id, provider_type),
+                    lambda: cls._get_format_alert_provider(
+                        tenant_id, provider_type, provider_id
+                    ),
+                )
             except Exception:
                 logger.exception(
                     "Failed loading provider instance although all parameters were given",
@@ -464,10 +495,14 @@ class BaseProvider(metaclass=abc.ABCMeta):
         logger.debug("Alert formatted")
         # after the provider calculated the default fingerprint
         #   check if there is a custom deduplication rule and apply
-        custom_deduplication_rule = get_custom_deduplication_rule(
-            tenant_id=tenant_id,
-            provider_id=provider_id,
-            provider_type=provider_type,
+        custom_deduplication_rule = format_alert_cache.get_or_set(
+            tenant_id,
+            ("deduplication_rule", provider_id, provider_type),
+            lambda: get_custom_deduplication_rule(
+                tenant_id=tenant_id,
+                provider_id=provider_id,
+                provider_type=provider_type,
+            ),
         )
 
         if not isinstance(formatted_alert, list):
@@ -499,6 +534,22 @@ class BaseProvider(metaclass=abc.ABCMeta):
             )
         return formatted_alert
 
+    @staticmethod
+    def _get_format_alert_provider(
+        tenant_id: str, provider_type: str, provider_id: str
+    ) -> Optional["BaseProvider"]:
+        if is_linked_provider(tenant_id, provider_id):
+            logging.getLogger(__name__).debug(
+                "Provider is linked, skipping loading provider instance"
+            )
+            return None
+        # To prevent circular imports
+        from keep.providers.providers_factory import ProvidersFactory
+
+        return ProvidersFactory.get_installed_provider(
+            tenant_id, provider_id, provider_type
+        )
+
     @staticmethod
     def get_alert_fingerprint(alert: AlertDto, fingerprint_fields: list = []) -> str:
         """
@@ -483,6 +483,12 @@ class ProvidersFactory:
         providers = []
         context_manager = ContextManager(tenant_id=tenant_id)
         secret_manager = SecretManagerFactory.get_secret_manager(context_manager)
+        providers_secrets = {}
+        if include_details:
+            # resolved in a batch instead of a round trip per provider
+            providers_secrets = secret_manager.read_secrets(
+                [p.configuration_key for p in installed_providers], is_json=True
+            )
         for p in installed_providers:
             provider: Provider | None = next(
                 filter(
@@ -506,11 +512,9 @@ class ProvidersFactory:
             try:
                 provider_auth = {"name": p.name}
                 if include_details:
-                    provider_auth.update(
-                        secret_manager.read_secret(
-                            secret_name=p.configuration_key, is_json=True
-                        )
-                    )
+                    if p.configuration_key not in providers_secrets:
+                        raise KeyError(f"secret {p.configuration_key} not found")
+                    provider_auth.update(providers_secrets[p.configuration_key])
                 if READ_ONLY_MODE and not override_readonly:
                     if "authentication" in provider_auth:
                         provider_auth["authentication"] = {
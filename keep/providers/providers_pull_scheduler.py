@@ -0,0 +1,193 @@
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set, Tuple
+
+from keep.api.consts import KEEP_PULL_SCHEDULER_ENABLED, PROVIDER_PULL_INTERVAL_MINUTE
+from keep.api.core.config import config
+from keep.api.core.db import get_provider_by_type_and_id, get_pulling_providers
+from keep.api.tasks.process_pull_task import (
+    is_pull_data_enabled,
+    pull_data_from_provider,
+)
+
+ProviderKey = Tuple[str, str, str]  # tenant_id, provider_id, provider_type
+
+
+class ProvidersPullScheduler:
+    """
+    Pulls the providers of all the tenants every KEEP_PULL_INTERVAL minutes.
+
+    The next pull time of each provider is kept in memory and the installed providers
+    are reloaded from the db every KEEP_PULL_SCHEDULER_REFRESH_INTERVAL seconds (without
+    their secrets), the due providers are pulled concurrently by a bounded pool.
+    """
+
+    @staticmethod
+    def get_instance() -> "ProvidersPullScheduler":
+        if not hasattr(ProvidersPullScheduler, "_instance"):
+            ProvidersPullScheduler._instance = ProvidersPullScheduler()
+        return ProvidersPullScheduler._instance
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.started = False
+        self.thread = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._next_pull_times: Dict[ProviderKey, datetime] = {}
+        self._pulling: Set[ProviderKey] = set()
+        self._last_refresh_time: Optional[datetime] = None
+        self.enabled = KEEP_PULL_SCHEDULER_ENABLED and is_pull_data_enabled()
+        # Configuration
+        self.pull_interval = timedelta(minutes=PROVIDER_PULL_INTERVAL_MINUTE)
+        self.check_interval = config(
+            "KEEP_PULL_SCHEDULER_INTERVAL", cast=int, default=10
+        )  # seconds
+        self.refresh_interval = config(
+            "KEEP_PULL_SCHEDULER_REFRESH_INTERVAL", cast=int, default=60
+        )  # seconds
+        self.max_workers = config(
+            "KEEP_PULL_SCHEDULER_MAX_WORKERS", cast=int, default=4
+        )
+
+    async def start(self):
+        """Runs the providers pull scheduler in server mode"""
+        if not self.enabled:
+            self.logger.info("Providers pull scheduler is disabled")
+            return
+
+        if self.started:
+            self.logger.info("Providers pull scheduler already started")
+            return
+
+        self.logger.info("Starting providers pull scheduler")
+        self._stop_event.clear()
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="providers-pull"
+        )
+        self.thread = threading.Thread(
+            target=self._start_scheduling, name="providers-pull-scheduler", daemon=True
+        )
+        self.thread.start()
+        self.started = True
+        self.logger.info("Started providers pull scheduler")
+
+    def stop(self):
+        """Stops the providers pull scheduler, running pulls are not waited for"""
+        if not self.started:
+            return
+
+        self.logger.info("Stopping providers pull scheduler")
+        self._stop_event.set()
+
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=30)
+            if self.thread.is_alive():
+                self.logger.warning(
+                    "Providers pull scheduler thread did not stop gracefully"
+                )
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+        self.started = False
+        self.thread = None
+        self.executor = None
+        self.logger.info("Stopped providers pull scheduler")
+
+    def _start_scheduling(self):
+        while not self._stop_event.is_set():
+            try:
+                now = datetime.now(tz=timezone.utc)
+                if (
+                    self._last_refresh_time is None
+                    or now - self._last_refresh_time
+                    >= (timedelta(seconds=self.refresh_interval))
+                ):
+                    self._refresh_providers()
+                    self._last_refresh_time = now
+                self._pull_due_providers(now)
+            except Exception as e:
+                self.logger.exception("Error in providers pull scheduling: %s", str(e))
+
+            # Wait for the next check or until stopped
+            self._stop_event.wait(self.check_interval)
+
+        self.logger.info("Providers pull scheduling stopped")
+
+    def _next_pull_time(self, last_pull_time: Optional[datetime]) -> datetime:
+        if last_pull_time is None:
+            return datetime.min.replace(tzinfo=timezone.utc)
+        # the last pull time is saved in UTC
+        if last_pull_time.tzinfo is None:
+            last_pull_time = last_pull_time.replace(tzinfo=timezone.utc)
+        return last_pull_time + self.pull_interval
+
+    def _refresh_providers(self):
+        """Reload the providers to pull and their last pull time (they may have been
+        pulled by another process)"""
+        providers = get_pulling_providers()
+        with self._lock:
+            self._next_pull_times = {
+                (provider.tenant_id, provider.id, provider.type): self._next_pull_time(
+                    provider.last_pull_time
+                )
+                for provider in providers
+            }
+        self.logger.debug(
+            "Refreshed providers to pull", extra={"providers_len": len(providers)}
+        )
+
+    def _pull_due_providers(self, now: datetime):
+        with self._lock:
+            due_providers = [
+                provider_key
+                for provider_key, next_pull_time in self._next_pull_times.items()
+                if next_pull_time <= now and provider_key not in self._pulling
+            ]
+            for provider_key in due_providers:
+                self._next_pull_times[provider_key] = now + self.pull_interval
+                self._pulling.add(provider_key)
+
+        for provider_key in due_providers:
+            self.executor.submit(self._pull_provider, provider_key)
+
+    def _pull_provider(self, provider_key: ProviderKey):
+        tenant_id, provider_id, provider_type = provider_key
+        try:
+            # another process may have pulled it since the last refresh
+            provider = get_provider_by_type_and_id(
+                tenant_id, provider_type, provider_id
+            )
+            if not provider or not provider.pulling_enabled:
+                return
+            if self._next_pull_time(provider.last_pull_time) > datetime.now(
+                tz=timezone.utc
+            ):
+                self.logger.info(
+                    "Skipping provider data pulling since it was pulled recently",
+                    extra={
+                        "tenant_id": tenant_id,
+                        "provider_id": provider_id,
+                        "provider_type": provider_type,
+                        "provider_last_pull_time": str(provider.last_pull_time),
+                    },
+                )
+                return
+            pull_data_from_provider(
+                tenant_id, provider_id, provider_type, trace_id=str(uuid.uuid4())
+            )
+        except Exception:
+            self.logger.exception(
+                "Failed to pull provider",
+                extra={
+                    "tenant_id": tenant_id,
+                    "provider_id": provider_id,
+                    "provider_type": provider_type,
+                },
+            )
+        finally:
+            with self._lock:
+                self._pulling.discard(provider_key)
@@ -24,9 +24,10 @@ from keep.api.core.db import is_all_alerts_in_status
 from keep.api.core.dependencies import get_pusher_client
 from keep.api.models.alert import AlertDto, AlertSeverity, AlertStatus
 from keep.api.models.db.alert import Incident
+from keep.api.models.db.preset import PresetDto
 from keep.api.models.db.rule import Rule
 from keep.api.models.incident import IncidentDto
-from keep.api.utils.cel_utils import preprocess_cel_expression
+from keep.api.utils.cel_utils import get_cel_program, preprocess_cel_expression
 from keep.api.utils.enrichment_helpers import convert_db_alerts_to_dto_alerts
 
 # Shahar: this is performance enhancment https://github.com/cloud-custodian/cel-python/issues/68
@@ -452,8 +453,9 @@ class RulesEngine:
         # todo: fix this in the future
         payload["source"] = payload["source"][0]
         payload = RulesEngine.sanitize_cel_payload(payload)
+        activation = celpy.json_to_cel(json.loads(json.dumps(payload, default=str)))
 
-        # what we do here is to compile the CEL rule and evaluate it
+        # what we do here is to compile the CEL rule (once, see get_cel_program) and evaluate it
         #   https://github.com/cloud-custodian/cel-python
         #   https://github.com/google/cel-spec
         sub_rules_matched = []
@@ -467,9 +469,7 @@ class RulesEngine:
             #          TODO: it works for strings now, but we need to add support on list/dict when needed
             if "null" in sub_rule:
                 sub_rule = sub_rule.replace("null", '""')
-            ast = self.env.compile(sub_rule)
-            prgm = self.env.program(ast)
-            activation = celpy.json_to_cel(json.loads(json.dumps(payload, default=str)))
+            prgm = get_cel_program(self.tenant_id, sub_rule)
             try:
                 r = prgm.evaluate(activation)
             except celpy.evaluation.CELEvalError as e:
@@ -684,8 +684,7 @@ class RulesEngine:
             return alerts
         # preprocess the cel expression
         cel = preprocess_cel_expression(cel)
-        ast = self.env.compile(cel)
-        prgm = self.env.program(ast)
+        prgm = get_cel_program(self.tenant_id, cel)
         filtered_alerts = []
 
         for i, alert in enumerate(alerts):
@@ -693,50 +692,96 @@ class RulesEngine:
                 activation = alerts_activation[i]
             else:
                 activation = self.get_alerts_activation([alert])[0]
-            try:
-                r = prgm.evaluate(activation)
-            except ValueError as e:
-                if "Invalid name" in str(e):
-                    logger.warning(
-                        f"{str(e)} in the CEL expression {cel} for alert {alert.id}. This might mean there's a blank space in the field name",
-                        extra={"alert_id": alert.id, "payload": alert.dict()},
-                    )
-                    continue
-            except celpy.evaluation.CELEvalError as e:
-                # this is ok, it means that the subrule is not relevant for this event
-                if "no such member" in str(e):
-                    continue
-                # unknown
-                elif "no such overload" in str(
-                    e
-                ) or "found no matching overload" in str(e):
-                    # Try type coercion for == and !=
-                    try:
-                        coerced = self._coerce_eq_type_error(
-                            cel, prgm, activation, alert
-                        )
-                        if coerced:
-                            filtered_alerts.append(alert)
-                            continue
-                    except Exception:
-                        pass
-                    logger.debug(
-                        f"Type mismtach between operator and operand in the CEL expression {cel} for alert {alert.id}"
-                    )
-                    continue
-                logger.warning(
-                    f"Failed to evaluate the CEL expression {cel} for alert {alert.id} - {e}"
-                )
+            if self._evaluate_cel(prgm, cel, activation, alert):
+                filtered_alerts.append(alert)
+
+        return filtered_alerts
+
+    def match_presets(
+        self, alerts: list[AlertDto], presets: list[PresetDto]
+    ) -> list[PresetDto]:
+        """Return the presets that match at least one of the alerts
+
+        The activation of each alert is built once and evaluated against the
+        (cached) program of every preset, stopping at the first matching alert.
+
+        Args:
+            alerts (list[AlertDto]): list of alerts
+            presets (list[PresetDto]): list of presets
+
+        Returns:
+            list[PresetDto]: the presets with at least one matching alert, in order
+        """
+        logger = logging.getLogger(__name__)
+        if not alerts:
+            return []
+        alerts_activation = None
+        matched_presets = []
+        for preset in presets:
+            cel = preset.cel_query
+            # if the cel is empty, all the alerts match
+            if not cel:
+                matched_presets.append(preset)
                 continue
+            cel = preprocess_cel_expression(cel)
+            try:
+                prgm = get_cel_program(self.tenant_id, cel)
             except Exception:
                 logger.exception(
-                    f"Failed to evaluate the CEL expression {cel} for alert {alert.id}"
+                    f"Failed to compile the CEL expression {cel} of preset {preset.name}"
                 )
                 continue
-            if r:
-                filtered_alerts.append(alert)
+            if alerts_activation is None:
+                alerts_activation = self.get_alerts_activation(alerts)
+            if any(
+                self._evaluate_cel(prgm, cel, activation, alert)
+                for alert, activation in zip(alerts, alerts_activation)
+            ):
+                matched_presets.append(preset)
+        return matched_presets
 
-        return filtered_alerts
+    def _evaluate_cel(self, prgm, cel: str, activation, alert: AlertDto) -> bool:
+        logger = logging.getLogger(__name__)
+        try:
+            r = prgm.evaluate(activation)
+        except ValueError as e:
+            if "Invalid name" in str(e):
+                logger.warning(
+                    f"{str(e)} in the CEL expression {cel} for alert {alert.id}. This might mean there's a blank space in the field name",
+                    extra={"alert_id": alert.id, "payload": alert.dict()},
+                )
+                return False
+            logger.warning(
+                f"Failed to evaluate the CEL expression {cel} for alert {alert.id} - {e}"
+            )
+            return False
+        except celpy.evaluation.CELEvalError as e:
+            # this is ok, it means that the subrule is not relevant for this event
+            if "no such member" in str(e):
+                return False
+            # unknown
+            elif "no such overload" in str(e) or "found no matching overload" in str(e):
+                # Try type coercion for == and !=
+                try:
+                    coerced = self._coerce_eq_type_error(cel, prgm, activation, alert)
+                    if coerced:
+                        return True
+                except Exception:
+                    pass
+                logger.debug(
+                    f"Type mismtach between operator and operand in the CEL expression {cel} for alert {alert.id}"
+                )
+                return False
+            logger.warning(
+                f"Failed to evaluate the CEL expression {cel} for alert {alert.id} - {e}"
+            )
+            return False
+        except Exception:
+            logger.exception(
+                f"Failed to evaluate the CEL expression {cel} for alert {alert.id}"
+            )
+            return False
+        return bool(r)
 
     @staticmethod
     def send_workflow_event(
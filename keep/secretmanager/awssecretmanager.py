@@ -14,6 +14,7 @@ SECRET_MANAGER_TAGS = config("AWS_SECRET_MANAGER_TAGS", default=None)
 ROTATION_ENABLED = config("AWS_SECRET_ROTATION_ENABLED", default=False, cast=bool)
 ROTATION_DAYS = config("AWS_SECRET_ROTATION_DAYS", default=30, cast=int)
 ROTATION_LAMBDA_ARN = config("AWS_SECRET_ROTATION_LAMBDA_ARN", default=None)
+AWS_BATCH_GET_SECRETS_MAX_IDS = 20
 
 
 class AwsSecretManager(BaseSecretManager):
@@ -196,6 +197,63 @@ class AwsSecretManager(BaseSecretManager):
                 )
                 raise
 
+    def read_secrets(
+        self, secret_names: list[str], is_json: bool = False
+    ) -> dict[str, str | dict]:
+        """
+        Reads several secrets from AWS Secrets Manager with BatchGetSecretValue.
+        Args:
+            secret_names (list[str]): The names of the secrets.
+            is_json (bool): Whether to parse the secrets as JSON. Defaults to False.
+        Returns:
+            dict: The secret values by name, secrets that could not be read are omitted.
+        """
+        with tracer.start_as_current_span("read_secrets"):
+            secret_names = list(dict.fromkeys(secret_names))
+            self.logger.debug(
+                "Getting secrets", extra={"secrets_len": len(secret_names)}
+            )
+            secrets = {}
+            # BatchGetSecretValue accepts up to 20 secret ids per call
+            for i in range(0, len(secret_names), AWS_BATCH_GET_SECRETS_MAX_IDS):
+                chunk = secret_names[i : i + AWS_BATCH_GET_SECRETS_MAX_IDS]
+                try:
+                    response = self.client.batch_get_secret_value(SecretIdList=chunk)
+                except ClientError as e:
+                    self.logger.error(
+                        "AWS error while reading secrets",
+                        extra={
+                            "secret_names": chunk,
+                            "error": str(e),
+                            "error_code": e.response["Error"]["Code"],
+                        },
+                    )
+                    continue
+                for error in response.get("Errors", []):
+                    self.logger.warning(
+                        "AWS error while reading secret",
+                        extra={
+                            "secret_name": error.get("SecretId"),
+                            "error": error.get("Message"),
+                            "error_code": error.get("ErrorCode"),
+                        },
+                    )
+                for secret in response.get("SecretValues", []):
+                    secret_value = secret.get("SecretString")
+                    if secret_value is None:
+                        continue
+                    if is_json:
+                        try:
+                            secret_value = json.loads(secret_value)
+                        except json.JSONDecodeError as e:
+                            self.logger.error(
+                                "Failed to parse secret as JSON",
+                                extra={"secret_name": secret["Name"], "error": str(e)},
+                            )
+                            continue
+                    secrets[secret["Name"]] = secret_value
+            return secrets
+
     def delete_secret(self, secret_name: str) -> None:
         """
         Deletes a secret from AWS Secrets Manager.
@@ -0,0 +1,82 @@
+import json
+
+from keep.api.core.cache import TenantCache
+from keep.api.core.config import config
+from keep.contextmanager.contextmanager import ContextManager
+from keep.secretmanager.secretmanager import BaseSecretManager
+
+SECRETS_CACHE_TTL = config("KEEP_SECRETS_CACHE_TTL", cast=int, default=30)  # seconds
+SECRETS_CACHE_SIZE = config("KEEP_SECRETS_CACHE_SIZE", cast=int, default=10000)
+
+# secret names are unique across tenants, so all the secrets share one partition
+_SECRETS_PARTITION = "*"
+secrets_cache = TenantCache(
+    "secrets", max_size=SECRETS_CACHE_SIZE, ttl=SECRETS_CACHE_TTL
+)
+
+
+class CachedSecretManager(BaseSecretManager):
+    """
+    Resolves secrets through another secret manager.
+
+    read_secrets() keeps the raw secret values for KEEP_SECRETS_CACHE_TTL seconds and
+    only reads the missing ones, in a single batch, from the secret manager.
+    read_secret() always reads from the secret manager, and write_secret() and
+    delete_secret() drop the cached value of the secret.
+    """
+
+    def __init__(
+        self,
+        context_manager: ContextManager,
+        secret_manager: BaseSecretManager,
+        **kwargs,
+    ):
+        super().__init__(context_manager)
+        self.secret_manager = secret_manager
+
+    def read_secret(self, secret_name: str, is_json: bool = False) -> str | dict:
+        return self.secret_manager.read_secret(secret_name, is_json=is_json)
+
+    def read_secrets(
+        self, secret_names: list[str], is_json: bool = False
+    ) -> dict[str, str | dict]:
+        if SECRETS_CACHE_TTL <= 0:
+            return self.secret_manager.read_secrets(secret_names, is_json=is_json)
+
+        secret_values = secrets_cache.get_or_set_many(
+            _SECRETS_PARTITION,
+            {secret_name: secret_name for secret_name in secret_names},
+            lambda missing_secret_names: self.secret_manager.read_secrets(
+                missing_secret_names
+            ),
+        )
+        if not is_json:
+            return secret_values
+
+        # parsed on every read so callers can't alter the cached values
+        secrets = {}
+        for secret_name, secret_value in secret_values.items():
+            try:
+                secrets[secret_name] = (
+                    json.loads(secret_value)
+                    if isinstance(secret_value, str)
+                    else secret_value
+                )
+            except json.JSONDecodeError as e:
+                self.logger.warning(
+                    "Failed to parse secret as JSON",
+                    extra={"secret_name": secret_name, "error": str(e)},
+                )
+        return secrets
+
+    def write_secret(self, secret_name: str, secret_value: str) -> None:
+        try:
+            self.secret_manager.write_secret(secret_name, secret_value)
+        finally:
+            secrets_cache.invalidate(_SECRETS_PARTITION, secret_name)
+
+    def delete_secret(self, secret_name: str) -> None:
+        try:
+            self.secret_manager.delete_secret(secret_name)
+        finally:
+            secrets_cache.invalidate(_SECRETS_PARTITION, secret_name)
@@ -33,6 +33,28 @@ class DbSecretManager(BaseSecretManager):
                 )
                 raise
 
+    def read_secrets(
+        self, secret_names: list[str], is_json: bool = False
+    ) -> dict[str, str | dict]:
+        self.logger.info("Getting secrets", extra={"secrets_len": len(secret_names)})
+        if not secret_names:
+            return {}
+        with Session(engine) as session:
+            secret_models = session.exec(
+                select(Secret).where(Secret.key.in_(list(set(secret_names))))
+            ).all()
+        secrets = {}
+        for secret_model in secret_models:
+            try:
+                secrets[secret_model.key] = (
+                    json.loads(secret_model.value) if is_json else secret_model.value
+                )
+            except json.JSONDecodeError as e:
+                self.logger.warning(
+                    "Failed to parse secret as JSON",
+                    extra={"secret_name": secret_model.key, "error": str(e)},
+                )
+        return secrets
 
     def write_secret(self, secret_name: str, secret_value: str) -> None:
         self.logger.info("Writing secret", extra={"secret_name": secret_name})        
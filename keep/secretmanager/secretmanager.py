@@ -1,8 +1,30 @@
 import abc
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from keep.api.core.config import config
 from keep.contextmanager.contextmanager import ContextManager
 
+SECRET_MANAGER_MAX_WORKERS = config(
+    "KEEP_SECRET_MANAGER_MAX_WORKERS", cast=int, default=8
+)
+
+# shared by all the secret managers of the process to bound the concurrent reads
+_read_executor: ThreadPoolExecutor | None = None
+_read_executor_lock = threading.Lock()
+
+
+def _get_read_executor() -> ThreadPoolExecutor:
+    global _read_executor
+    with _read_executor_lock:
+        if _read_executor is None:
+            _read_executor = ThreadPoolExecutor(
+                max_workers=SECRET_MANAGER_MAX_WORKERS,
+                thread_name_prefix="secret-manager",
+            )
+        return _read_executor
+
 
 class BaseSecretManager(metaclass=abc.ABCMeta):
     def __init__(self, context_manager: ContextManager, **kwargs):
@@ -26,6 +48,46 @@ class BaseSecretManager(metaclass=abc.ABCMeta):
             " for {}".format(self.__class__.__name__)
         )
 
+    def read_secrets(
+        self, secret_names: list[str], is_json: bool = False
+    ) -> dict[str, str | dict]:
+        """
+        Read several secrets from the secret manager.
+
+        Secret managers that support multi-get should override this, by default the
+        secrets are read concurrently with read_secret().
+
+        Args:
+            secret_names (list[str]): The names of the secrets to read.
+            is_json (bool): Whether to try and convert to python dictionary or not (json.loads)
+
+        Returns:
+            dict: The secret values by name, secrets that could not be read are omitted.
+        """
+        secret_names = list(dict.fromkeys(secret_names))
+        if len(secret_names) <= 1:
+            executor_map = map
+        else:
+            executor_map = _get_read_executor().map
+
+        def _read_secret(secret_name: str):
+            try:
+                return self.read_secret(secret_name, is_json=is_json)
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to read secret",
+                    extra={"secret_name": secret_name, "error": str(e)},
+                )
+                return None
+
+        return {
+            secret_name: secret_value
+            for secret_name, secret_value in zip(
+                secret_names, executor_map(_read_secret, secret_names)
+            )
+            if secret_value is not None
+        }
+
     @abc.abstractmethod
     def write_secret(self, secret_name: str, secret_value: str) -> None:
         """
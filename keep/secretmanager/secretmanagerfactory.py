@@ -1,7 +1,9 @@
 import enum
 
+from keep.api.core.cache import TenantCache
 from keep.api.core.config import config
 from keep.contextmanager.contextmanager import ContextManager
+from keep.secretmanager.cachedsecretmanager import CachedSecretManager
 from keep.secretmanager.secretmanager import BaseSecretManager
 
 
@@ -14,6 +16,21 @@ class SecretManagerTypes(enum.Enum):
     DB = "db"
 
 
+# secret managers with a remote, authenticated client that is reused by the process
+REUSABLE_SECRET_MANAGER_TYPES = {
+    SecretManagerTypes.GCP,
+    SecretManagerTypes.K8S,
+    SecretManagerTypes.VAULT,
+    SecretManagerTypes.AWS,
+}
+SECRET_MANAGER_CLIENT_TTL = config(
+    "KEEP_SECRET_MANAGER_CLIENT_TTL", cast=int, default=600
+)  # seconds
+secret_managers_cache = TenantCache(
+    "secret_managers", max_size=len(SecretManagerTypes), ttl=SECRET_MANAGER_CLIENT_TTL
+)
+
+
 class SecretManagerFactory:
     @staticmethod
     def get_secret_manager(
@@ -25,6 +42,26 @@ class SecretManagerFactory:
             secret_manager_type = SecretManagerTypes[
                 config("SECRET_MANAGER_TYPE", default="FILE").upper()
             ]
+        if secret_manager_type in REUSABLE_SECRET_MANAGER_TYPES and not kwargs:
+            secret_manager = secret_managers_cache.get_or_set(
+                "*",
+                secret_manager_type,
+                lambda: SecretManagerFactory._create_secret_manager(
+                    context_manager, secret_manager_type
+                ),
+            )
+        else:
+            secret_manager = SecretManagerFactory._create_secret_manager(
+                context_manager, secret_manager_type, **kwargs
+            )
+        return CachedSecretManager(context_manager, secret_manager)
+
+    @staticmethod
+    def _create_secret_manager(
+        context_manager: ContextManager,
+        secret_manager_type: SecretManagerTypes,
+        **kwargs,
+    ) -> BaseSecretManager:
         if secret_manager_type == SecretManagerTypes.FILE:
             from keep.secretmanager.filesecretmanager import FileSecretManager
 
@@ -1,3 +1,4 @@
+import copy
 import logging
 import time
 from enum import Enum
@@ -47,6 +48,15 @@ class Step:
         self.__retry_interval = self.__retry.get("interval", 0)
         self.__continue_to_next_step = self.config.get("continue", True)
 
+    def with_context(self, context_manager: ContextManager) -> "Step":
+        """Return a copy of the step and its provider bound to another context."""
+        step = copy.copy(self)
+        step.context_manager = context_manager
+        step.io_handler = IOHandler(context_manager)
+        step.conditions_results = {}
+        step.provider = self.provider.with_context(context_manager)
+        return step
+
     @property
     def foreach(self):
         return self.config.get("foreach")
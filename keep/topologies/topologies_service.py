@@ -24,6 +24,7 @@ from keep.api.models.db.topology import (
     TopologyServiceDependencyDto,
     TopologyServiceYAML,
 )
+from keep.topologies.topology_index import invalidate_topology_index
 
 logger = logging.getLogger(__name__)
 
@@ -248,6 +249,7 @@ class TopologiesService:
 
         session.add_all(new_links)
         session.commit()
+        invalidate_topology_index(tenant_id)
 
         session.expire(new_application, ["services"])
 
@@ -307,6 +309,7 @@ class TopologiesService:
 
             session.add_all(new_links)
             session.commit()
+            invalidate_topology_index(tenant_id)
 
         except Exception as e:
             session.rollback()
@@ -377,6 +380,7 @@ class TopologiesService:
         session.add_all(new_links)
 
         session.commit()
+        invalidate_topology_index(tenant_id)
         session.refresh(application_db)
         return TopologyApplicationDtoOut.from_orm(application_db)
 
@@ -426,6 +430,7 @@ class TopologiesService:
             )
         session.delete(application)
         session.commit()
+        invalidate_topology_index(tenant_id)
         return None
 
     @staticmethod
@@ -457,6 +462,7 @@ class TopologiesService:
             )
             session.add(db_service)
             session.commit()
+            invalidate_topology_index(tenant_id)
             session.refresh(db_service)
             return db_service
         except Exception as e:
@@ -480,6 +486,7 @@ class TopologiesService:
                 session.add(db_service)
 
             session.commit()
+            invalidate_topology_index(tenant_id)
 
         except Exception as e:
             session.rollback()
@@ -512,6 +519,7 @@ class TopologiesService:
                     ):
                         db_service.__setattr__(attr, service_dict[attr])
                 session.commit()
+                invalidate_topology_index(tenant_id)
                 session.refresh(db_service)
                 return db_service
         except Exception as e:
@@ -562,6 +570,7 @@ class TopologiesService:
                 raise ServiceNotFoundException("No services found for the given IDs.")
 
             session.commit()
+            invalidate_topology_index(tenant_id)
         except Exception as e:
             session.rollback()
             logger.error(f"Error while deleting services: {e}")
@@ -588,6 +597,7 @@ class TopologiesService:
             db_dependency = TopologyServiceDependency(**dependency.dict())
             session.add(db_dependency)
             session.commit()
+            invalidate_topology_index(tenant_id)
             session.refresh(db_dependency)
             return TopologyServiceDependencyDto.from_orm(db_dependency)
         except Exception as e:
@@ -626,6 +636,7 @@ class TopologiesService:
                 db_dependencies.append(db_dependency)
 
             session.commit()
+            invalidate_topology_index(tenant_id)
 
         except Exception as e:
             session.rollback()
@@ -665,6 +676,7 @@ class TopologiesService:
                     ):
                         db_dependency.__setattr__(attr, service_dict[attr])
                 session.commit()
+                invalidate_topology_index(tenant_id)
                 session.refresh(db_dependency)
                 return TopologyServiceDependencyDto.from_orm(db_dependency)
         except Exception as e:
@@ -697,6 +709,7 @@ class TopologiesService:
                 raise DependencyNotFoundException()
             session.delete(db_dependency)
             session.commit()
+            invalidate_topology_index(tenant_id)
             return None
         except Exception as e:
             session.rollback()
@@ -734,6 +747,7 @@ class TopologiesService:
             ).delete(synchronize_session=False)
     
             session.commit()
+            invalidate_topology_index(tenant_id)
         except Exception as e:
             session.rollback()
             logger.error(f"Error during cleanup before import: {e}")
@@ -0,0 +1,107 @@
+"""
+Topology changes shared between the processes through a Redis pub/sub channel.
+
+With Redis, the events are processed by the arq workers while the topology processor
+runs in the API, so the services of the processed alerts are published to every
+process instead of being handed to the topology processor of the current one.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Callable
+
+from keep.api.consts import REDIS
+
+logger = logging.getLogger(__name__)
+
+CHANGES_CHANNEL = "keep:topology:changes"
+
+# {message type: handlers of the messages of that type}
+_handlers: dict[str, list[Callable[[dict], None]]] = {}
+# called when (re)subscribed, as changes may have been missed meanwhile
+_on_subscribe_handlers: list[Callable[[], None]] = []
+_subscriber_lock = threading.Lock()
+_subscriber_started = False
+
+
+def subscribe_topology_changes(
+    message_type: str,
+    handler: Callable[[dict], None],
+    on_subscribe: Callable[[], None] | None = None,
+):
+    """Handle the messages of this type published by any process (Redis only)."""
+    with _subscriber_lock:
+        _handlers.setdefault(message_type, []).append(handler)
+        if on_subscribe is not None:
+            _on_subscribe_handlers.append(on_subscribe)
+    start_topology_changes_subscriber()
+
+
+def publish_topology_change(message_type: str, **message) -> bool:
+    """
+    Publish the change to every process.
+
+    Returns:
+        bool: False if it wasn't published (no Redis or Redis failed), the caller
+            should handle the change in this process.
+    """
+    if not REDIS:
+        return False
+    try:
+        from keep.api.redis_settings import get_redis_client
+
+        get_redis_client().publish(
+            CHANGES_CHANNEL, json.dumps({"type": message_type, **message})
+        )
+        return True
+    except Exception:
+        logger.exception(
+            "Failed to publish topology change",
+            extra={"message_type": message_type},
+        )
+        return False
+
+
+def start_topology_changes_subscriber():
+    global _subscriber_started
+    if not REDIS or _subscriber_started:
+        return
+    with _subscriber_lock:
+        if _subscriber_started:
+            return
+        threading.Thread(
+            target=_listen_for_changes,
+            name="topology-changes",
+            daemon=True,
+        ).start()
+        _subscriber_started = True
+
+
+def handle_topology_change(message: dict):
+    for handler in list(_handlers.get(message.get("type"), [])):
+        try:
+            handler(message)
+        except Exception:
+            logger.exception(
+                "Failed to handle topology change",
+                extra={"message_type": message.get("type")},
+            )
+
+
+def _listen_for_changes():
+    from keep.api.redis_settings import get_redis_client
+
+    while True:
+        try:
+            pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CHANGES_CHANNEL)
+            for on_subscribe in list(_on_subscribe_handlers):
+                on_subscribe()
+            for message in pubsub.listen():
+                if message.get("type") == "message":
+                    handle_topology_change(json.loads(message["data"]))
+        except Exception:
+            logger.exception("Topology changes subscriber failed, retrying")
+            time.sleep(5)
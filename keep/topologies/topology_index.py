@@ -0,0 +1,193 @@
+"""
+Per-tenant, in-memory indexes of the topology.
+
+The indexes are built lazily from the db and dropped by invalidate_topology_index()
+whenever the topology of the tenant changes (topology import, services, dependencies
+and applications CRUD, topology pulled from a provider). With Redis, the other
+processes (e.g. the arq workers running the mapping rules) drop them too, and the
+TTL only bounds how long a change can go unnoticed if Redis failed to deliver it.
+
+Every invalidation bumps the topology version of the tenant, an index built from an
+older version (e.g. loaded while the topology was being imported) is never used.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Hashable, Iterable, Optional, TypeVar
+
+from keep.api.core.cache import TenantCache
+from keep.api.core.config import config
+from keep.api.core.db import get_topology_services_with_applications
+from keep.api.models.db.topology import TopologyApplicationDtoOut, TopologyService
+from keep.topologies.topology_changes import (
+    publish_topology_change,
+    subscribe_topology_changes,
+)
+
+TOPOLOGY_CHANGED = "topology_changed"
+
+# {name of the index: (topology version, index)} by tenant
+topology_index_cache = TenantCache(
+    "topology_index",
+    ttl=config("KEEP_TOPOLOGY_INDEX_TTL", cast=int, default=300),  # seconds
+)
+_topology_versions: dict[str, int] = defaultdict(int)
+_topology_versions_lock = threading.Lock()
+_subscribed = False
+
+Index = TypeVar("Index")
+
+
+class TopologyApplicationsIndex:
+    """The applications of a tenant indexed by the name of their services."""
+
+    def __init__(
+        self, services: Iterable[str], applications: list[TopologyApplicationDtoOut]
+    ):
+        # the services of the topology data (the ones with dependencies)
+        self.services = set(services)
+        self.applications = applications
+        self.service_applications: dict[str, list[TopologyApplicationDtoOut]] = (
+            defaultdict(list)
+        )
+        for application in applications:
+            for service in application.services:
+                self.service_applications[service.service].append(application)
+
+    def get_applications(
+        self, services: Iterable[str]
+    ) -> list[TopologyApplicationDtoOut]:
+        """Return the applications containing any of the services, in index order."""
+        application_ids = {
+            application.id
+            for service in services
+            for application in self.service_applications.get(service, [])
+        }
+        return [
+            application
+            for application in self.applications
+            if application.id in application_ids
+        ]
+
+
+class TopologyServicesIndex:
+    """The topology services of a tenant and the enrichments of the topology mapping
+    rules, indexed by the values of the attributes the rules match on."""
+
+    def __init__(self, services: list[TopologyService]):
+        self.services: list[dict[str, Any]] = []
+        self.enrichments: list[dict[str, Any]] = []
+        for service in services:
+            self.services.append(service.dict())
+            enrichments = service.dict(exclude_none=True)
+            # repository could be taken from application too
+            if not service.repository and service.applications:
+                for application in service.applications:
+                    if application.repository:
+                        enrichments["repository"] = application.repository
+            # Remove redundant fields
+            enrichments.pop("tenant_id", None)
+            enrichments.pop("id", None)
+            self.enrichments.append(enrichments)
+        # {(attribute, ...): {(value, ...): position of the first matching service}}
+        self._lookups: dict[tuple[str, ...], dict[tuple[Hashable, ...], int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.services)
+
+    def _lookup(self, attributes: tuple[str, ...]) -> dict[tuple[Hashable, ...], int]:
+        lookup = self._lookups.get(attributes)
+        if lookup is None:
+            lookup = {}
+            for position, service in enumerate(self.services):
+                values = tuple(service.get(attribute) for attribute in attributes)
+                # None never matches, like NULL in the db
+                if any(value is None for value in values):
+                    continue
+                try:
+                    lookup.setdefault(values, position)
+                except TypeError:
+                    # unhashable values (e.g. tags) can't be matched on
+                    continue
+            self._lookups[attributes] = lookup
+        return lookup
+
+    def get_service_enrichments(
+        self, matchers_value: dict[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        """Return the enrichments of the first service whose attributes are equal to
+        all the matchers values, None if there is none."""
+        attributes = tuple(sorted(matchers_value))
+        try:
+            position = self._lookup(attributes).get(
+                tuple(matchers_value[attribute] for attribute in attributes)
+            )
+        except TypeError:
+            return None
+        if position is None:
+            return None
+        return dict(self.enrichments[position])
+
+
+def get_topology_version(tenant_id: str) -> int:
+    with _topology_versions_lock:
+        return _topology_versions[tenant_id]
+
+
+def get_topology_index(tenant_id: str, name: str, build: Callable[[], Index]) -> Index:
+    """Return the index of the current topology version, building it if needed."""
+    _subscribe_topology_changes()
+    version = get_topology_version(tenant_id)
+    entry = topology_index_cache.get(tenant_id, name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    index = build()
+    # not kept if the topology changed while it was loaded
+    if get_topology_version(tenant_id) == version:
+        topology_index_cache.set(tenant_id, name, (version, index))
+    return index
+
+
+def get_topology_services_index(tenant_id: str) -> TopologyServicesIndex:
+    return get_topology_index(
+        tenant_id,
+        "services",
+        lambda: TopologyServicesIndex(
+            get_topology_services_with_applications(tenant_id)
+        ),
+    )
+
+
+def invalidate_topology_index(tenant_id: str):
+    """Drop the indexes of the tenant in every process."""
+    _invalidate_locally(tenant_id)
+    publish_topology_change(TOPOLOGY_CHANGED, tenant_id=tenant_id)
+
+
+def _invalidate_locally(tenant_id: str):
+    with _topology_versions_lock:
+        _topology_versions[tenant_id] += 1
+    topology_index_cache.invalidate(tenant_id)
+
+
+def _invalidate_all():
+    # invalidations may have been missed while not subscribed
+    with _topology_versions_lock:
+        for tenant_id in _topology_versions:
+            _topology_versions[tenant_id] += 1
+    topology_index_cache.clear()
+
+
+def _subscribe_topology_changes():
+    global _subscribed
+    if _subscribed:
+        return
+    with _topology_versions_lock:
+        if _subscribed:
+            return
+        _subscribed = True
+    subscribe_topology_changes(
+        TOPOLOGY_CHANGED,
+        lambda message: _invalidate_locally(message["tenant_id"]),
+        on_subscribe=_invalidate_all,
+    )
@@ -1,8 +1,9 @@
 import logging
 import os
 import threading
+import time
 from collections import defaultdict
-from typing import Dict, Optional, Set
+from typing import Dict, Iterable, Optional, Set
 
 from sqlmodel import select
 
@@ -15,6 +16,7 @@ from keep.api.core.db import (
     get_last_alerts,
 )
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
+from keep.api.core.query_count import invalidate_query_counts_cache
 from keep.api.core.tenant_configuration import TenantConfiguration
 from keep.api.models.alert import AlertDto, AlertStatus
 from keep.api.models.db.alert import Incident
@@ -24,6 +26,13 @@ from keep.api.models.incident import IncidentDto
 from keep.api.utils.enrichment_helpers import convert_db_alerts_to_dto_alerts
 from keep.rulesengine.rulesengine import RulesEngine
 from keep.topologies.topologies_service import TopologiesService
+from keep.topologies.topology_changes import (
+    publish_topology_change,
+    subscribe_topology_changes,
+)
+from keep.topologies.topology_index import TopologyApplicationsIndex, get_topology_index
+
+SERVICES_CHANGED = "services_changed"
 
 
 class TopologyProcessor:
@@ -41,6 +50,11 @@ class TopologyProcessor:
         self._stop_event = threading.Event()
         self._topology_cache = {}
         self._cache_lock = threading.Lock()
+        # services with new alerts by tenant, published by the event pipeline
+        self._changed_services: Dict[str, Set[str]] = defaultdict(set)
+        self._changed_services_lock = threading.Lock()
+        self._subscribed = False
+        self._last_full_process_time: Optional[float] = None
         self.enabled = (
             os.environ.get("KEEP_TOPOLOGY_PROCESSOR", "false").lower() == "true"
         )
@@ -61,6 +75,15 @@ class TopologyProcessor:
         self.look_back_window = config(
             "KEEP_TOPOLOGY_PROCESSOR_LOOK_BACK_WINDOW", cast=int, default=15
         )  # minutes
+        # only the applications of the changed services are processed, all the
+        # tenants are still fully processed every KEEP_TOPOLOGY_PROCESSOR_FULL_INTERVAL
+        # to catch up with changes made outside of the event pipeline (0 to disable)
+        self.incremental = config(
+            "KEEP_TOPOLOGY_PROCESSOR_INCREMENTAL", cast=bool, default=True
+        )
+        self.full_process_interval = config(
+            "KEEP_TOPOLOGY_PROCESSOR_FULL_INTERVAL", cast=int, default=600
+        )  # seconds
 
     async def start(self):
         """Runs the topology processor in server mode"""
@@ -73,6 +96,16 @@ class TopologyProcessor:
             return
 
         self.logger.info("Starting topology processor")
+        if not self._subscribed:
+            # the events may be processed by other processes (arq workers)
+            subscribe_topology_changes(
+                SERVICES_CHANGED,
+                lambda message: self.notify_services_changed(
+                    message["tenant_id"], message["services"]
+                ),
+                on_subscribe=self._request_full_process,
+            )
+            self._subscribed = True
         self._stop_event.clear()
         self.thread = threading.Thread(
             target=self._start_processing, name="topology-processing", daemon=True
@@ -119,36 +152,107 @@ class TopologyProcessor:
         self.thread = None
         self.logger.info("Stopped topology processor")
 
+    @staticmethod
+    def publish_services_changed(tenant_id: str, services: Iterable[str]):
+        """Called by the event pipeline with the services of the processed alerts,
+        they reach the topology processor of whichever process runs it"""
+        services = sorted({service for service in services if service})
+        if not services:
+            return
+        if not publish_topology_change(
+            SERVICES_CHANGED, tenant_id=tenant_id, services=services
+        ):
+            TopologyProcessor.get_instance().notify_services_changed(
+                tenant_id, services
+            )
+
+    def notify_services_changed(self, tenant_id: str, services: Iterable[str]):
+        """Record services with new alerts, to be processed on the next run"""
+        if not self.started:
+            # not running in this process
+            return
+        services = {service for service in services if service}
+        if not services:
+            return
+        with self._changed_services_lock:
+            self._changed_services[tenant_id].update(services)
+
+    def _request_full_process(self):
+        # changes published while not subscribed were missed
+        self._last_full_process_time = None
+
+    def _pop_changed_services(self) -> Dict[str, Set[str]]:
+        with self._changed_services_lock:
+            changed_services = self._changed_services
+            self._changed_services = defaultdict(set)
+        return changed_services
+
     def _process_all_tenants(self):
         """Process topology for all tenants"""
-        tenants = self.enabled_tenants.keys()
+        # taken before processing so changes published meanwhile are kept for next time
+        changed_services = self._pop_changed_services()
+        now = time.monotonic()
+        full_process = (
+            not self.incremental
+            or self._last_full_process_time is None
+            or (
+                self.full_process_interval > 0
+                and now - self._last_full_process_time >= self.full_process_interval
+            )
+        )
+        if full_process:
+            self._last_full_process_time = now
+            tenants = self.enabled_tenants.keys()
+        else:
+            tenants = [
+                tenant_id
+                for tenant_id in changed_services
+                if tenant_id in self.enabled_tenants
+            ]
+            if not tenants:
+                self.logger.debug("No topology changes to process")
+                return
+
         for tenant_id in tenants:
             try:
                 self.logger.info(f"Processing topology for tenant {tenant_id}")
-                self._process_tenant(tenant_id)
+                self._process_tenant(
+                    tenant_id,
+                    None if full_process else changed_services[tenant_id],
+                )
                 self.logger.info(f"Finished processing topology for tenant {tenant_id}")
             except Exception as e:
                 self.logger.exception(f"Error processing tenant {tenant_id}: {str(e)}")
 
-    def _process_tenant(self, tenant_id: str):
-        """Process topology for a single tenant"""
+    def _process_tenant(
+        self, tenant_id: str, changed_services: Optional[Set[str]] = None
+    ):
+        """Process topology for a single tenant, only the applications of the changed
+        services if given"""
         self.logger.info(f"Processing topology for tenant {tenant_id}")
 
         # 1. Get last alerts for the tenant
-        topology_data = self._get_topology_data(tenant_id)
-        applications = self._get_applications_data(tenant_id)
-        services = [t.service for t in topology_data]
-        if not topology_data:
+        index = self._get_applications_index(tenant_id)
+        services = index.services
+        if not services:
             self.logger.info(f"No topology data found for tenant {tenant_id}")
             return
 
         # Currently topology-based incidents are created for applications only
         # SHAHAR: this is harder to implement service-related incidents without applications
         # TODO: add support for service-related incidents
-        if not applications:
+        if not index.applications:
             self.logger.info(f"No applications found for tenant {tenant_id}")
             return
 
+        if changed_services is None:
+            applications = index.applications
+        else:
+            applications = index.get_applications(changed_services & services)
+            if not applications:
+                self.logger.info(f"No affected applications for tenant {tenant_id}")
+                return
+
         # TODO: get only alerts with service ( if lot of alerts it will be hidden)
         db_last_alerts = get_last_alerts(tenant_id, with_incidents=True)
         last_alerts = convert_db_alerts_to_dto_alerts(db_last_alerts)
@@ -237,6 +341,17 @@ class TopologyProcessor:
             ).first()
             return incident
 
+    def _get_applications_index(self, tenant_id: str) -> TopologyApplicationsIndex:
+        """Get the applications of a tenant indexed by service"""
+        return get_topology_index(
+            tenant_id,
+            "applications",
+            lambda: TopologyApplicationsIndex(
+                [t.service for t in self._get_topology_data(tenant_id)],
+                self._get_applications_data(tenant_id),
+            ),
+        )
+
     def _get_topology_data(self, tenant_id: str):
         """Get topology data for a tenant"""
         with existed_or_new_session() as session:
@@ -376,4 +491,5 @@ class TopologyProcessor:
             incident_dto = IncidentDto.from_db_incident(incident)
             # Trigger the workflow event
             RulesEngine.send_workflow_event(tenant_id, session, incident_dto, "created")
+            invalidate_query_counts_cache(tenant_id)
             self.logger.info(f"Created new incident for application {application.name}")
@@ -1,3 +1,4 @@
+import copy
 import enum
 import logging
 import threading
@@ -67,6 +68,33 @@ class Workflow:
         self.workflow_debug = workflow_debug
         self.workflow_permissions = workflow_permissions
 
+    def with_context(self, context_manager: ContextManager) -> "Workflow":
+        """
+        Return a copy of the parsed workflow bound to a fresh context manager.
+
+        The providers and actions configuration and the secrets already loaded
+        by the parser are copied to the new context, so the copy is cheap and
+        does not hit the db or the secret manager.
+        """
+        context_manager.providers_context = dict(self.context_manager.providers_context)
+        context_manager.actions_context = dict(self.context_manager.actions_context)
+        context_manager.secret_context = dict(self.context_manager.secret_context)
+        context_manager.dependencies = set(self.context_manager.dependencies)
+        context_manager.set_consts_context(self.workflow_consts)
+
+        workflow = copy.copy(self)
+        workflow.context_manager = context_manager
+        workflow.io_nandler = IOHandler(context_manager)
+        workflow.workflow_steps = [
+            step.with_context(context_manager) for step in self.workflow_steps
+        ]
+        workflow.workflow_actions = [
+            action.with_context(context_manager) for action in self.workflow_actions
+        ]
+        if self.on_failure:
+            workflow.on_failure = self.on_failure.with_context(context_manager)
+        return workflow
+
     def run_steps(self):
         self.logger.debug(f"Running steps for workflow {self.workflow_id}")
         for step in self.workflow_steps:
@@ -21,7 +21,7 @@ from keep.providers.providers_factory import ProviderConfigurationException
 from keep.workflowmanager.workflow import Workflow
 from keep.workflowmanager.workflowscheduler import WorkflowScheduler, timing_histogram
 from keep.workflowmanager.workflowstore import WorkflowStore
-from keep.api.utils.cel_utils import preprocess_cel_expression
+from keep.workflowmanager.workflowtriggerindex import WorkflowTriggerIndex
 
 
 class WorkflowManager:
@@ -50,6 +50,7 @@ class WorkflowManager:
         self.workflow_store = WorkflowStore()
         self.started = False
         self.cel_environment = celpy.Environment()
+        self.trigger_index = WorkflowTriggerIndex(self._convert_filters_to_cel)
         # this is to enqueue the workflows in the REDIS queue
         # SHAHAR: todo - finish the REDIS implementation
         # self.loop = None
@@ -284,299 +285,208 @@ class WorkflowManager:
             )
             raise
 
+    def _get_event_activation(self, event: AlertDto | IncidentDto):
+        # Convert event to dict and normalize severity for CEL evaluation
+        event_payload = event.dict()
+        # Convert severity string to numeric order for proper comparison with preprocessed CEL
+        if isinstance(event_payload.get("severity"), str):
+            try:
+                event_payload["severity"] = AlertSeverity(
+                    event_payload["severity"].lower()
+                ).order
+            except (ValueError, AttributeError):
+                # If severity conversion fails, keep original value
+                pass
+        return celpy.json_to_cel(event_payload)
+
     def insert_events(self, tenant_id, events: typing.List[AlertDto | IncidentDto]):
+        self.logger.info(
+            "Getting workflow trigger index", extra={"tenant_id": tenant_id}
+        )
+        trigger_index = self.trigger_index.get(tenant_id)
+        self.logger.info(
+            "Got workflow trigger index",
+            extra={
+                "num_of_triggers": len(trigger_index),
+                "tenant_id": tenant_id,
+            },
+        )
         for event in events:
-            self.logger.info("Getting all workflows", extra={"tenant_id": tenant_id})
-            all_workflow_models = self.workflow_store.get_all_workflows(
-                tenant_id, exclude_disabled=True
-            )
-            self.logger.info(
-                "Got all workflows",
-                extra={
-                    "num_of_workflows": len(all_workflow_models),
-                    "tenant_id": tenant_id,
-                },
-            )
-            for workflow_model in all_workflow_models:
-                workflow = self._get_workflow_from_store(tenant_id, workflow_model)
-
-                if workflow is None:
-                    # Exception is thrown in _get_workflow_from_store, we don't need to log it here, just continue.
-                    continue
-
-                for trigger in workflow.workflow_triggers:
-                    # If the trigger is not an alert, it's not relevant for this event.
-                    if not trigger.get("type") == "alert":
-                        self.logger.debug(
-                            "Trigger type is not alert, skipping",
+            # only the triggers whose equality conditions match the event are evaluated
+            candidates = trigger_index.candidates(event)
+            activation = None
+            i = 0
+            while i < len(candidates):
+                alert_trigger = candidates[i]
+                i += 1
+                workflow_model = alert_trigger.workflow_model
+                trigger = alert_trigger.trigger
+
+                if alert_trigger.program is None:
+                    should_run = True
+                else:
+                    if activation is None:
+                        activation = self._get_event_activation(event)
+                    try:
+                        should_run = alert_trigger.program.evaluate(activation)
+                    except celpy.evaluation.CELEvalError as e:
+                        self.logger.exception(
+                            "Error evaluating CEL for event in insert_events",
                             extra={
+                                "exception": e,
+                                "event": event,
                                 "trigger": trigger,
                                 "workflow_id": workflow_model.id,
                                 "tenant_id": tenant_id,
+                                "cel": alert_trigger.cel,
+                                "deprecated_filters": trigger.get("filters"),
                             },
                         )
                         continue
 
-                    if "filters" not in trigger and "cel" not in trigger:
-                        self.logger.warning(
-                            "Trigger is missing filters or cel",
-                            extra={
-                                "trigger": trigger,
-                                "workflow_id": workflow_model.id,
-                                "tenant_id": tenant_id,
-                            },
-                        )
-                        should_run = True
-                    else:
-
-                        # By default, the workflow should not run. Only if the CEL evaluates to true, the workflow will run.
-                        should_run = False
-
-                        # backward compatibility for filter. should be removed in the future
-                        # if triggers and cel are set, we override the cel with filters.
-                        if "filters" in trigger:
-                            try:
-                                # this is old format, so let's convert it to CEL
-                                trigger["cel"] = self._convert_filters_to_cel(
-                                    trigger["filters"]
-                                )
-                            except Exception:
-                                self.logger.exception(
-                                    "Failed to convert filters to CEL, workflow will not run",
-                                    extra={
-                                        "trigger": trigger,
-                                        "workflow_id": workflow_model.id,
-                                        "tenant_id": tenant_id,
-                                    },
-                                )
-                                continue
+                if bool(should_run) is False:
+                    self.logger.debug(
+                        "Workflow should not run, skipping",
+                        extra={
+                            "trigger": trigger,
+                            "workflow_id": workflow_model.id,
+                            "tenant_id": tenant_id,
+                            "cel": alert_trigger.cel,
+                            "deprecated_filters": trigger.get("filters"),
+                        },
+                    )
+                    continue
 
-                        cel = trigger.get("cel", "")
-                        if not cel:
-                            self.logger.warning(
-                                "Trigger is missing cel",
-                                extra={
-                                    "trigger": trigger,
-                                    "workflow_id": workflow_model.id,
-                                    "tenant_id": tenant_id,
-                                },
-                            )
-                            continue
+                # the workflow is parsed only once we know it should run
+                workflow = self._get_workflow_from_store(tenant_id, workflow_model)
+                if workflow is None:
+                    # Exception is thrown in _get_workflow_from_store, we don't need to log it here, just continue.
+                    continue
 
-                        # source is a special case which can be used as string comparison although it is a list
-                        if "source" in cel:
-                            try:
+                # enrich the alert with more data
+                self.logger.info("Found a workflow to run")
+                event.trigger = "alert"
+                # prepare the alert with the enrichment
+                self.logger.info("Enriching alert")
+                alert_enrichment = get_enrichment(tenant_id, event.fingerprint)
+                if alert_enrichment:
+                    for k, v in alert_enrichment.enrichments.items():
+                        setattr(event, k, v)
+                self.logger.info("Alert enriched")
+                # the enrichment may change the fields the remaining triggers use
+                activation = None
+                candidates = [
+                    candidate
+                    for candidate in trigger_index.candidates(event)
+                    if candidate.position > alert_trigger.position
+                ]
+                i = 0
+                # apply only_on_change (https://github.com/keephq/keep/issues/801)
+                # (copied, the trigger is shared by all the events through the index)
+                fields_that_needs_to_be_change = list(trigger.get("only_on_change", []))
+                severity_changed = trigger.get("severity_changed", False)
+                # if there are fields that needs to be changed, get the previous alert
+                if fields_that_needs_to_be_change or severity_changed:
+                    previous_alert = get_previous_alert_by_fingerprint(
+                        tenant_id, event.fingerprint
+                    )
+                    if severity_changed:
+                        fields_that_needs_to_be_change.append("severity")
+                    # now compare:
+                    #   (no previous alert means that the workflow should run)
+                    if previous_alert:
+                        for field in fields_that_needs_to_be_change:
+                            # the field hasn't change
+                            if getattr(event, field) == previous_alert.event.get(field):
                                 self.logger.info(
-                                    "Checking if source needs to be replaced",
-                                    extra={
-                                        "cel": cel,
-                                        "trigger": trigger,
-                                        "workflow_id": workflow_model.id,
-                                        "tenant_id": tenant_id,
-                                    },
-                                )
-                                pattern = r'source\s*==\s*[\'"]([^\'"]+)[\'"]'
-                                replacement = r'source.contains("\1")'
-                                cel = re.sub(pattern, replacement, cel)
-                            except Exception:
-                                self.logger.exception(
-                                    "Error replacing source in CEL",
+                                    "Skipping the workflow because the field hasn't change",
                                     extra={
-                                        "cel": cel,
-                                        "trigger": trigger,
-                                        "workflow_id": workflow_model.id,
-                                        "tenant_id": tenant_id,
+                                        "field": field,
+                                        "event": event,
+                                        "previous_alert": previous_alert,
                                     },
                                 )
-                                continue
-
-                        # Preprocess the CEL expression to handle severity comparisons properly
-                        try:
-                            cel = preprocess_cel_expression(cel)
-                            self.logger.debug(
-                                "Preprocessed CEL expression",
-                                extra={
-                                    "original_cel": trigger.get("cel", ""),
-                                    "preprocessed_cel": cel,
-                                    "workflow_id": workflow_model.id,
-                                    "tenant_id": tenant_id,
-                                },
+                                should_run = False
+                                break
+                        if should_run and severity_changed:
+                            setattr(event, "severity_changed", True)
+                            setattr(
+                                event,
+                                "previous_severity",
+                                previous_alert.event.get("severity"),
                             )
-                        except Exception:
-                            self.logger.exception(
-                                "Error preprocessing CEL expression",
-                                extra={
-                                    "cel": cel,
-                                    "trigger": trigger,
-                                    "workflow_id": workflow_model.id,
-                                    "tenant_id": tenant_id,
-                                },
+                            previous_severity = AlertSeverity(
+                                previous_alert.event.get("severity")
                             )
-                            continue
-
-                        compiled_ast = self.cel_environment.compile(cel)
-                        program = self.cel_environment.program(compiled_ast)
-
-                        # Convert event to dict and normalize severity for CEL evaluation
-                        event_payload = event.dict()
-                        # Convert severity string to numeric order for proper comparison with preprocessed CEL
-                        if isinstance(event_payload.get("severity"), str):
-                            try:
-                                event_payload["severity"] = AlertSeverity(
-                                    event_payload["severity"].lower()
-                                ).order
-                            except (ValueError, AttributeError):
-                                # If severity conversion fails, keep original value
-                                pass
-
-                        activation = celpy.json_to_cel(event_payload)
-                        try:
-                            should_run = program.evaluate(activation)
-                        except celpy.evaluation.CELEvalError as e:
-                            self.logger.exception(
-                                "Error evaluating CEL for event in insert_events",
+                            current_severity = AlertSeverity(event.severity)
+                            if previous_severity < current_severity:
+                                setattr(event, "severity_change", "increased")
+                            else:
+                                setattr(event, "severity_change", "decreased")
+
+                if not should_run:
+                    continue
+                # Lastly, if the workflow should run, add it to the scheduler
+                self.logger.info("Adding workflow to run")
+
+                # SHAHAR: TODO - finish redis implementation
+                # if REDIS is enabled, add the workflow to the queue
+
+                """
+                if os.environ.get("REDIS", "false").lower() == "true":
+                    try:
+                        self.logger.info("Adding workflow to REDIS")
+                        from arq import ArqRedis
+                        from keep.api.arq_pool import get_pool
+                        from keep.api.consts import KEEP_ARQ_QUEUE_WORKFLOWS
+
+                        # We need to run this asynchronously
+                        async def enqueue_workflow():
+                            redis: ArqRedis = await get_pool()
+                            job = await redis.enqueue_job(
+                                "run_workflow_in_worker",  # You'll need to create this function
+                                tenant_id,
+                                str(workflow_model.id),  # Convert UUID to string if needed
+                                "alert",  # triggered_by
+                                event,  # Pass the event
+                                _queue_name=KEEP_ARQ_QUEUE_WORKFLOWS,
+                            )
+                            self.logger.info(
+                                "Enqueued workflow job",
                                 extra={
-                                    "exception": e,
-                                    "event": event,
-                                    "trigger": trigger,
+                                    "job_id": job.job_id,
                                     "workflow_id": workflow_model.id,
                                     "tenant_id": tenant_id,
-                                    "cel": trigger["cel"],
-                                    "deprecated_filters": trigger.get("filters"),
+                                    "queue": KEEP_ARQ_QUEUE_WORKFLOWS,
                                 },
                             )
-                            continue
 
-                    if bool(should_run) is False:
-                        self.logger.debug(
-                            "Workflow should not run, skipping",
+                        # Execute the async function
+                        loop = asyncio.new_event_loop()
+                        asyncio.set_event_loop(loop)
+                        job_id = loop.run_until_complete(enqueue_workflow())
+                        self.logger.info("Job enqueued", extra={"job_id": job_id})
+                    except Exception as e:
+                        self.logger.error(
+                            "Failed to enqueue workflow job",
                             extra={
-                                "triggers": workflow.workflow_triggers,
+                                "exception": str(e),
                                 "workflow_id": workflow_model.id,
                                 "tenant_id": tenant_id,
-                                "cel": trigger["cel"],
-                                "deprecated_filters": trigger.get("filters"),
                             },
                         )
-                        continue
-
-                    # enrich the alert with more data
-                    self.logger.info("Found a workflow to run")
-                    event.trigger = "alert"
-                    # prepare the alert with the enrichment
-                    self.logger.info("Enriching alert")
-                    alert_enrichment = get_enrichment(tenant_id, event.fingerprint)
-                    if alert_enrichment:
-                        for k, v in alert_enrichment.enrichments.items():
-                            setattr(event, k, v)
-                    self.logger.info("Alert enriched")
-                    # apply only_on_change (https://github.com/keephq/keep/issues/801)
-                    fields_that_needs_to_be_change = trigger.get("only_on_change", [])
-                    severity_changed = trigger.get("severity_changed", False)
-                    # if there are fields that needs to be changed, get the previous alert
-                    if fields_that_needs_to_be_change or severity_changed:
-                        previous_alert = get_previous_alert_by_fingerprint(
-                            tenant_id, event.fingerprint
-                        )
-                        if severity_changed:
-                            fields_that_needs_to_be_change.append("severity")
-                        # now compare:
-                        #   (no previous alert means that the workflow should run)
-                        if previous_alert:
-                            for field in fields_that_needs_to_be_change:
-                                # the field hasn't change
-                                if getattr(event, field) == previous_alert.event.get(
-                                    field
-                                ):
-                                    self.logger.info(
-                                        "Skipping the workflow because the field hasn't change",
-                                        extra={
-                                            "field": field,
-                                            "event": event,
-                                            "previous_alert": previous_alert,
-                                        },
-                                    )
-                                    should_run = False
-                                    break
-                            if should_run and severity_changed:
-                                setattr(event, "severity_changed", True)
-                                setattr(
-                                    event,
-                                    "previous_severity",
-                                    previous_alert.event.get("severity"),
-                                )
-                                previous_severity = AlertSeverity(
-                                    previous_alert.event.get("severity")
-                                )
-                                current_severity = AlertSeverity(event.severity)
-                                if previous_severity < current_severity:
-                                    setattr(event, "severity_change", "increased")
-                                else:
-                                    setattr(event, "severity_change", "decreased")
-
-                    if not should_run:
-                        continue
-                    # Lastly, if the workflow should run, add it to the scheduler
-                    self.logger.info("Adding workflow to run")
-
-                    # SHAHAR: TODO - finish redis implementation
-                    # if REDIS is enabled, add the workflow to the queue
-
-                    """
-                    if os.environ.get("REDIS", "false").lower() == "true":
-                        try:
-                            self.logger.info("Adding workflow to REDIS")
-                            from arq import ArqRedis
-                            from keep.api.arq_pool import get_pool
-                            from keep.api.consts import KEEP_ARQ_QUEUE_WORKFLOWS
-
-                            # We need to run this asynchronously
-                            async def enqueue_workflow():
-                                redis: ArqRedis = await get_pool()
-                                job = await redis.enqueue_job(
-                                    "run_workflow_in_worker",  # You'll need to create this function
-                                    tenant_id,
-                                    str(workflow_model.id),  # Convert UUID to string if needed
-                                    "alert",  # triggered_by
-                                    event,  # Pass the event
-                                    _queue_name=KEEP_ARQ_QUEUE_WORKFLOWS,
-                                )
-                                self.logger.info(
-                                    "Enqueued workflow job",
-                                    extra={
-                                        "job_id": job.job_id,
-                                        "workflow_id": workflow_model.id,
-                                        "tenant_id": tenant_id,
-                                        "queue": KEEP_ARQ_QUEUE_WORKFLOWS,
-                                    },
-                                )
-
-                            # Execute the async function
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            job_id = loop.run_until_complete(enqueue_workflow())
-                            self.logger.info("Job enqueued", extra={"job_id": job_id})
-                        except Exception as e:
-                            self.logger.error(
-                                "Failed to enqueue workflow job",
-                                extra={
-                                    "exception": str(e),
-                                    "workflow_id": workflow_model.id,
-                                    "tenant_id": tenant_id,
-                                },
-                            )
-                    """
-                    with self.scheduler.lock:
-                        self.scheduler.workflows_to_run.append(
-                            {
-                                "workflow": workflow,
-                                "workflow_id": workflow_model.id,
-                                "tenant_id": tenant_id,
-                                "triggered_by": "alert",
-                                "event": event,
-                            }
-                        )
-                    self.logger.info("Workflow added to run")
+                """
+                with self.scheduler.lock:
+                    self.scheduler.workflows_to_run.append(
+                        {
+                            "workflow": workflow,
+                            "workflow_id": workflow_model.id,
+                            "tenant_id": tenant_id,
+                            "triggered_by": "alert",
+                            "event": event,
+                        }
+                    )
+                self.logger.info("Workflow added to run")
             self.logger.info("All workflows added to run")
 
     def _get_event_value(self, event, filter_key):
@@ -10,6 +10,8 @@ import requests
 import validators
 from fastapi import HTTPException
 
+from keep.api.core.cache import TenantCache
+from keep.api.core.config import config
 from keep.api.core.db import (
     add_or_update_workflow,
     delete_workflow,
@@ -25,6 +27,7 @@ from keep.api.core.workflows import get_workflows_with_last_executions_v2
 from keep.api.models.db.workflow import Workflow as WorkflowModel
 from keep.api.models.query import QueryDto
 from keep.api.models.workflow import PreparsedWorkflowDTO, ProviderDTO
+from keep.contextmanager.contextmanager import ContextManager
 from keep.functions import cyaml
 from keep.parser.parser import Parser
 from keep.providers.providers_factory import ProvidersFactory
@@ -32,6 +35,16 @@ from keep.workflowmanager.workflow import Workflow
 from sqlalchemy.exc import NoResultFound
 
 
+# Parsed workflows, keyed by (workflow_id, revision). Parsing a workflow loads
+# the installed providers and the workflow secrets, so the TTL bounds how stale
+# those (which are not part of the revision) can get.
+parsed_workflows_cache = TenantCache(
+    "parsed_workflows",
+    max_size=config("KEEP_PARSED_WORKFLOWS_CACHE_SIZE", default=1000, cast=int),
+    ttl=config("KEEP_PARSED_WORKFLOWS_CACHE_TTL", default=60, cast=int),
+)
+
+
 class WorkflowStore:
     def __init__(self):
         self.parser = Parser()
@@ -156,26 +169,49 @@ class WorkflowStore:
                 status_code=404,
                 detail=f"Workflow {workflow_id} not found",
             )
-        workflow_yaml = cyaml.safe_load(workflow.workflow_raw)
-        workflow = self.parser.parse(
-            tenant_id,
-            workflow_yaml,
-            workflow_db_id=workflow.id,
-            workflow_revision=workflow.revision,
-            is_test=workflow.is_test,
-        )
-        if len(workflow) > 1:
-            raise HTTPException(
-                status_code=500,
-                detail=f"More than one workflow with id {workflow_id} found",
+        cache_key = (workflow.id, workflow.revision)
+        cached = parsed_workflows_cache.get(tenant_id, cache_key)
+        if cached is None:
+            workflow_yaml = cyaml.safe_load(workflow.workflow_raw)
+            parsed_workflows = self.parser.parse(
+                tenant_id,
+                workflow_yaml,
+                workflow_db_id=workflow.id,
+                workflow_revision=workflow.revision,
+                is_test=workflow.is_test,
             )
-        elif workflow:
-            return workflow[0]
-        else:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Workflow {workflow_id} not found",
+            if len(parsed_workflows) > 1:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"More than one workflow with id {workflow_id} found",
+                )
+            elif not parsed_workflows:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Workflow {workflow_id} not found",
+                )
+            # the unwrapped workflow dict is what the parser gives the context manager
+            raw_workflows = workflow_yaml.get("workflows") or workflow_yaml.get(
+                "alerts"
             )
+            workflow_dict = (
+                raw_workflows[0]
+                if raw_workflows
+                else workflow_yaml.get("workflow")
+                or workflow_yaml.get("alert")
+                or workflow_yaml
+            )
+            cached = (parsed_workflows[0], workflow_dict)
+            parsed_workflows_cache.set(tenant_id, cache_key, cached)
+
+        # the cached workflow is never executed, every caller gets its own copy
+        parsed_workflow, workflow_dict = cached
+        context_manager = ContextManager(
+            tenant_id=tenant_id,
+            workflow_id=parsed_workflow.workflow_id,
+            workflow=workflow_dict,
+        )
+        return parsed_workflow.with_context(context_manager)
 
     def get_workflow_from_dict(self, tenant_id: str, workflow_dict: dict) -> Workflow:
         logging.info("Parsing workflow from dict", extra={"workflow": workflow_dict})
@@ -0,0 +1,330 @@
+"""
+Per-tenant index of the alert triggers of all the enabled workflows.
+
+Instead of loading and parsing every workflow for every incoming alert, the
+alert triggers are compiled once per workflow revision and bucketed by the
+equality conditions every matching alert must satisfy (e.g. `source == "x"`,
+`severity == "critical"`, `status == "firing"`). For a given alert only the
+triggers of the matching buckets (plus the triggers that could not be bucketed)
+have to be evaluated.
+
+The index is validated against the (workflow_id, revision) pairs in the db on
+every use, so workflows added, updated, disabled or deleted by another process
+are picked up on the next batch of alerts.
+"""
+
+import dataclasses
+import enum
+import logging
+import re
+import typing
+
+import celpy
+
+from keep.api.core.cache import TenantCache
+from keep.api.core.config import config
+from keep.api.core.db import get_all_workflows, get_all_workflows_revisions
+from keep.api.models.db.workflow import Workflow as WorkflowModel
+from keep.api.utils.cel_utils import preprocess_cel_expression
+from keep.functions import cyaml
+
+# fields that are used to bucket the triggers, by order of preference
+INDEXED_FIELDS = ("source", "severity", "status")
+
+_EQUALITY_PATTERN = re.compile(
+    r"(?P<field>source|severity|status)\s*==\s*"
+    r"(?P<quote>[\"'])(?P<value>[^\"'\\]*)(?P=quote)"
+)
+_SOURCE_CONTAINS_PATTERN = re.compile(
+    r"source\.contains\(\s*(?P<quote>[\"'])(?P<value>[^\"'\\]*)(?P=quote)\s*\)"
+)
+_SOURCE_EQUALITY_PATTERN = re.compile(r'source\s*==\s*[\'"]([^\'"]+)[\'"]')
+
+# compiled alert triggers of a workflow, keyed by (workflow_id, revision)
+workflow_triggers_cache = TenantCache(
+    "workflow_triggers",
+    max_size=config("KEEP_WORKFLOW_TRIGGERS_CACHE_SIZE", default=10000, cast=int),
+)
+# the bucketed index of each tenant, keyed by "index"
+workflow_trigger_index_cache = TenantCache("workflow_trigger_index")
+
+
+@dataclasses.dataclass
+class AlertTrigger:
+    workflow_model: WorkflowModel
+    trigger: dict
+    # None means the trigger has neither filters nor cel and always runs
+    program: typing.Optional[celpy.Runner]
+    cel: typing.Optional[str]
+    bucket: typing.Optional[tuple[str, str]]
+    position: int = 0
+
+
+class TenantTriggerIndex:
+    def __init__(self, revisions: dict[str, int], triggers: list[AlertTrigger]):
+        self.revisions = revisions
+        self.triggers = triggers
+        self.buckets: dict[tuple[str, str], list[AlertTrigger]] = {}
+        self.unbucketed: list[AlertTrigger] = []
+        for position, alert_trigger in enumerate(triggers):
+            alert_trigger.position = position
+            if alert_trigger.bucket is None:
+                self.unbucketed.append(alert_trigger)
+            else:
+                self.buckets.setdefault(alert_trigger.bucket, []).append(alert_trigger)
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+    def candidates(self, event) -> list[AlertTrigger]:
+        """Return the triggers that may match the event, in workflow order."""
+        candidates = list(self.unbucketed)
+        for bucket in event_buckets(event):
+            candidates.extend(self.buckets.get(bucket, []))
+        candidates.sort(key=lambda alert_trigger: alert_trigger.position)
+        return candidates
+
+
+def event_buckets(event) -> set[tuple[str, str]]:
+    buckets = set()
+    for field in INDEXED_FIELDS:
+        value = getattr(event, field, None)
+        if value is None:
+            continue
+        values = value if isinstance(value, list) else [value]
+        for value in values:
+            if isinstance(value, enum.Enum):
+                value = value.value
+            buckets.add(_bucket(field, str(value)))
+    return buckets
+
+
+def _bucket(field: str, value: str) -> tuple[str, str]:
+    # severity is compared by order after preprocess_cel_expression (case insensitive)
+    if field == "severity":
+        value = value.lower()
+    return (field, value)
+
+
+def _split_top_level(expression: str, operator: str) -> list[str]:
+    """Split the expression on an operator that is not inside parentheses or quotes."""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    i = 0
+    while i < len(expression):
+        char = expression[i]
+        if quote:
+            if char == "\\":
+                i += 2
+                continue
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif depth == 0 and expression.startswith(operator, i):
+            parts.append(expression[start:i].strip())
+            i += len(operator)
+            start = i
+            continue
+        i += 1
+    parts.append(expression[start:].strip())
+    return parts
+
+
+def _is_wrapped_in_parentheses(expression: str) -> bool:
+    if not (expression.startswith("(") and expression.endswith(")")):
+        return False
+    depth = 0
+    quote = None
+    for i, char in enumerate(expression):
+        if quote:
+            if char == quote and expression[i - 1] != "\\":
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i == len(expression) - 1
+    return False
+
+
+def required_equalities(cel: str) -> list[tuple[str, str]]:
+    """Return the (field, value) equalities every event matching the CEL must satisfy.
+
+    Only top level conjunctions are considered, anything else (||, negations,
+    other operators) is simply not used for bucketing.
+    """
+    cel = cel.strip()
+    if len(_split_top_level(cel, "||")) > 1:
+        return []
+    conjuncts = _split_top_level(cel, "&&")
+    if len(conjuncts) > 1:
+        equalities = []
+        for conjunct in conjuncts:
+            equalities.extend(required_equalities(conjunct))
+        return equalities
+    if _is_wrapped_in_parentheses(cel):
+        return required_equalities(cel[1:-1])
+    match = _EQUALITY_PATTERN.fullmatch(cel)
+    if match:
+        return [_bucket(match.group("field"), match.group("value"))]
+    match = _SOURCE_CONTAINS_PATTERN.fullmatch(cel)
+    if match:
+        return [("source", match.group("value"))]
+    return []
+
+
+def _choose_bucket(cel: str) -> typing.Optional[tuple[str, str]]:
+    equalities = required_equalities(cel)
+    for field in INDEXED_FIELDS:
+        for equality in equalities:
+            if equality[0] == field:
+                return equality
+    return None
+
+
+def get_raw_workflow_triggers(workflow_raw: str) -> list[dict]:
+    workflow_yaml = cyaml.safe_load(workflow_raw) or {}
+    # same lookup as Parser.parse (the "alert" keys are backward compatibility)
+    raw_workflows = workflow_yaml.get("workflows") or workflow_yaml.get("alerts")
+    if raw_workflows:
+        workflow_yaml = raw_workflows[0]
+    else:
+        workflow_yaml = (
+            workflow_yaml.get("workflow") or workflow_yaml.get("alert") or workflow_yaml
+        )
+    return workflow_yaml.get("triggers", []) or []
+
+
+class WorkflowTriggerIndex:
+    def __init__(self, filters_to_cel: typing.Callable[[list[dict]], str]):
+        self.logger = logging.getLogger(__name__)
+        self.cel_environment = celpy.Environment()
+        self.filters_to_cel = filters_to_cel
+
+    def get(self, tenant_id: str) -> TenantTriggerIndex:
+        """Return the trigger index of the tenant, rebuilt if any workflow changed."""
+        revisions = get_all_workflows_revisions(tenant_id, exclude_disabled=True)
+        index = workflow_trigger_index_cache.get(tenant_id, "index")
+        if index is not None and index.revisions == revisions:
+            return index
+
+        self.logger.info(
+            "Building workflow trigger index",
+            extra={"tenant_id": tenant_id, "num_of_workflows": len(revisions)},
+        )
+        compiled = {}
+        missing = False
+        for workflow_id, revision in revisions.items():
+            workflow_triggers = workflow_triggers_cache.get(
+                tenant_id, (workflow_id, revision)
+            )
+            if workflow_triggers is None:
+                missing = True
+                continue
+            compiled[workflow_id] = workflow_triggers
+
+        if missing:
+            for workflow_model in get_all_workflows(tenant_id, exclude_disabled=True):
+                if workflow_model.id in compiled:
+                    continue
+                workflow_triggers = self._compile_workflow_triggers(
+                    tenant_id, workflow_model
+                )
+                workflow_triggers_cache.set(
+                    tenant_id,
+                    (workflow_model.id, workflow_model.revision),
+                    workflow_triggers,
+                )
+                compiled[workflow_model.id] = workflow_triggers
+
+        triggers = [
+            dataclasses.replace(alert_trigger)
+            for workflow_id in revisions
+            for alert_trigger in compiled.get(workflow_id, [])
+        ]
+        index = TenantTriggerIndex(revisions, triggers)
+        workflow_trigger_index_cache.set(tenant_id, "index", index)
+        self.logger.info(
+            "Built workflow trigger index",
+            extra={
+                "tenant_id": tenant_id,
+                "num_of_triggers": len(index),
+                "num_of_unbucketed_triggers": len(index.unbucketed),
+            },
+        )
+        return index
+
+    def _compile_workflow_triggers(
+        self, tenant_id: str, workflow_model: WorkflowModel
+    ) -> list[AlertTrigger]:
+        extra = {"workflow_id": workflow_model.id, "tenant_id": tenant_id}
+        try:
+            triggers = get_raw_workflow_triggers(workflow_model.workflow_raw)
+        except Exception:
+            self.logger.exception("Error loading workflow triggers", extra=extra)
+            return []
+
+        alert_triggers = []
+        for trigger in triggers:
+            # If the trigger is not an alert, it's not relevant for alerts.
+            if not isinstance(trigger, dict) or trigger.get("type") != "alert":
+                continue
+            alert_trigger = self._compile_trigger(workflow_model, trigger, extra)
+            if alert_trigger is not None:
+                alert_triggers.append(alert_trigger)
+        return alert_triggers
+
+    def _compile_trigger(
+        self, workflow_model: WorkflowModel, trigger: dict, extra: dict
+    ) -> typing.Optional[AlertTrigger]:
+        extra = {**extra, "trigger": trigger}
+        if "filters" not in trigger and "cel" not in trigger:
+            self.logger.warning("Trigger is missing filters or cel", extra=extra)
+            return AlertTrigger(workflow_model, trigger, None, None, None)
+
+        cel = trigger.get("cel", "")
+        # backward compatibility for filter. should be removed in the future
+        # if triggers and cel are set, we override the cel with filters.
+        if "filters" in trigger:
+            try:
+                cel = self.filters_to_cel(trigger["filters"])
+            except Exception:
+                self.logger.exception(
+                    "Failed to convert filters to CEL, workflow will not run",
+                    extra=extra,
+                )
+                return None
+
+        if not cel:
+            self.logger.warning("Trigger is missing cel", extra=extra)
+            return None
+
+        bucket = _choose_bucket(cel)
+        try:
+            # source is a special case which can be used as string comparison
+            # although it is a list
+            preprocessed_cel = _SOURCE_EQUALITY_PATTERN.sub(
+                r'source.contains("\1")', cel
+            )
+            # handle severity comparisons properly
+            preprocessed_cel = preprocess_cel_expression(preprocessed_cel)
+            program = self.cel_environment.program(
+                self.cel_environment.compile(preprocessed_cel)
+            )
+        except Exception:
+            self.logger.exception(
+                "Error compiling trigger CEL, workflow will not run",
+                extra={**extra, "cel": cel},
+            )
+            return None
+        return AlertTrigger(workflow_model, trigger, program, cel, bucket)
@@ -0,0 +1,83 @@
+"""
+Microbenchmark of the AlertDto construction from db rows.
+
+Compares AlertDto(**event) with AlertDto.from_trusted(event) on the same stored
+events (as convert_db_alerts_to_dto_alerts builds them, with enrichments) and
+checks that both give the exact same alerts.
+
+    python scripts/benchmark_alert_dto.py --num 10000
+"""
+
+import argparse
+import logging
+import time
+
+from keep.api.models.alert import AlertDto
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def make_events(num: int) -> list[dict]:
+    events = []
+    for i in range(num):
+        # stored as the dict of the ingested alert
+        event = AlertDto(
+            id=f"alert-{i}",
+            name=f"alert-{i % 100}",
+            fingerprint=f"fp-{i % 100}",
+            source=["prometheus"],
+            status="firing",
+            severity="critical",
+            lastReceived="2025-01-30T09:19:02.519Z",
+            description="Pod 'api-service-production' lacks memory " * 5,
+            url="https://example.com/alerts?id=1234",
+            labels={
+                "pod": f"api-service-{i}",
+                "namespace": "production",
+                "container": "api",
+                "annotations": {"runbook": "https://example.com/runbook"},
+            },
+            providerId="prometheus-benchmark",
+            providerType="prometheus",
+        ).dict()
+        # and some enrichments
+        if i % 3 == 0:
+            event.update({"status": "acknowledged", "note": "looking into it"})
+        if i % 5 == 0:
+            event.update({"dismissed": "true", "dismissUntil": "forever"})
+        events.append(event)
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AlertDto construction.")
+    parser.add_argument(
+        "--num", type=int, default=10000, help="Number of alerts to construct."
+    )
+    args = parser.parse_args()
+
+    events = make_events(args.num)
+
+    start = time.perf_counter()
+    validated_alerts = [AlertDto(**event) for event in events]
+    validated_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    trusted_alerts = [AlertDto.from_trusted(event) for event in events]
+    trusted_duration = time.perf_counter() - start
+
+    mismatches = sum(
+        validated_alert.dict() != trusted_alert.dict()
+        for validated_alert, trusted_alert in zip(validated_alerts, trusted_alerts)
+    )
+    print(f"alerts:     {args.num}")
+    print(f"validated:  {validated_duration:.3f}s")
+    print(f"trusted:    {trusted_duration:.3f}s")
+    print(f"speedup:    {validated_duration / trusted_duration:.1f}x")
+    print(f"mismatches: {mismatches}")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
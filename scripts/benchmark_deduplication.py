@@ -0,0 +1,92 @@
+"""
+Microbenchmark of the alert deduplication hashing.
+
+Compares AlertDeduplicator.apply_deduplication (per alert) with
+AlertDeduplicator.apply_deduplication_batch on the same alerts and checks that
+both give the exact same hashes.
+
+    python scripts/benchmark_deduplication.py --num 10000
+"""
+
+import argparse
+import logging
+import time
+
+from keep.api.alert_deduplicator.alert_deduplicator import AlertDeduplicator
+from keep.api.models.alert import AlertDto
+
+logging.basicConfig(level=logging.WARNING)
+
+TENANT_ID = "benchmark"
+
+
+def make_alerts(num: int) -> list[AlertDto]:
+    return [
+        AlertDto(
+            id=f"alert-{i}",
+            name=f"alert-{i % 100}",
+            fingerprint=f"fp-{i % 100}",
+            source=["prometheus"],
+            status="firing",
+            severity="critical",
+            lastReceived="2025-01-30T09:19:02.519Z",
+            description="Pod 'api-service-production' lacks memory " * 5,
+            labels={
+                "pod": f"api-service-{i}",
+                "namespace": "production",
+                "container": "api",
+                "annotations": {"runbook": "https://example.com/runbook"},
+            },
+            providerId="prometheus-benchmark",
+            providerType="prometheus",
+        )
+        for i in range(num)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark alert deduplication.")
+    parser.add_argument(
+        "--num", type=int, default=10000, help="Number of alerts to deduplicate."
+    )
+    args = parser.parse_args()
+
+    # no db: don't write deduplication events and give the last hashes upfront
+    AlertDeduplicator.DEDUPLICATION_DISTRIBUTION_ENABLED = False
+    alert_deduplicator = AlertDeduplicator(TENANT_ID)
+    rule = alert_deduplicator._get_default_full_deduplication_rule(
+        "prometheus-benchmark", "prometheus"
+    )
+    rule.ignore_fields = ["lastReceived", "labels.pod"]
+    last_alert_fingerprint_to_hash = {f"fp-{i}": "previous-hash" for i in range(100)}
+
+    alerts = make_alerts(args.num)
+    start = time.perf_counter()
+    for alert in alerts:
+        alert_deduplicator.apply_deduplication(
+            alert, [rule], last_alert_fingerprint_to_hash
+        )
+    per_alert_duration = time.perf_counter() - start
+
+    batch_alerts = make_alerts(args.num)
+    start = time.perf_counter()
+    alert_deduplicator.apply_deduplication_batch(
+        batch_alerts, [rule], last_alert_fingerprint_to_hash
+    )
+    batch_duration = time.perf_counter() - start
+
+    mismatches = sum(
+        alert.alert_hash != batch_alert.alert_hash
+        for alert, batch_alert in zip(alerts, batch_alerts)
+    )
+    print(f"alerts:     {args.num}")
+    print(f"per alert:  {per_alert_duration:.3f}s")
+    print(f"batch:      {batch_duration:.3f}s")
+    print(f"speedup:    {per_alert_duration / batch_duration:.1f}x")
+    print(f"mismatches: {mismatches}")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@ from starlette_context import context, request_cycle_context
 from playwright.sync_api import Page
 
 # This import is required to create the tables
+from keep.api.core.cache import clear_all_caches
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
 from keep.api.core.elastic import ElasticClient
 from keep.api.models.db.alert import *
@@ -87,6 +88,13 @@ def mocked_context(ctx_store) -> None:
         yield context
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # in-process caches must not leak between tests (e.g. tests with mocked sessions)
+    clear_all_caches()
+    yield
+
+
 @pytest.fixture
 def context_manager():
     os.environ["STORAGE_MANAGER_DIRECTORY"] = "/tmp/storage-manager"
@@ -623,6 +631,8 @@ def setup_alerts(elastic_client, db_session, request):
             last_alert = existed_last_alerts_dict[alert.fingerprint]
             last_alert.alert_id = alert.id
             last_alert.timestamp = alert.timestamp
+            for field, value in get_last_alert_hot_fields(alert.event, None).items():
+                setattr(last_alert, field, value)
             last_alerts.append(last_alert)
         else:
             last_alerts.append(
@@ -632,6 +642,7 @@ def setup_alerts(elastic_client, db_session, request):
                     timestamp=alert.timestamp,
                     first_timestamp=alert.timestamp,
                     alert_id=alert.id,
+                    **get_last_alert_hot_fields(alert.event, None),
                 )
             )
     db_session.add_all(last_alerts)
@@ -689,6 +700,10 @@ def setup_stress_alerts_no_elastic(db_session):
                 last_alert = existed_last_alerts_dict[alert.fingerprint]
                 last_alert.alert_id = alert.id
                 last_alert.timestamp = alert.timestamp
+                for field, value in get_last_alert_hot_fields(
+                    alert.event, None
+                ).items():
+                    setattr(last_alert, field, value)
                 last_alerts.append(last_alert)
             else:
                 last_alerts.append(
@@ -698,6 +713,7 @@ def setup_stress_alerts_no_elastic(db_session):
                         timestamp=alert.timestamp,
                         first_timestamp=alert.timestamp,
                         alert_id=alert.id,
+                        **get_last_alert_hot_fields(alert.event, None),
                     )
                 )
         db_session.add_all(last_alerts)
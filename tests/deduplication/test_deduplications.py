@@ -1,18 +1,23 @@
+import json
 import logging
 import random
 import time
 import uuid
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 import pytz
 from sqlalchemy import text
 
+import keep.api.core.cache as cache
+from keep.api.alert_deduplicator.alert_deduplicator import AlertDeduplicator
 from keep.api.core.db import get_last_alerts
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
-from keep.api.models.alert import DeduplicationRuleDto, AlertStatus
+from keep.api.models.alert import AlertDto, AlertStatus, DeduplicationRuleDto
 from keep.api.models.db.alert import AlertDeduplicationRule, AlertDeduplicationEvent, Alert
 from keep.api.utils.enrichment_helpers import convert_db_alerts_to_dto_alerts
+from keep.providers.base.base_provider import invalidate_format_alert_cache
 from keep.providers.providers_factory import ProvidersFactory
 from tests.fixtures.client import client, setup_api_key, test_app  # noqa
 
@@ -1018,3 +1023,128 @@ def test_sort_keys_deduplication_fix(db_session, client, test_app):
     assert prometheus_rule is not None
     assert prometheus_rule.get("ingested") == 2
     assert prometheus_rule.get("dedup_ratio") == 50.0  # 1 out of 2 was deduplicated
+
+
+def test_format_alert_caches_provider_lookups(db_session, mocker):
+    is_linked_provider = mocker.patch(
+        "keep.providers.base.base_provider.is_linked_provider", return_value=True
+    )
+    get_custom_deduplication_rule = mocker.patch(
+        "keep.providers.base.base_provider.get_custom_deduplication_rule",
+        return_value=None,
+    )
+    provider_class = ProvidersFactory.get_provider_class("prometheus")
+    for _ in range(3):
+        provider_class.format_alert(
+            provider_class.simulate_alert(),
+            SINGLE_TENANT_UUID,
+            "prometheus",
+            "prometheus-id",
+        )
+    assert is_linked_provider.call_count == 1
+    assert get_custom_deduplication_rule.call_count == 1
+
+    # providers/deduplication rules CRUD drop the cached lookups of the tenant
+    invalidate_format_alert_cache(SINGLE_TENANT_UUID)
+    provider_class.format_alert(
+        provider_class.simulate_alert(),
+        SINGLE_TENANT_UUID,
+        "prometheus",
+        "prometheus-id",
+    )
+    assert is_linked_provider.call_count == 2
+    assert get_custom_deduplication_rule.call_count == 2
+
+
+def test_format_alert_cache_invalidated_in_other_processes(
+    db_session, mocker, monkeypatch
+):
+    published = []
+    monkeypatch.setattr(cache, "REDIS", True)
+    monkeypatch.setattr(cache, "_subscriber_started", True)
+    monkeypatch.setattr(
+        "keep.api.redis_settings.get_redis_client",
+        lambda: SimpleNamespace(
+            publish=lambda channel, data: published.append(json.loads(data))
+        ),
+    )
+    is_linked_provider = mocker.patch(
+        "keep.providers.base.base_provider.is_linked_provider", return_value=True
+    )
+    provider_class = ProvidersFactory.get_provider_class("prometheus")
+
+    def format_alert():
+        provider_class.format_alert(
+            provider_class.simulate_alert(),
+            SINGLE_TENANT_UUID,
+            "prometheus",
+            "prometheus-id",
+        )
+
+    # e.g. a provider installed through the API
+    invalidate_format_alert_cache(SINGLE_TENANT_UUID)
+    assert published == [
+        {"cache": "format_alert_providers", "tenant_id": SINGLE_TENANT_UUID}
+    ]
+    format_alert()
+    format_alert()
+    assert is_linked_provider.call_count == 1
+
+    # received by the subscriber of an arq worker
+    cache.handle_invalidation(published[0])
+    format_alert()
+    assert is_linked_provider.call_count == 2
+
+
+def test_apply_deduplication_batch_same_hashes(db_session):
+    alert_deduplicator = AlertDeduplicator(SINGLE_TENANT_UUID)
+    rule = alert_deduplicator._get_default_full_deduplication_rule(
+        "test-provider", "keep"
+    )
+    rule.ignore_fields = ["lastReceived", "labels.pod", "labels.nested.x"]
+
+    def make_alerts():
+        return [
+            AlertDto(
+                id=f"alert-{i}",
+                name=f"alert-{i % 3}",
+                fingerprint=f"fp-{i % 3}",
+                source=["keep"],
+                status="firing",
+                severity="critical",
+                lastReceived=datetime.utcnow().isoformat(),
+                labels={"pod": f"pod-{i}", "nested": {"x": i, "y": 1}},
+                providerId="test-provider",
+                providerType="keep",
+            )
+            for i in range(6)
+        ]
+
+    legacy_alerts = make_alerts()
+    last_alert_fingerprint_to_hash = {"fp-0": "some-other-hash"}
+    for alert in legacy_alerts:
+        alert_deduplicator.apply_deduplication(
+            alert, [rule], last_alert_fingerprint_to_hash
+        )
+    # alert-1 is a full duplicate of the "last" fp-1 alert
+    last_alert_fingerprint_to_hash["fp-1"] = legacy_alerts[1].alert_hash
+
+    legacy_alerts = make_alerts()
+    for alert in legacy_alerts:
+        alert_deduplicator.apply_deduplication(
+            alert, [rule], last_alert_fingerprint_to_hash
+        )
+    batch_alerts = alert_deduplicator.apply_deduplication_batch(
+        make_alerts(), [rule], last_alert_fingerprint_to_hash
+    )
+
+    for legacy_alert, batch_alert in zip(legacy_alerts, batch_alerts):
+        assert batch_alert.alert_hash == legacy_alert.alert_hash
+        assert batch_alert.isFullDuplicate == legacy_alert.isFullDuplicate
+        assert batch_alert.isPartialDuplicate == legacy_alert.isPartialDuplicate
+    assert batch_alerts[1].isFullDuplicate
+    assert batch_alerts[0].isPartialDuplicate
+    assert not batch_alerts[2].isFullDuplicate
+
+    # same deduplication events as the per alert path (6 + 6 + 6)
+    assert db_session.query(AlertDeduplicationEvent).count() == 18
@@ -262,3 +262,34 @@ def test_alert_dismiss_forever():
     with freezegun.freeze_time(now + timedelta(days=365)):
         revalidated_alert = AlertDto(**alert.dict())
         assert revalidated_alert.dismissed is True
+
+
+@pytest.mark.parametrize(
+    "enrichments",
+    [
+        {},
+        {"status": "acknowledged", "note": "looking into it"},
+        {"severity": "not-a-severity"},
+        {"dismissed": "true", "dismissUntil": "forever"},
+        {"dismissed": True, "dismissUntil": "2020-01-01T00:00:00.000Z"},
+        {"deleted": ["2024-01-01T00:00:00.000Z"]},
+        {"url": "example.com/alert 1"},
+        # coerced or normalized by the full validation
+        {"firingCounter": "3"},
+        {"lastReceived": "2024-01-01T02:00:00+02:00"},
+        {"custom_field": {"nested": 1}},
+    ],
+)
+def test_alert_dto_from_trusted_matches_validation(enrichments):
+    event = create_basic_alert(
+        name="Trusted",
+        last_received="2024-01-01T00:00:00.000Z",
+        status="firing",
+        severity="critical",
+        source=["keep"],
+        url="https://example.com/alert",
+        labels={"pod": "api"},
+    ).dict()
+    event.update(enrichments)
+
+    assert AlertDto.from_trusted(event).dict() == AlertDto(**event).dict()
@@ -968,6 +968,48 @@ def test_cel_equality_int_str_type_coercion(db_session):
     assert len(result4) == 1
 
 
+def test_match_presets(db_session, mocker):
+    import uuid
+
+    from keep.api.models.alert import AlertDto
+    from keep.api.models.db.preset import PresetDto
+    from keep.rulesengine.rulesengine import RulesEngine
+
+    def preset(name, cel):
+        return PresetDto(
+            id=uuid.uuid4(), name=name, options=[{"label": "CEL", "value": cel}]
+        )
+
+    presets = [
+        preset("feed", ""),
+        preset("critical", 'severity == "critical"'),
+        preset("grafana", 'source.contains("grafana")'),
+        preset("coerced", 'field == "2"'),
+        preset("none", 'name == "does-not-exist"'),
+    ]
+    alerts = [
+        AlertDto(id="a1", name="a1", severity="critical", source=["prometheus"]),
+        AlertDto(id="a2", name="a2", severity="info", source=["grafana"], field=2),
+    ]
+    engine = RulesEngine()
+    get_alerts_activation = mocker.spy(engine, "get_alerts_activation")
+
+    matched_presets = engine.match_presets(alerts, presets)
+    # the activations are built once for all the presets
+    assert get_alerts_activation.call_count == 1
+
+    assert [p.name for p in matched_presets] == [
+        p.name for p in presets if engine.filter_alerts(alerts, p.cel_query)
+    ]
+    assert [p.name for p in matched_presets] == [
+        "feed",
+        "critical",
+        "grafana",
+        "coerced",
+    ]
+    assert engine.match_presets([], presets) == []
+
+
 def test_check_if_rule_apply_int_str_type_coercion(db_session):
     """
     Test that _check_if_rule_apply handles type coercion between int and str in CEL expressions.
@@ -0,0 +1,141 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from sqlalchemy.exc import OperationalError
+
+import keep.api.core.alerts as alerts
+import keep.api.core.cache as cache
+from keep.api.core.alerts import (
+    alert_facets_cache,
+    get_alert_facets_data,
+    invalidate_alert_facets_cache,
+    static_facets,
+)
+from keep.api.models.facet import FacetOptionDto, FacetOptionsQueryDto
+
+SEVERITY_FACET_ID = static_facets[0].id
+STATUS_FACET_ID = static_facets[1].id
+
+
+def _mock_get_facet_options(monkeypatch, delay=0):
+    calls = []
+    lock = threading.Lock()
+
+    def get_facet_options(facets, facet_options_query, **kwargs):
+        with lock:
+            facet_ids = sorted(facet.id for facet in facets)
+            calls.append((facet_ids, facet_options_query.facet_queries))
+        time.sleep(delay)
+        return {
+            facet.id: [
+                FacetOptionDto(display_name="x", value="x", matches_count=len(calls))
+            ]
+            for facet in facets
+        }
+
+    monkeypatch.setattr(alerts, "get_facet_options", get_facet_options)
+    return calls
+
+
+def test_alert_facets_cache_loads_only_missing_facets(monkeypatch):
+    calls = _mock_get_facet_options(monkeypatch)
+    hits, misses = alert_facets_cache.hits, alert_facets_cache.misses
+
+    get_alert_facets_data(
+        "keep",
+        FacetOptionsQueryDto(cel="", facet_queries={SEVERITY_FACET_ID: ""}),
+    )
+    facet_options = get_alert_facets_data(
+        "keep",
+        FacetOptionsQueryDto(
+            cel="", facet_queries={SEVERITY_FACET_ID: "", STATUS_FACET_ID: ""}
+        ),
+    )
+
+    assert list(facet_options) == [SEVERITY_FACET_ID, STATUS_FACET_ID]
+    assert calls == [
+        ([SEVERITY_FACET_ID], {SEVERITY_FACET_ID: ""}),
+        ([STATUS_FACET_ID], {STATUS_FACET_ID: ""}),
+    ]
+    assert alert_facets_cache.hits - hits == 1
+    assert alert_facets_cache.misses - misses == 2
+
+    # a different facet cel is another key
+    get_alert_facets_data(
+        "keep",
+        FacetOptionsQueryDto(cel="", facet_queries={SEVERITY_FACET_ID: "x == 1"}),
+    )
+    assert len(calls) == 3
+
+    invalidate_alert_facets_cache("keep")
+    get_alert_facets_data(
+        "keep",
+        FacetOptionsQueryDto(cel="", facet_queries={SEVERITY_FACET_ID: ""}),
+    )
+    assert len(calls) == 4
+
+
+def test_alert_facets_cache_coalesces_concurrent_requests(monkeypatch):
+    calls = _mock_get_facet_options(monkeypatch, delay=0.2)
+    query = FacetOptionsQueryDto(
+        cel="", facet_queries={SEVERITY_FACET_ID: "", STATUS_FACET_ID: ""}
+    )
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(
+            pool.map(lambda _: get_alert_facets_data("keep", query), range(5))
+        )
+
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+
+
+def test_alert_facets_cache_skips_failed_loads(monkeypatch):
+    calls = _mock_get_facet_options(monkeypatch)
+    mocked_get_facet_options = alerts.get_facet_options
+    failures = [OperationalError("SELECT", {}, Exception("database is locked"))]
+
+    def get_facet_options(facets, facet_options_query, **kwargs):
+        assert kwargs["raise_on_error"]
+        if failures:
+            raise failures.pop()
+        return mocked_get_facet_options(facets, facet_options_query, **kwargs)
+
+    monkeypatch.setattr(alerts, "get_facet_options", get_facet_options)
+    invalidate_alert_facets_cache("keep")
+    query = FacetOptionsQueryDto(cel="", facet_queries={SEVERITY_FACET_ID: ""})
+
+    assert get_alert_facets_data("keep", query) == {SEVERITY_FACET_ID: []}
+    facet_options = get_alert_facets_data("keep", query)
+
+    assert len(calls) == 1
+    assert facet_options[SEVERITY_FACET_ID][0].matches_count == 1
+
+
+def test_alert_facets_cache_invalidated_in_other_processes(monkeypatch):
+    calls = _mock_get_facet_options(monkeypatch)
+    published = []
+    monkeypatch.setattr(cache, "REDIS", True)
+    monkeypatch.setattr(cache, "_subscriber_started", True)
+    monkeypatch.setattr(
+        "keep.api.redis_settings.get_redis_client",
+        lambda: SimpleNamespace(
+            publish=lambda channel, data: published.append(json.loads(data))
+        ),
+    )
+    query = FacetOptionsQueryDto(cel="", facet_queries={SEVERITY_FACET_ID: ""})
+
+    # e.g. alerts processed by an arq worker
+    invalidate_alert_facets_cache("keep")
+    assert published == [{"cache": "alert_facets", "tenant_id": "keep"}]
+    get_alert_facets_data("keep", query)
+    get_alert_facets_data("keep", query)
+    assert len(calls) == 1
+
+    # received by the subscriber of an API process
+    cache.handle_invalidation(published[0])
+    get_alert_facets_data("keep", query)
+    assert len(calls) == 2
@@ -378,3 +378,30 @@ def test_oauth_proxy2(db_session, client, test_app):
         json={"email": "shahar", "role": "admin"},
     )
     assert response.status_code == 403
+
+
+def test_api_key_cache_invalidation(db_session):
+    from keep.api.models.db.tenant import TenantApiKey
+    from keep.identitymanager.api_key_cache import (
+        get_cached_api_key,
+        hash_api_key,
+        invalidate_api_keys,
+    )
+
+    setup_api_key(db_session, "cached_api_key")
+    tenant_api_key = get_cached_api_key("cached_api_key")
+    assert tenant_api_key.tenant_id == SINGLE_TENANT_UUID
+
+    # rotate the key behind the cache's back, the old one is still served
+    db_api_key = (
+        db_session.query(TenantApiKey)
+        .filter_by(key_hash=hash_api_key("cached_api_key"))
+        .one()
+    )
+    db_api_key.key_hash = hash_api_key("rotated_api_key")
+    db_session.commit()
+    assert get_cached_api_key("cached_api_key") is not None
+
+    invalidate_api_keys(hash_api_key("cached_api_key"))
+    assert get_cached_api_key("cached_api_key") is None
+    assert get_cached_api_key("rotated_api_key").tenant_id == SINGLE_TENANT_UUID
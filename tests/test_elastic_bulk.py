@@ -0,0 +1,73 @@
+import threading
+
+import keep.api.core.elastic as elastic
+from keep.api.core.elastic import ElasticBulkFlusher, ElasticClient
+
+
+def _elastic_client(tenant_id="keep"):
+    # an enabled client without a connection, bulk is mocked
+    client = ElasticClient.__new__(ElasticClient)
+    client.tenant_id = tenant_id
+    client.enabled = True
+    client.refresh_strategy = "false"
+    client.logger = elastic.logging.getLogger(__name__)
+    client._client = None
+    return client
+
+
+def test_bulk_index_documents_retries_rejected_documents(monkeypatch):
+    calls = []
+    responses = [
+        (
+            1,
+            [
+                {"index": {"_id": "b", "status": 429, "error": "queue full"}},
+                {"index": {"_id": "c", "status": 400, "error": "mapping"}},
+            ],
+        ),
+        (1, []),
+    ]
+
+    def bulk(client, actions, **kwargs):
+        calls.append([action["_id"] for action in actions])
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(elastic, "bulk", bulk)
+    monkeypatch.setattr(elastic.time, "sleep", lambda seconds: None)
+    monkeypatch.setenv("ELASTIC_INDEX_SUFFIX", "test")
+
+    indexed, failed = _elastic_client().bulk_index_documents(
+        {"a": {"name": "a"}, "b": {"name": "b"}, "c": {"name": "c"}}
+    )
+
+    assert (indexed, failed) == (2, 1)
+    # only the document rejected with a transient error is retried
+    assert calls == [["a", "b", "c"], ["b"]]
+
+
+def test_elastic_bulk_flusher_buffers_across_jobs(monkeypatch):
+    indexed = []
+    flushed = threading.Event()
+
+    def bulk(client, actions, **kwargs):
+        indexed.append({action["_id"]: action["_source"] for action in actions})
+        flushed.set()
+        return len(actions), []
+
+    monkeypatch.setattr(elastic, "bulk", bulk)
+    monkeypatch.setenv("ELASTIC_INDEX_SUFFIX", "test")
+    flusher = ElasticBulkFlusher(flush_size=3, flush_interval=60)
+    flusher._clients["keep"] = _elastic_client()
+    flusher.start()
+    try:
+        flusher.add("keep", {"a": {"v": 1}, "b": {"v": 1}})
+        flusher.add("keep", {"a": {"v": 2}})
+        assert not flushed.wait(0.2)
+
+        # full buffer
+        flusher.add("keep", {"c": {"v": 1}})
+        assert flushed.wait(5)
+    finally:
+        flusher.stop()
+
+    assert indexed == [{"a": {"v": 2}, "b": {"v": 1}, "c": {"v": 1}}]
@@ -13,6 +13,7 @@ from keep.api.core.dependencies import SINGLE_TENANT_UUID
 from keep.api.models.action_type import ActionType
 from keep.api.models.alert import AlertDto, AlertStatus
 from keep.api.models.db.alert import Alert
+from keep.api.models.db.enrichment_event import EnrichmentStatus, EnrichmentType
 from keep.api.models.db.extraction import ExtractionRule
 from keep.api.models.db.mapping import MappingRule
 from keep.api.models.db.topology import TopologyService
@@ -188,6 +189,45 @@ def test_run_extraction_rules_empty_attribute_value(mock_session, mock_alert_dto
     assert enriched_event == mock_alert_dto  # Check if event is unchanged
 
 
+def test_run_extraction_rules_batch(mock_session):
+    rule = ExtractionRule(
+        id=1,
+        tenant_id="test_tenant",
+        priority=1,
+        attribute="{{ name }}",
+        regex="(?P<service_name>[a-z]+)-(?P<alert_type>[a-z]+)",
+        disabled=False,
+        pre=True,
+        condition='severity == "critical"',
+    )
+    mock_session.query.return_value.filter.return_value.filter.return_value.filter.return_value.order_by.return_value.all.return_value = [
+        rule
+    ]
+    events = [
+        {"name": "backend-cpu", "severity": "critical", "source": ["test"]},
+        {"name": "frontend-memory", "severity": "critical", "source": ["test"]},
+        {"name": "database-disk", "severity": "info", "source": ["test"]},
+    ]
+
+    enrichment_bl = EnrichmentsBl(tenant_id="test_tenant", db=mock_session)
+    enriched_events = enrichment_bl.run_extraction_rules_batch(events, pre=True)
+    enriched_event = enrichment_bl.run_extraction_rules(
+        {"name": "queue-lag", "severity": "critical"}, pre=True
+    )
+
+    assert [event.get("service_name") for event in enriched_events] == [
+        "backend",
+        "frontend",
+        None,
+    ]
+    assert enriched_events[1]["alert_type"] == "memory"
+    assert enriched_event["service_name"] == "queue"
+    # the compiled rules are cached per tenant
+    assert [call.args for call in mock_session.query.call_args_list].count(
+        (ExtractionRule,)
+    ) == 1
+
+
 #### 2. Testing `run_extraction_rules` with CEL Conditions
 
 
@@ -290,6 +330,52 @@ def test_run_mapping_rules_with_regex_match(mock_session, mock_alert_dto):
     ), "Service should not match any entry"
 
 
+def test_run_mapping_rules_index_matches_row_scan(mock_session, mock_alert_dto):
+    rows = [{"name": f"service-{i}", "service": f"service_{i}"} for i in range(1000)]
+    rows[500:500] = [{"name": "^(keep-)?backend-.*$", "service": "backend_service"}]
+    rows[200:200] = [{"env": "staging", "service": "staging_service"}]
+    rule = MappingRule(
+        id=1,
+        tenant_id="test_tenant",
+        priority=1,
+        matchers=[["name"], ["env"]],
+        rows=rows,
+        disabled=False,
+        type="csv",
+    )
+    mock_session.query.return_value.filter.return_value.filter.return_value.order_by.return_value.all.return_value = [
+        rule
+    ]
+    enrichment_bl = EnrichmentsBl(tenant_id="test_tenant", db=mock_session)
+
+    for name, env in [
+        ("service-999", "prod"),
+        ("my-service-42-canary", "prod"),  # cells are searched, not compared
+        ("keep-backend-api", "prod"),
+        ("service-999", "staging"),
+        ("unmatched", "prod"),
+    ]:
+        mock_alert_dto.name = name
+        mock_alert_dto.env = env
+        if hasattr(mock_alert_dto, "service"):
+            del mock_alert_dto.service
+        expected = None
+        for row in rows:
+            if any(
+                enrichment_bl._check_matcher(mock_alert_dto, row, matcher)
+                for matcher in rule.matchers
+            ):
+                expected = row["service"]
+                break
+        enrichment_bl.run_mapping_rules(mock_alert_dto)
+        assert getattr(mock_alert_dto, "service", None) == expected, name
+
+    # the rules (and their index) are cached per tenant
+    assert [call.args for call in mock_session.query.call_args_list].count(
+        (MappingRule,)
+    ) == 1
+
+
 def test_run_mapping_rules_no_match(mock_session, mock_alert_dto):
     rule = MappingRule(
         id=1,
@@ -633,10 +719,10 @@ def test_topology_mapping_rule_enrichment(mock_session, mock_alert_dto):
 
     mock_alert_dto.service = "test-service"
 
-    # Mock the get_topology_data_by_dynamic_matcher to return the mock topology service
+    # Mock the topology services the topology index is built from
     with patch(
-        "keep.api.bl.enrichments_bl.get_topology_data_by_dynamic_matcher",
-        return_value=mock_topology_service,
+        "keep.topologies.topology_index.get_topology_services_with_applications",
+        return_value=[mock_topology_service],
     ):
         # Mock the enrichment database function so no actual DB actions occur
         with patch(
@@ -1127,3 +1213,77 @@ def test_alert_enrichment_via_api_non_uuid(db_session, client, test_app, create_
 
     assert alert_data["enriched_fields"] == ["jira_ticket"]
     assert alert_data["jira_ticket"] == "12345"
+
+
+def test_mapping_rules_enrichment_events_buffered(mock_session, mock_alert_dto):
+    rules = [
+        MappingRule(
+            id=i,
+            tenant_id="test_tenant",
+            priority=1,
+            matchers=[["name"]] if i == 0 else [[f"missing_attribute_{i}"]],
+            rows=[{"name": "unmatched-service", "service": "backend_service"}],
+            disabled=False,
+            type="csv",
+        )
+        for i in range(5)
+    ]
+    mock_session.query.return_value.filter.return_value.filter.return_value.order_by.return_value.all.return_value = (
+        rules
+    )
+    mock_alert_dto.id = str(uuid.uuid4())
+
+    enrichment_bl = EnrichmentsBl(tenant_id="test_tenant", db=mock_session)
+    enrichment_bl.enrichment_events_tracker.skipped_sample_rate = 0.5
+    enrichment_bl.buffer_enrichment_events()
+    with patch("keep.api.bl.enrichments_bl.random.random", side_effect=[0.1, 0.9] * 2):
+        enrichment_bl.run_mapping_rules(mock_alert_dto)
+
+    # nothing is written while buffering
+    mock_session.commit.assert_not_called()
+    mock_session.bulk_save_objects.assert_not_called()
+
+    enrichment_bl.flush_enrichment_events()
+
+    # the failure and half of the skipped events, in one bulk insert
+    events = mock_session.bulk_save_objects.call_args_list[0].args[0]
+    assert [event.status for event in events] == ["failure", "skipped", "skipped"]
+    logs = mock_session.bulk_save_objects.call_args_list[1].args[0]
+    assert {log.enrichment_event_id for log in logs} <= {event.id for event in events}
+    mock_session.commit.assert_called_once()
+
+
+def test_enrichment_events_tracker_tenant_policy(mock_session):
+    with patch(
+        "keep.api.core.tenant_configuration.TenantConfiguration._TenantConfiguration.get_configuration",
+        return_value={"statuses": ["success", "failure"]},
+    ):
+        enrichment_bl = EnrichmentsBl(tenant_id="test_tenant", db=mock_session)
+        tracker = enrichment_bl.enrichment_events_tracker
+
+    assert tracker.should_track(EnrichmentStatus.SUCCESS)
+    assert tracker.should_track(EnrichmentStatus.FAILURE)
+    assert not tracker.should_track(EnrichmentStatus.SKIPPED)
+
+
+def test_enrichment_events_of_explicit_rule_runs_always_tracked(
+    mock_session, mock_alert_dto
+):
+    enrichment_bl = EnrichmentsBl(tenant_id="test_tenant", db=mock_session)
+    enrichment_bl.enrichment_events_tracker.statuses = {"failure"}
+    mock_alert_dto.id = str(uuid.uuid4())
+
+    # e.g. the "run now" of a rule, not buffered
+    enrichment_bl._track_enrichment_event(
+        mock_alert_dto.id, EnrichmentStatus.SKIPPED, EnrichmentType.MAPPING, 1, {}
+    )
+    assert enrichment_bl.enrichment_event_id is not None
+    mock_session.commit.assert_called_once()
+
+    # the pipeline follows the policy, and an untracked event has no id
+    enrichment_bl.buffer_enrichment_events()
+    enrichment_bl._track_enrichment_event(
+        mock_alert_dto.id, EnrichmentStatus.SKIPPED, EnrichmentType.MAPPING, 1, {}
+    )
+    assert enrichment_bl.enrichment_event_id is None
+    assert enrichment_bl.enrichment_events_tracker.events == []
@@ -0,0 +1,123 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from arq import Retry
+
+import keep.api.arq_worker as arq_worker
+from keep.api.arq_worker import EventCoalescer
+from keep.api.tasks.process_event_task import EventsNotSavedException
+
+
+def _process_event_kwargs(event, provider_id="grafana-1"):
+    return {
+        "tenant_id": "keep",
+        "provider_type": "grafana",
+        "provider_id": provider_id,
+        "fingerprint": None,
+        "api_key_name": "webhook",
+        "trace_id": None,
+        "event": event,
+        "notify_client": True,
+        "timestamp_forced": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_event_coalescer_processes_events_in_micro_batches(monkeypatch):
+    calls = []
+
+    def process_event(ctx, event, **kwargs):
+        calls.append((kwargs["provider_id"], event))
+
+    monkeypatch.setattr(arq_worker, "process_event", process_event)
+    coalescer = EventCoalescer(window_ms=50, max_size=3)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        await asyncio.gather(
+            *(
+                coalescer.submit(
+                    {"pool": pool, "job_id": f"job-{i}"},
+                    _process_event_kwargs({"id": i}),
+                )
+                for i in range(4)
+            ),
+            coalescer.submit(
+                {"pool": pool, "job_id": "job-other"},
+                _process_event_kwargs({"id": "other"}, provider_id="grafana-2"),
+            ),
+        )
+
+    assert sorted(calls, key=str) == sorted(
+        [
+            # the first batch is flushed when full, the rest when the window elapses
+            ("grafana-1", [{"id": 0}, {"id": 1}, {"id": 2}]),
+            ("grafana-1", {"id": 3}),
+            ("grafana-2", {"id": "other"}),
+        ],
+        key=str,
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_coalescer_isolates_failing_events(monkeypatch):
+    calls = []
+
+    def process_event(ctx, event, raise_on_error=False, **kwargs):
+        calls.append(event)
+        events = event if isinstance(event, list) else [event]
+        if any(event.get("bad") for event in events):
+            # bad events fail while they are formatted, before anything is saved
+            if raise_on_error:
+                raise EventsNotSavedException("bad event")
+            raise ValueError("bad event")
+        return ctx["job_id"]
+
+    monkeypatch.setattr(arq_worker, "process_event", process_event)
+    coalescer = EventCoalescer(window_ms=10, max_size=100)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = await asyncio.gather(
+            *(
+                coalescer.submit(
+                    {"pool": pool, "job_id": f"job-{i}"},
+                    _process_event_kwargs({"id": i, "bad": i == 1}),
+                )
+                for i in range(3)
+            ),
+            return_exceptions=True,
+        )
+
+    assert results[0] == "job-0"
+    assert isinstance(results[1], ValueError)
+    assert results[2] == "job-2"
+    # the batch, then every event on its own
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_event_coalescer_retries_batch_failing_after_save(monkeypatch):
+    calls = []
+
+    def process_event(ctx, event, raise_on_error=False, **kwargs):
+        calls.append(event)
+        raise ValueError("failed after the events were saved")
+
+    monkeypatch.setattr(arq_worker, "process_event", process_event)
+    coalescer = EventCoalescer(window_ms=10, max_size=100)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = await asyncio.gather(
+            *(
+                coalescer.submit(
+                    {"pool": pool, "job_id": f"job-{i}", "job_try": 1},
+                    _process_event_kwargs({"id": i}),
+                )
+                for i in range(3)
+            ),
+            return_exceptions=True,
+        )
+
+    # the jobs are retried by arq instead of being processed again one by one
+    assert all(isinstance(result, Retry) for result in results)
+    assert len(calls) == 1
@@ -1,27 +1,39 @@
+import json
 from datetime import UTC, datetime, timedelta
 from itertools import cycle
+from types import SimpleNamespace
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
-from sqlalchemy import and_, desc, distinct, func
+from sqlalchemy import and_, desc, distinct, event, func
 
+import keep.api.core.cache as cache
 from keep.api.bl.incidents_bl import IncidentBl
+from keep.api.core.cursor import InvalidCursorException, encode_cursor
 from keep.api.core.db import (
     IncidentSorting,
     add_alerts_to_incident,
     create_incident_from_dict,
+    delete_incident_by_id,
+    enrich_alerts_with_incidents,
     get_alert_by_event_id,
     get_alerts_data_for_incident,
     get_incident_alerts_by_incident_id,
     get_incident_by_id,
+    get_last_alerts,
     get_last_incidents,
     merge_incidents_to_id,
     remove_alerts_to_incident_by_incident_id,
 )
 from keep.api.core.db_utils import get_json_extract_field
 from keep.api.core.dependencies import SINGLE_TENANT_EMAIL, SINGLE_TENANT_UUID
+from keep.api.core.incidents import (
+    get_last_incidents_by_cel,
+    get_last_incidents_page_by_cel,
+)
+from keep.api.core.query_count import CountStrategy
 from keep.api.models.alert import AlertSeverity, AlertStatus
 from keep.api.models.db.alert import (
     NULL_FOR_DELETED_AT,
@@ -370,6 +382,111 @@ def test_get_last_incidents(db_session, create_alert):
     assert all(["keep" in i.affected_services for i in incidents_with_filters_5])
 
 
+@pytest.mark.parametrize(
+    "sorting",
+    [
+        # paginated with a seek predicate
+        IncidentSorting.creation_time,
+        IncidentSorting.severity_desc,
+        # falls back to an offset kept in the cursor
+        IncidentSorting.start_time,
+    ],
+)
+def test_get_last_incidents_cursor_pagination(db_session, monkeypatch, sorting):
+    # the incidents queries run on their own session
+    monkeypatch.setattr("keep.api.core.incidents.engine", db_session.get_bind())
+    severity_cycle = cycle([s.order for s in IncidentSeverity])
+    for i in range(12):
+        create_incident_from_dict(
+            SINGLE_TENANT_UUID,
+            {
+                "user_generated_name": f"test-{i}",
+                "user_summary": f"test-{i}",
+                "is_candidate": False,
+                "severity": next(severity_cycle),
+                "start_time": datetime.utcnow() + timedelta(minutes=i),
+            },
+        )
+
+    incident_ids = []
+    severities = []
+    cursor = ""
+    while cursor is not None:
+        incidents, total_count, cursor, _ = get_last_incidents_page_by_cel(
+            SINGLE_TENANT_UUID, limit=5, sorting=sorting, cursor=cursor
+        )
+        assert total_count == 12
+        incident_ids.extend(incident.id for incident in incidents)
+        severities.extend(incident.severity for incident in incidents)
+
+    assert len(incident_ids) == len(set(incident_ids)) == 12
+    if sorting == IncidentSorting.severity_desc:
+        assert severities == sorted(severities, reverse=True)
+    else:
+        expected, _ = get_last_incidents_by_cel(
+            SINGLE_TENANT_UUID, limit=100, sorting=sorting
+        )
+        assert incident_ids == [incident.id for incident in expected]
+
+    # the content of the cursor is validated
+    with pytest.raises(InvalidCursorException):
+        get_last_incidents_page_by_cel(
+            SINGLE_TENANT_UUID,
+            limit=5,
+            sorting=sorting,
+            cursor=encode_cursor({"sort": sorting.value, "offset": "x"}),
+        )
+
+
+def test_get_last_incidents_cached_count_invalidated(db_session, monkeypatch):
+    monkeypatch.setattr("keep.api.core.incidents.engine", db_session.get_bind())
+    monkeypatch.setattr(
+        "keep.api.core.query_count.KEEP_QUERY_COUNT_STRATEGY", CountStrategy.CACHED
+    )
+    published = []
+    monkeypatch.setattr(cache, "REDIS", True)
+    monkeypatch.setattr(cache, "_subscriber_started", True)
+    monkeypatch.setattr(
+        "keep.api.redis_settings.get_redis_client",
+        lambda: SimpleNamespace(
+            publish=lambda channel, data: published.append(json.loads(data))
+        ),
+    )
+
+    def create_incident(i):
+        return create_incident_from_dict(
+            SINGLE_TENANT_UUID,
+            {"user_generated_name": f"test-{i}", "is_candidate": False},
+        )
+
+    def get_count():
+        _, total_count, _, count_strategy = get_last_incidents_page_by_cel(
+            SINGLE_TENANT_UUID, limit=5, cel="status == 'firing'", cursor=""
+        )
+        return total_count, count_strategy
+
+    incidents = [create_incident(i) for i in range(3)]
+    assert get_count() == (3, CountStrategy.EXACT)
+    assert get_count() == (3, CountStrategy.CACHED)
+
+    # the count is dropped by every incident mutation, in every process
+    published.clear()
+    create_incident(3)
+    assert published == [{"cache": "query_counts", "tenant_id": SINGLE_TENANT_UUID}]
+    assert get_count() == (4, CountStrategy.EXACT)
+
+    delete_incident_by_id(SINGLE_TENANT_UUID, incidents[0].id)
+    assert get_count() == (3, CountStrategy.EXACT)
+
+    merge_incidents_to_id(SINGLE_TENANT_UUID, [incidents[1].id], incidents[2].id)
+    assert get_count() == (2, CountStrategy.EXACT)
+    assert get_count() == (2, CountStrategy.CACHED)
+
+    # received by the subscriber of another process
+    cache.handle_invalidation(published[0])
+    assert get_count() == (2, CountStrategy.EXACT)
+
+
 @pytest.mark.parametrize("test_app", ["NO_AUTH"], indirect=True)
 def test_incident_status_change(
     db_session, client, test_app, setup_stress_alerts_no_elastic
@@ -1787,3 +1904,53 @@ def test_incident_auto_resolve_only_if_active(db_session, create_alert):
         )
         assert incident_bl_mock.call_count == 2 # firing and acknowledged
 
+
+def test_enrich_alerts_with_incidents_statements_per_page(
+    db_session, setup_stress_alerts_no_elastic
+):
+    alerts = setup_stress_alerts_no_elastic(20)
+    incidents = [
+        create_incident_from_dict(
+            SINGLE_TENANT_UUID,
+            {"user_generated_name": f"test-{i}", "user_summary": "test"},
+        )
+        for i in range(2)
+    ]
+    for incident in incidents:
+        add_alerts_to_incident(
+            SINGLE_TENANT_UUID, incident, [alert.fingerprint for alert in alerts]
+        )
+
+    engine = db_session.get_bind()
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    def get_page(limit):
+        db_alerts = get_last_alerts(SINGLE_TENANT_UUID, limit=limit)
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            db_alerts = enrich_alerts_with_incidents(SINGLE_TENANT_UUID, db_alerts)
+            alerts_dto = convert_db_alerts_to_dto_alerts(db_alerts, with_incidents=True)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+        return alerts_dto, len(statements)
+
+    small_page, small_page_statements = get_page(5)
+    page, page_statements = get_page(20)
+
+    assert len(small_page) == 5
+    assert len(page) == 20
+    # the incidents of a page are loaded at once, whatever its size
+    assert page_statements == small_page_statements
+
+    incident_ids = sorted(str(incident.id) for incident in incidents)
+    for alert_dto in page:
+        assert sorted(alert_dto.incident.split(",")) == incident_ids
+        # one IncidentDto per incident, shared by its alerts
+        for incident_dto in alert_dto.incident_dto:
+            assert incident_dto is next(
+                dto for dto in page[0].incident_dto if dto.id == incident_dto.id
+            )
@@ -0,0 +1,105 @@
+import logging
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from jwcrypto import jwk, jwt
+
+from ee.identitymanager.identity_managers.keycloak.keycloak_authverifier import (
+    KeycloakAuthVerifier,
+)
+from keep.identitymanager.authenticatedentity import AuthenticatedEntity
+from keycloak import KeycloakOpenID
+
+
+def _keycloak_auth_verifier(scope="read:alert"):
+    # a verifier with stubbed Keycloak clients, nothing is sent to Keycloak
+    verifier = KeycloakAuthVerifier.__new__(KeycloakAuthVerifier)
+    verifier.scopes = [scope]
+    verifier.logger = logging.getLogger(__name__)
+    verifier.keycloak_url = "http://keycloak"
+    verifier.keycloak_realm = "keep"
+    verifier.keycloak_multi_org = False
+    verifier.protected_resource = "keep-resource"
+    verifier.keycloak_client = KeycloakOpenID(
+        server_url="http://keycloak", realm_name="keep", client_id="keep"
+    )
+    verifier.keycloak_uma = MagicMock()
+    return verifier
+
+
+def _realm_key():
+    key = jwk.JWK.generate(kty="RSA", size=2048)
+    public_key_pem = key.export_to_pem().decode()
+    # the realm public key as returned by Keycloak, without the PEM header and footer
+    return key, "".join(public_key_pem.strip().splitlines()[1:-1])
+
+
+def _signed_token(key, **claims):
+    token = jwt.JWT(header={"alg": "RS256"}, claims=claims)
+    token.make_signed_token(key)
+    return token.serialize()
+
+
+def test_keycloak_token_validated_with_cached_public_key():
+    verifier = _keycloak_auth_verifier()
+    key, public_key = _realm_key()
+    verifier.keycloak_client.public_key = MagicMock(return_value=public_key)
+    token = _signed_token(key, jti="token-1", exp=int(time.time()) + 300)
+
+    assert verifier._decode_token(token)["jti"] == "token-1"
+    assert verifier._decode_token(token)["jti"] == "token-1"
+    verifier.keycloak_client.public_key.assert_called_once()
+
+    # the realm key was rotated
+    rotated_key, rotated_public_key = _realm_key()
+    verifier.keycloak_client.public_key.return_value = rotated_public_key
+    token = _signed_token(rotated_key, jti="token-2", exp=int(time.time()) + 300)
+    assert verifier._decode_token(token)["jti"] == "token-2"
+    assert verifier.keycloak_client.public_key.call_count == 2
+
+    expired_token = _signed_token(rotated_key, jti="token-3", exp=int(time.time()) - 60)
+    with pytest.raises(Exception, match="Expired"):
+        verifier._decode_token(expired_token)
+    assert verifier.keycloak_client.public_key.call_count == 2
+
+
+def test_keycloak_uma_decisions_cache():
+    verifier = _keycloak_auth_verifier()
+    verifier.keycloak_uma.permissions_check.return_value = True
+    authenticated_entity = AuthenticatedEntity(
+        "keep",
+        "user@keephq.dev",
+        role="admin",
+        token="token",
+        token_id="token-1",
+        token_expires_at=time.time() + 300,
+    )
+
+    verifier._authorize(authenticated_entity)
+    verifier._authorize(authenticated_entity)
+    assert verifier.keycloak_uma.permissions_check.call_count == 1
+
+    # another scope is another decision
+    other_verifier = _keycloak_auth_verifier(scope="write:alert")
+    other_verifier.keycloak_uma = verifier.keycloak_uma
+    other_verifier._authorize(authenticated_entity)
+    assert verifier.keycloak_uma.permissions_check.call_count == 2
+
+    # the decision is not kept past the token expiration
+    authenticated_entity.token_id = "token-2"
+    authenticated_entity.token_expires_at = time.time() - 1
+    verifier._authorize(authenticated_entity)
+    verifier._authorize(authenticated_entity)
+    assert verifier.keycloak_uma.permissions_check.call_count == 4
+
+    # denials are cached too
+    authenticated_entity.token_id = "token-3"
+    authenticated_entity.token_expires_at = time.time() + 300
+    verifier.keycloak_uma.permissions_check.return_value = False
+    for _ in range(2):
+        with pytest.raises(HTTPException) as e:
+            verifier._authorize(authenticated_entity)
+        assert e.value.status_code == 403
+    assert verifier.keycloak_uma.permissions_check.call_count == 5
@@ -0,0 +1,233 @@
+import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+import keep.api.core.db as db
+import keep.api.tasks.process_event_task as process_event_task
+from keep.api.bl.enrichments_bl import invalidate_extraction_rules_cache
+from keep.api.core.alerts import build_total_alerts_query, query_last_alerts
+from keep.api.core.db import (
+    enrich_entity,
+    get_alerts_fields,
+    get_last_alert_by_fingerprint,
+)
+from keep.api.core.dependencies import SINGLE_TENANT_UUID
+from keep.api.models.action_type import ActionType
+from keep.api.models.alert import AlertDto, AlertStatus
+from keep.api.models.db.alert import Alert
+from keep.api.models.db.extraction import ExtractionRule
+from keep.api.models.query import QueryDto
+from keep.api.tasks.process_event_task import process_event
+
+STATUSES = [
+    AlertStatus.FIRING,
+    AlertStatus.FIRING,
+    AlertStatus.ACKNOWLEDGED,
+    AlertStatus.FIRING,
+    AlertStatus.RESOLVED,
+    AlertStatus.FIRING,
+]
+
+
+def _batch(prefix: str, last_received: datetime.datetime) -> list[AlertDto]:
+    events = []
+    for i, status in enumerate(STATUSES):
+        received = (last_received + datetime.timedelta(seconds=i)).isoformat()
+        for fingerprint in (f"{prefix}-a", f"{prefix}-b"):
+            events.append(
+                AlertDto(
+                    id=f"{fingerprint}-{i}",
+                    name=fingerprint,
+                    # lastReceived is ignored by the deduplication
+                    description=f"{fingerprint} received at {received}",
+                    status=status.value,
+                    source=["test"],
+                    fingerprint=fingerprint,
+                    lastReceived=received,
+                )
+            )
+    return events
+
+
+def _process(events: list[AlertDto]) -> list[AlertDto]:
+    return process_event(
+        ctx={"job_try": 1},
+        trace_id="test",
+        tenant_id=SINGLE_TENANT_UUID,
+        provider_id="test",
+        provider_type="test",
+        fingerprint=None,
+        api_key_name=None,
+        event=events,
+        notify_client=False,
+    )
+
+
+@pytest.mark.parametrize("batches", [1, 2])
+def test_bulk_save_matches_per_alert_save(db_session, monkeypatch, batches):
+    # the saved and enriched alerts, as handed to the workflow manager
+    inserted_events = []
+    monkeypatch.setattr(
+        process_event_task.WorkflowManager,
+        "get_instance",
+        lambda: SimpleNamespace(
+            insert_events=lambda tenant_id, events: inserted_events.append(events)
+        ),
+    )
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    results = {}
+    for mode, bulk in (("legacy", False), ("bulk", True)):
+        monkeypatch.setattr(process_event_task, "KEEP_BULK_SAVE_TO_DB_ENABLED", bulk)
+        for batch in range(batches):
+            _process(_batch(mode, now + datetime.timedelta(minutes=batch)))
+        results[mode] = inserted_events[-1]
+
+    assert len(results["legacy"]) == len(results["bulk"]) == len(STATUSES) * 2
+    for legacy, bulk in zip(results["legacy"], results["bulk"]):
+        assert legacy.firingCounter == bulk.firingCounter
+        assert legacy.unresolvedCounter == bulk.unresolvedCounter
+        assert (legacy.startedAt is None) == (bulk.startedAt is None)
+        assert (legacy.firingStartTime is None) == (bulk.firingStartTime is None)
+
+    for mode in ("legacy", "bulk"):
+        for suffix in ("a", "b"):
+            fingerprint = f"{mode}-{suffix}"
+            assert (
+                db_session.query(Alert).filter(Alert.fingerprint == fingerprint).count()
+                == len(STATUSES) * batches
+            )
+
+    # LastAlert points to the last alert of the batch, even with equal timestamps
+    for suffix in ("a", "b"):
+        fingerprint = f"bulk-{suffix}"
+        last_alert = get_last_alert_by_fingerprint(
+            SINGLE_TENANT_UUID, fingerprint, session=db_session
+        )
+        last_event = [e for e in results["bulk"] if e.fingerprint == fingerprint][-1]
+        assert str(last_alert.alert_id) == last_event.event_id
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_last_alert_hot_fields(db_session, monkeypatch, bulk):
+    monkeypatch.setattr(process_event_task, "KEEP_BULK_SAVE_TO_DB_ENABLED", bulk)
+    # lastReceived is kept with a millisecond precision
+    now = datetime.datetime.now(tz=datetime.timezone.utc).replace(microsecond=0)
+    events = _batch("hot", now)
+    for event in events:
+        event.severity = "warning"
+    _process(events)
+
+    last_alert = get_last_alert_by_fingerprint(
+        SINGLE_TENANT_UUID, "hot-a", session=db_session
+    )
+    assert last_alert.severity == "warning"
+    assert last_alert.status == AlertStatus.FIRING.value
+    assert last_alert.last_received == (
+        now + datetime.timedelta(seconds=len(STATUSES) - 1)
+    ).replace(tzinfo=None)
+
+    # enrichments override the event values
+    enrich_entity(
+        SINGLE_TENANT_UUID,
+        "hot-a",
+        {"status": AlertStatus.ACKNOWLEDGED.value, "severity": "critical"},
+        action_type=ActionType.GENERIC_ENRICH,
+        action_callee="test",
+        action_description="test",
+    )
+    db_session.expire_all()
+    last_alert = get_last_alert_by_fingerprint(
+        SINGLE_TENANT_UUID, "hot-a", session=db_session
+    )
+    assert last_alert.severity == "critical"
+    assert last_alert.status == AlertStatus.ACKNOWLEDGED.value
+
+    # and the query is served by the lastalert columns
+    alerts, total_count = query_last_alerts(
+        SINGLE_TENANT_UUID,
+        QueryDto(cel="severity == 'critical' && status == 'acknowledged'"),
+    )
+    assert total_count == 1
+    assert [alert.fingerprint for alert in alerts] == ["hot-a"]
+    count_query = str(
+        build_total_alerts_query(
+            SINGLE_TENANT_UUID, QueryDto(cel="severity > 'warning'")
+        )
+    )
+    assert "alertenrichment" not in count_query
+
+
+def test_alert_fields_upserted_once(db_session, monkeypatch):
+    upserted = []
+    upsert_alert_fields = process_event_task.upsert_new_alert_fields
+
+    def upsert_new_alert_fields(*args, **kwargs):
+        upserted.append(upsert_alert_fields(*args, **kwargs))
+        return upserted[-1]
+
+    monkeypatch.setattr(
+        process_event_task, "upsert_new_alert_fields", upsert_new_alert_fields
+    )
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    _process(_batch("fields", now))
+    _process(_batch("fields", now + datetime.timedelta(minutes=1)))
+
+    # a single upsert for the first batch, nothing new in the second one
+    assert upserted[0] > 0
+    assert upserted[1] == 0
+    field_names = {field.field_name for field in get_alerts_fields(SINGLE_TENANT_UUID)}
+    assert {"name", "status", "fingerprint"} <= field_names
+
+
+def test_alert_fields_not_known_until_committed(db_session, monkeypatch):
+    upsert_alert_fields = db._upsert_alert_fields
+    calls = []
+
+    def _upsert_alert_fields(tenant_id, fields, session=None):
+        calls.append(set(fields))
+        if len(calls) == 1:
+            raise OperationalError("upsert", {}, Exception("Deadlock found"))
+        upsert_alert_fields(tenant_id, fields, session=session)
+
+    monkeypatch.setattr(db, "_upsert_alert_fields", _upsert_alert_fields)
+    fields = {("name", "test", "test"), ("status", "test", "test")}
+
+    with pytest.raises(OperationalError):
+        db.upsert_new_alert_fields(SINGLE_TENANT_UUID, fields)
+    # the failed fields are upserted again
+    assert db.upsert_new_alert_fields(SINGLE_TENANT_UUID, fields) == 2
+    assert db.upsert_new_alert_fields(SINGLE_TENANT_UUID, fields) == 0
+    assert calls == [fields, fields]
+
+
+def test_pre_extraction_rules_applied_to_event_lists(db_session, monkeypatch):
+    inserted_events = []
+    monkeypatch.setattr(
+        process_event_task.WorkflowManager,
+        "get_instance",
+        lambda: SimpleNamespace(
+            insert_events=lambda tenant_id, events: inserted_events.append(events)
+        ),
+    )
+    db_session.add(
+        ExtractionRule(
+            tenant_id=SINGLE_TENANT_UUID,
+            priority=1,
+            name="service",
+            attribute="{{ name }}",
+            regex="(?P<service>[a-z]+)-(?P<suffix>[a-z])",
+            disabled=False,
+            pre=True,
+            created_by="test",
+        )
+    )
+    db_session.commit()
+    invalidate_extraction_rules_cache(SINGLE_TENANT_UUID)
+
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    _process(_batch("pre", now))
+
+    # the pre-formatting rules run on each event of a list payload too
+    assert {event.service for event in inserted_events[-1]} == {"pre"}
@@ -61,7 +61,14 @@ def test_provider_factory_is_using_config_key_from_db(db_session):
     db_session.commit()
 
     with patch('keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager') as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {"key": "value"}
-        ProvidersFactory.get_installed_providers(tenant_id=SINGLE_TENANT_UUID)
-        assert mock_secret_manager.return_value.read_secret.call_args[1]['secret_name'] == custom_configuration_key
+        mock_secret_manager.return_value.read_secrets.return_value = {
+            custom_configuration_key: {"key": "value"}
+        }
+        providers = ProvidersFactory.get_installed_providers(
+            tenant_id=SINGLE_TENANT_UUID
+        )
+        assert mock_secret_manager.return_value.read_secrets.call_args[0][0] == [
+            custom_configuration_key
+        ]
+        assert providers[0].details["key"] == "value"
 
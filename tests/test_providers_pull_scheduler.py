@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import keep.providers.providers_pull_scheduler as providers_pull_scheduler
+from keep.providers.providers_pull_scheduler import ProvidersPullScheduler
+
+
+def test_providers_pull_scheduler_pulls_due_providers_once(monkeypatch):
+    now = datetime.now(tz=timezone.utc)
+    providers = {
+        "never-pulled": SimpleNamespace(last_pull_time=None),
+        "pulled-long-ago": SimpleNamespace(
+            last_pull_time=(now - timedelta(days=30)).replace(tzinfo=None)
+        ),
+        "pulled-recently": SimpleNamespace(
+            last_pull_time=(now - timedelta(minutes=1)).replace(tzinfo=None)
+        ),
+    }
+    for provider_id, provider in providers.items():
+        provider.id = provider_id
+        provider.tenant_id = "keep"
+        provider.type = "prometheus"
+        provider.pulling_enabled = True
+    pulled = []
+
+    monkeypatch.setattr(
+        providers_pull_scheduler,
+        "get_pulling_providers",
+        lambda: list(providers.values()),
+    )
+    monkeypatch.setattr(
+        providers_pull_scheduler,
+        "get_provider_by_type_and_id",
+        lambda tenant_id, provider_type, provider_id: providers[provider_id],
+    )
+    monkeypatch.setattr(
+        providers_pull_scheduler,
+        "pull_data_from_provider",
+        lambda tenant_id, provider_id, provider_type, trace_id: pulled.append(
+            provider_id
+        ),
+    )
+
+    scheduler = ProvidersPullScheduler()
+    scheduler.pull_interval = timedelta(days=7)
+    scheduler.executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        scheduler._refresh_providers()
+        scheduler._pull_due_providers(now)
+        # not due anymore until the next interval
+        scheduler._pull_due_providers(now + timedelta(minutes=1))
+    finally:
+        scheduler.executor.shutdown(wait=True)
+
+    assert sorted(pulled) == ["never-pulled", "pulled-long-ago"]
+    assert not scheduler._pulling
@@ -2458,3 +2458,43 @@ def test_rule_alerts_threshold_same_fingerprint(db_session, create_alert):
         [last_alert],
     )
     assert last_alert_dto[0].unresolvedCounter == 2
+
+
+def test_cel_programs_are_compiled_once(db_session):
+    from keep.api.utils.cel_utils import cel_program_cache
+
+    rules_engine = RulesEngine(tenant_id=SINGLE_TENANT_UUID)
+    alerts = [
+        AlertDto(
+            id=f"grafana-{i}",
+            source=["grafana"],
+            name="grafana-test-alert",
+            status=AlertStatus.FIRING,
+            severity=AlertSeverity.CRITICAL,
+            lastReceived="2021-08-01T00:00:00Z",
+        )
+        for i in range(3)
+    ]
+
+    misses_before = cel_program_cache.misses
+    for _ in range(5):
+        assert len(rules_engine.filter_alerts(alerts, 'source == "grafana"')) == 3
+    assert cel_program_cache.misses == misses_before + 1
+    assert cel_program_cache.hits >= 4
+
+    # rule CRUD drops the compiled programs of the tenant
+    create_rule_db(
+        tenant_id=SINGLE_TENANT_UUID,
+        name="test-rule",
+        definition={
+            "sql": "N/A",
+            "params": {},
+        },
+        timeframe=600,
+        timeunit="seconds",
+        definition_cel='(source == "grafana")',
+        created_by="test@keephq.dev",
+    )
+    assert len(cel_program_cache) == 0
+    assert len(rules_engine.filter_alerts(alerts, 'source == "grafana"')) == 3
+    assert cel_program_cache.misses == misses_before + 2
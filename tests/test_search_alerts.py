@@ -7,12 +7,15 @@ import freezegun
 import pytest
 
 from keep.api.bl.enrichments_bl import EnrichmentsBl
+from keep.api.core.alerts import query_last_alerts, query_last_alerts_page
+from keep.api.core.cursor import InvalidCursorException, encode_cursor
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
+from keep.api.core.query_count import CountStrategy, invalidate_query_counts_cache
 from keep.api.models.action_type import ActionType
 from keep.api.models.alert import AlertDto
 from keep.api.models.db.mapping import MappingRule
 from keep.api.models.db.preset import PresetSearchQuery as SearchQuery
-from keep.api.models.query import QueryDto
+from keep.api.models.query import QueryDto, SortOptionsDto
 from keep.searchengine.searchengine import SearchEngine
 from tests.fixtures.client import client, setup_api_key, test_app  # noqa
 
@@ -849,6 +852,104 @@ def test_last_1000(db_session, setup_stress_alerts):
     print("time taken for 10k alerts with db: ", db_end_time - db_start_time)
 
 
+@pytest.mark.parametrize(
+    "sort_options",
+    [
+        # timestamp desc and startedAt are paginated with a seek predicate
+        None,
+        [SortOptionsDto(sort_by="startedAt", sort_dir="asc")],
+        # lastReceived falls back to an offset kept in the cursor
+        [SortOptionsDto(sort_by="lastReceived", sort_dir="desc")],
+    ],
+)
+def test_query_last_alerts_cursor_pagination(
+    db_session, setup_stress_alerts_no_elastic, sort_options
+):
+    setup_stress_alerts_no_elastic(50)
+    expected_alerts, expected_count = query_last_alerts(
+        SINGLE_TENANT_UUID, QueryDto(cel="", limit=100, sort_options=sort_options)
+    )
+    assert expected_count == 50
+
+    alert_ids = []
+    cursor = ""
+    while cursor is not None:
+        alerts, total_count, cursor, _ = query_last_alerts_page(
+            SINGLE_TENANT_UUID,
+            QueryDto(cel="", limit=7, sort_options=sort_options, cursor=cursor),
+        )
+        assert total_count == 50
+        alert_ids.extend(alert.id for alert in alerts)
+    assert alert_ids == [alert.id for alert in expected_alerts]
+
+    _, _, cursor, _ = query_last_alerts_page(
+        SINGLE_TENANT_UUID, QueryDto(cel="", limit=7, cursor="")
+    )
+    # the cursor of another sorting is rejected
+    with pytest.raises(InvalidCursorException):
+        query_last_alerts_page(
+            SINGLE_TENANT_UUID,
+            QueryDto(cel="", limit=7, sort_by="name", sort_dir="asc", cursor=cursor),
+        )
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"sort": [["timestamp", "desc"]], "values": "not a list"},
+        {"sort": [["timestamp", "desc"]], "values": ["not a datetime", "x"]},
+        {"sort": [["timestamp", "desc"]], "values": []},
+        {"sort": [["lastReceived", "desc"]], "offset": "x"},
+        {"sort": [["lastReceived", "desc"]], "offset": -1},
+    ],
+)
+def test_query_last_alerts_invalid_cursor(db_session, payload):
+    sort_by, sort_dir = payload["sort"][0]
+    with pytest.raises(InvalidCursorException):
+        query_last_alerts_page(
+            SINGLE_TENANT_UUID,
+            QueryDto(
+                cel="",
+                limit=7,
+                sort_by=sort_by,
+                sort_dir=sort_dir,
+                cursor=encode_cursor(payload),
+            ),
+        )
+
+
+def test_query_last_alerts_cached_count(
+    db_session, setup_stress_alerts_no_elastic, monkeypatch
+):
+    monkeypatch.setattr(
+        "keep.api.core.query_count.KEEP_QUERY_COUNT_STRATEGY", CountStrategy.CACHED
+    )
+    setup_stress_alerts_no_elastic(10)
+    query = QueryDto(cel="", limit=5)
+
+    _, total_count, _, count_strategy = query_last_alerts_page(
+        SINGLE_TENANT_UUID, query
+    )
+    assert (total_count, count_strategy) == (10, CountStrategy.EXACT)
+
+    _, total_count, _, count_strategy = query_last_alerts_page(
+        SINGLE_TENANT_UUID, query
+    )
+    assert (total_count, count_strategy) == (10, CountStrategy.CACHED)
+
+    # another filter has its own count
+    _, total_count, _, count_strategy = query_last_alerts_page(
+        SINGLE_TENANT_UUID, QueryDto(cel="name == 'not-there'", limit=5)
+    )
+    assert (total_count, count_strategy) == (0, CountStrategy.EXACT)
+
+    invalidate_query_counts_cache(SINGLE_TENANT_UUID)
+    _, total_count, _, count_strategy = query_last_alerts_page(
+        SINGLE_TENANT_UUID, query
+    )
+    assert (total_count, count_strategy) == (10, CountStrategy.EXACT)
+
+
 # Assuming setup_alerts is a fixture that sets up the database with specified alert details
 alert_details = {
     "alert_details": [
@@ -1,5 +1,14 @@
+import threading
+
 import pytest
 
+from keep.secretmanager.cachedsecretmanager import CachedSecretManager
+from keep.secretmanager.filesecretmanager import FileSecretManager
+from keep.secretmanager.secretmanager import BaseSecretManager
+from keep.secretmanager.secretmanagerfactory import (
+    SecretManagerFactory,
+    SecretManagerTypes,
+)
 from keep.secretmanager.vaultsecretmanager import VaultSecretManager
 
 
@@ -57,3 +66,74 @@ def test_delete_secret(vault_secret_manager):
     secret_name = "test_secret"
     vault_secret_manager.delete_secret(secret_name)
     # You might want to assert logs or other side effects if necessary
+
+
+def test_read_secrets_concurrently(context_manager):
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowSecretManager(BaseSecretManager):
+        def read_secret(self, secret_name, is_json=False):
+            if secret_name == "missing":
+                raise KeyError(secret_name)
+            # only passes if the other secret is read at the same time
+            barrier.wait()
+            return {"name": secret_name} if is_json else secret_name
+
+        def write_secret(self, secret_name, secret_value):
+            pass
+
+        def delete_secret(self, secret_name):
+            pass
+
+    secrets = SlowSecretManager(context_manager).read_secrets(
+        ["a", "b", "missing"], is_json=True
+    )
+    assert secrets == {"a": {"name": "a"}, "b": {"name": "b"}}
+
+
+def test_cached_secret_manager(monkeypatch, tmp_path, context_manager):
+    monkeypatch.setenv("SECRET_MANAGER_DIRECTORY", str(tmp_path))
+    read_secret_names = []
+    read_secret = FileSecretManager.read_secret
+
+    def counting_read_secret(self, secret_name, is_json=False):
+        read_secret_names.append(secret_name)
+        return read_secret(self, secret_name, is_json=is_json)
+
+    monkeypatch.setattr(FileSecretManager, "read_secret", counting_read_secret)
+    secret_manager = SecretManagerFactory.get_secret_manager(
+        context_manager, SecretManagerTypes.FILE
+    )
+    assert isinstance(secret_manager, CachedSecretManager)
+    secret_manager.write_secret("a", '{"key": "a"}')
+    secret_manager.write_secret("b", '{"key": "b"}')
+
+    secrets = secret_manager.read_secrets(["a", "b", "missing"], is_json=True)
+    assert secrets == {"a": {"key": "a"}, "b": {"key": "b"}}
+    # callers get their own copy of the cached value
+    secrets["a"]["key"] = "changed"
+    assert secret_manager.read_secrets(["a", "b"], is_json=True) == {
+        "a": {"key": "a"},
+        "b": {"key": "b"},
+    }
+    assert sorted(read_secret_names) == ["a", "b", "missing"]
+
+    # writes and deletes drop the cached value
+    secret_manager.write_secret("a", '{"key": "new"}')
+    secret_manager.delete_secret("b")
+    assert secret_manager.read_secrets(["a", "b"], is_json=True) == {
+        "a": {"key": "new"}
+    }
+
+
+def test_secret_manager_client_is_reused(monkeypatch, context_manager):
+    monkeypatch.setenv("HASHICORP_VAULT_TOKEN", "mock_token")
+    monkeypatch.setattr("hvac.Client", MockVault)
+    secret_manager = SecretManagerFactory.get_secret_manager(
+        context_manager, SecretManagerTypes.VAULT
+    )
+    other_secret_manager = SecretManagerFactory.get_secret_manager(
+        context_manager, SecretManagerTypes.VAULT
+    )
+    assert isinstance(secret_manager.secret_manager, VaultSecretManager)
+    assert secret_manager.secret_manager is other_secret_manager.secret_manager
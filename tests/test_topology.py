@@ -1,13 +1,20 @@
+import json
 from datetime import datetime
 import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 from sqlmodel import select
 
+import keep.topologies.topology_changes as topology_changes
 from keep.api.core.dependencies import SINGLE_TENANT_UUID
 from keep.api.models.db.topology import (
     TopologyApplication,
     TopologyApplicationDtoIn,
     TopologyService,
+    TopologyServiceApplication,
+    TopologyServiceCreateRequestDTO,
     TopologyServiceDependency,
     TopologyServiceDtoIn,
 )
@@ -17,6 +24,10 @@ from keep.topologies.topologies_service import (
     InvalidApplicationDataException,
     ServiceNotFoundException,
 )
+from keep.topologies.topology_index import (
+    get_topology_services_index,
+    invalidate_topology_index,
+)
 from tests.fixtures.client import setup_api_key, client, test_app  # noqa: F401
 
 
@@ -387,3 +398,79 @@ def test_import_to_db(db_session):
         assert len(dependencies) == 1
         assert dependencies[0].service_id == 1
         assert dependencies[0].depends_on_service_id == 2
+
+
+def test_topology_services_index(db_session):
+    create_service(db_session, SINGLE_TENANT_UUID, "1")
+    service_2 = create_service(db_session, SINGLE_TENANT_UUID, "2")
+    service_2.repository = None
+    application = TopologyApplication(
+        tenant_id=SINGLE_TENANT_UUID, name="app", repository="app_repository"
+    )
+    db_session.add(application)
+    db_session.commit()
+    db_session.add(
+        TopologyServiceApplication(
+            service_id=service_2.id, application_id=application.id
+        )
+    )
+    db_session.commit()
+
+    index = get_topology_services_index(SINGLE_TENANT_UUID)
+    enrichments = index.get_service_enrichments({"service": "test_service_1"})
+    assert enrichments["display_name"] == "1"
+    assert enrichments["repository"] == "test_repository"
+    assert "id" not in enrichments and "tenant_id" not in enrichments
+    # the repository of the application
+    enrichments = index.get_service_enrichments(
+        {"display_name": "2", "environment": "unknown"}
+    )
+    assert enrichments["service"] == "test_service_2"
+    assert enrichments["repository"] == "app_repository"
+    assert index.get_service_enrichments({"service": "test_service_3"}) is None
+    assert index.get_service_enrichments({"service": None}) is None
+    assert index.get_service_enrichments({"service": ["test_service_1"]}) is None
+
+    # kept until the topology changes, without any db access
+    with patch(
+        "keep.topologies.topology_index.get_topology_services_with_applications"
+    ) as get_topology_services:
+        assert get_topology_services_index(SINGLE_TENANT_UUID) is index
+        get_topology_services.assert_not_called()
+
+    TopologiesService.create_service(
+        TopologyServiceCreateRequestDTO(service="test_service_3", display_name="3"),
+        SINGLE_TENANT_UUID,
+        db_session,
+    )
+    index = get_topology_services_index(SINGLE_TENANT_UUID)
+    enrichments = index.get_service_enrichments({"service": "test_service_3"})
+    assert enrichments["is_manual"] is True
+
+
+def test_topology_index_invalidated_in_other_processes(db_session, monkeypatch):
+    published = []
+    monkeypatch.setattr(topology_changes, "REDIS", True)
+    monkeypatch.setattr(topology_changes, "_handlers", {})
+    monkeypatch.setattr(topology_changes, "_on_subscribe_handlers", [])
+    monkeypatch.setattr("keep.topologies.topology_index._subscribed", False)
+    monkeypatch.setattr(
+        topology_changes, "start_topology_changes_subscriber", lambda: None
+    )
+    monkeypatch.setattr(
+        "keep.api.redis_settings.get_redis_client",
+        lambda: SimpleNamespace(
+            publish=lambda channel, data: published.append(json.loads(data))
+        ),
+    )
+    index = get_topology_services_index(SINGLE_TENANT_UUID)
+    assert get_topology_services_index(SINGLE_TENANT_UUID) is index
+
+    # e.g. a topology imported through the API
+    invalidate_topology_index(SINGLE_TENANT_UUID)
+    assert published == [{"type": "topology_changed", "tenant_id": SINGLE_TENANT_UUID}]
+    index = get_topology_services_index(SINGLE_TENANT_UUID)
+
+    # received by the subscriber of an arq worker
+    topology_changes.handle_topology_change(published[0])
+    assert get_topology_services_index(SINGLE_TENANT_UUID) is not index
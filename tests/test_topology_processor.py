@@ -0,0 +1,151 @@
+import asyncio
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+import keep.topologies.topology_changes as topology_changes
+import keep.topologies.topology_processor as topology_processor
+from keep.api.core.dependencies import SINGLE_TENANT_UUID
+from keep.api.models.db.topology import (
+    TopologyApplicationDtoOut,
+    TopologyApplicationServiceDto,
+)
+from keep.topologies.topology_index import invalidate_topology_index
+from keep.topologies.topology_processor import TopologyProcessor
+
+
+def _application(name, services):
+    return TopologyApplicationDtoOut(
+        id=uuid.uuid4(),
+        name=name,
+        services=[
+            TopologyApplicationServiceDto(id=str(i), name=service, service=service)
+            for i, service in enumerate(services)
+        ],
+    )
+
+
+@pytest.fixture
+def tenant_configuration(monkeypatch):
+    # the processor must not read the configuration of the tenants in the db
+    class TenantConfiguration:
+        configurations = {}
+
+    monkeypatch.setattr(topology_processor, "TenantConfiguration", TenantConfiguration)
+
+
+def test_topology_processor_processes_changed_services_only(
+    monkeypatch, tenant_configuration
+):
+    calls = {"topology": 0, "last_alerts": 0}
+    processed_applications = []
+
+    def get_topology_data(tenant_id):
+        calls["topology"] += 1
+        return [SimpleNamespace(service=s) for s in ("svc-a", "svc-b", "svc-c")]
+
+    def get_last_alerts(tenant_id, with_incidents=False):
+        calls["last_alerts"] += 1
+        return [
+            SimpleNamespace(service="svc-a", fingerprint="fp-a"),
+            SimpleNamespace(service="svc-c", fingerprint="fp-c"),
+        ]
+
+    monkeypatch.setattr(topology_processor, "get_last_alerts", get_last_alerts)
+    monkeypatch.setattr(
+        topology_processor, "convert_db_alerts_to_dto_alerts", lambda alerts: alerts
+    )
+
+    processor = TopologyProcessor()
+    processor.started = True
+    processor._get_topology_data = get_topology_data
+    processor._get_applications_data = lambda tenant_id: [
+        _application("app-1", ["svc-a", "svc-b"]),
+        _application("app-2", ["svc-c"]),
+    ]
+    processor._get_application_based_incident = lambda tenant_id, application: None
+    processor._create_application_based_incident = (
+        lambda tenant_id, application, services: processed_applications.append(
+            application.name
+        )
+    )
+
+    # the first run processes all the applications
+    processor._process_all_tenants()
+    assert processed_applications == ["app-1", "app-2"]
+    assert calls == {"topology": 1, "last_alerts": 1}
+
+    # nothing changed, nothing is loaded
+    processor._process_all_tenants()
+    assert calls == {"topology": 1, "last_alerts": 1}
+
+    # only the application of the changed service
+    processor.notify_services_changed(SINGLE_TENANT_UUID, ["svc-c", None])
+    processor._process_all_tenants()
+    assert processed_applications == ["app-1", "app-2", "app-2"]
+    assert calls == {"topology": 1, "last_alerts": 2}
+
+    # services that are not in the topology
+    processor.notify_services_changed(SINGLE_TENANT_UUID, ["svc-unknown"])
+    processor._process_all_tenants()
+    assert processed_applications == ["app-1", "app-2", "app-2"]
+    assert calls == {"topology": 1, "last_alerts": 2}
+
+    # the index is rebuilt once the topology changed
+    invalidate_topology_index(SINGLE_TENANT_UUID)
+    processor.notify_services_changed(SINGLE_TENANT_UUID, ["svc-b"])
+    processor._process_all_tenants()
+    assert processed_applications == ["app-1", "app-2", "app-2", "app-1"]
+    assert calls == {"topology": 2, "last_alerts": 3}
+
+
+def test_topology_processor_receives_services_from_other_processes(
+    monkeypatch, tenant_configuration
+):
+    published = []
+    monkeypatch.setattr(topology_changes, "REDIS", True)
+    monkeypatch.setattr(topology_changes, "_handlers", {})
+    monkeypatch.setattr(topology_changes, "_on_subscribe_handlers", [])
+    monkeypatch.setattr(
+        topology_changes, "start_topology_changes_subscriber", lambda: None
+    )
+    monkeypatch.setattr(
+        "keep.api.redis_settings.get_redis_client",
+        lambda: SimpleNamespace(
+            publish=lambda channel, data: published.append(json.loads(data))
+        ),
+    )
+
+    processor = TopologyProcessor()
+    processor.enabled = True
+    processor._start_processing = lambda: None
+    asyncio.run(processor.start())
+    try:
+        # published by the event pipeline of an arq worker
+        TopologyProcessor.publish_services_changed(
+            SINGLE_TENANT_UUID, ["svc-b", None, "svc-a"]
+        )
+        assert published == [
+            {
+                "type": "services_changed",
+                "tenant_id": SINGLE_TENANT_UUID,
+                "services": ["svc-a", "svc-b"],
+            }
+        ]
+        assert processor._pop_changed_services() == {}
+
+        # received by the subscriber of the process running the topology processor
+        topology_changes.handle_topology_change(published[0])
+        assert processor._pop_changed_services() == {
+            SINGLE_TENANT_UUID: {"svc-a", "svc-b"}
+        }
+
+        # the changes published while not subscribed are caught up by a full run
+        processor._last_full_process_time = 0
+        for on_subscribe in topology_changes._on_subscribe_handlers:
+            on_subscribe()
+        assert processor._last_full_process_time is None
+    finally:
+        processor.stop()
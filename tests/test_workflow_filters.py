@@ -1150,3 +1150,59 @@ triggers:
     assert all(a.severity == "critical" for a in triggered_alerts)
     assert not any(a.id == "alert-3" for a in triggered_alerts)
     assert not any(a.id == "alert-4" for a in triggered_alerts)
+
+
+def test_trigger_index_only_parses_matching_workflows(db_session, monkeypatch):
+    """Test that only matching workflows are parsed and that updates are picked up"""
+    workflow_manager = WorkflowManager()
+    for source in ["grafana", "prometheus", "sentry"]:
+        db_session.add(
+            WorkflowDB(
+                id=f"{source}-check",
+                name=f"{source}-check",
+                tenant_id=SINGLE_TENANT_UUID,
+                description=f"Handle alerts from {source}",
+                created_by="test@keephq.dev",
+                interval=0,
+                workflow_raw=f"""workflow:
+id: {source}-check
+triggers:
+- type: alert
+  cel: source == "{source}" && severity == "critical"
+""",
+            )
+        )
+    db_session.commit()
+
+    parsed_workflow_ids = []
+    get_workflow_from_store = workflow_manager._get_workflow_from_store
+
+    def spy(tenant_id, workflow_model):
+        parsed_workflow_ids.append(workflow_model.id)
+        return get_workflow_from_store(tenant_id, workflow_model)
+
+    monkeypatch.setattr(workflow_manager, "_get_workflow_from_store", spy)
+
+    grafana_alert = AlertDto(
+        id="grafana-1",
+        source=["grafana"],
+        name="alert1",
+        status="firing",
+        severity="critical",
+        fingerprint="fp1",
+        lastReceived="2025-01-30T09:19:02.519Z",
+    )
+    workflow_manager.insert_events(SINGLE_TENANT_UUID, [grafana_alert])
+    assert parsed_workflow_ids == ["grafana-check"]
+    assert len(workflow_manager.scheduler.workflows_to_run) == 1
+
+    # the index is rebuilt once a workflow revision changes
+    workflow = db_session.get(WorkflowDB, "sentry-check")
+    workflow.workflow_raw = workflow.workflow_raw.replace("sentry", "grafana")
+    workflow.revision += 1
+    db_session.commit()
+
+    parsed_workflow_ids.clear()
+    workflow_manager.insert_events(SINGLE_TENANT_UUID, [grafana_alert])
+    assert sorted(parsed_workflow_ids) == ["grafana-check", "sentry-check"]
+    assert len(workflow_manager.scheduler.workflows_to_run) == 3
@@ -10,6 +10,16 @@ from keep.functions import cyaml
 from keep.parser.parser import Parser
 from keep.workflowmanager.workflowmanager import WorkflowManager
 
+
+def _mock_provider_secrets(mock_secret_manager, secret):
+    mock_secret_manager.return_value.read_secret.return_value = secret
+    mock_secret_manager.return_value.read_secrets.side_effect = (
+        lambda secret_names, is_json=False: {
+            secret_name: secret for secret_name in secret_names
+        }
+    )
+
+
 workflow_test = """workflow:
   name: Alert Simple
   description: Alert Simple
@@ -151,13 +161,16 @@ def test_workflow_postgres_results(db_session):
     with patch(
         "keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager"
     ) as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {
-            "authentication": {
-                "username": "test",
-                "password": "test",
-                "host": "test",
-            }
-        }
+        _mock_provider_secrets(
+            mock_secret_manager,
+            {
+                "authentication": {
+                    "username": "test",
+                    "password": "test",
+                    "host": "test",
+                }
+            },
+        )
         workflow = parser.parse(
             SINGLE_TENANT_UUID,
             workflow_yaml,
@@ -240,13 +253,16 @@ def test_workflow_postgres_results(db_session):
     with patch(
         "keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager"
     ) as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {
-            "authentication": {
-                "username": "test",
-                "password": "test",
-                "host": "test",
-            }
-        }
+        _mock_provider_secrets(
+            mock_secret_manager,
+            {
+                "authentication": {
+                    "username": "test",
+                    "password": "test",
+                    "host": "test",
+                }
+            },
+        )
         with patch.object(
             PostgresProvider,
             "_query",
@@ -313,7 +329,7 @@ def test_workflow_enrichment_with_nested_results(db_session, create_alert):
     with patch(
         "keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager"
     ) as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {}
+        _mock_provider_secrets(mock_secret_manager, {})
         workflow = parser.parse(
             SINGLE_TENANT_UUID,
             workflow_yaml,
@@ -398,7 +414,7 @@ def test_workflow_alert_creation(db_session):
     with patch(
         "keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager"
     ) as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {}
+        _mock_provider_secrets(mock_secret_manager, {})
         workflow = parser.parse(
             SINGLE_TENANT_UUID,
             workflow_yaml,
@@ -500,7 +516,7 @@ def test_workflow_python(db_session):
     with patch(
         "keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager"
     ) as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {}
+        _mock_provider_secrets(mock_secret_manager, {})
         workflow = parser.parse(
             SINGLE_TENANT_UUID,
             workflow_yaml,
@@ -564,7 +580,7 @@ def test_workflow_bash(db_session):
     with patch(
         "keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager"
     ) as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {}
+        _mock_provider_secrets(mock_secret_manager, {})
         workflow = parser.parse(
             SINGLE_TENANT_UUID,
             workflow_yaml,
@@ -627,7 +643,7 @@ def test_workflow_bash_python(db_session):
     with patch(
         "keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager"
     ) as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {}
+        _mock_provider_secrets(mock_secret_manager, {})
         workflow = parser.parse(
             SINGLE_TENANT_UUID,
             workflow_yaml,
@@ -719,7 +735,7 @@ def test_workflow_keep_notify_after_another_foreach(
     with patch(
         "keep.secretmanager.secretmanagerfactory.SecretManagerFactory.get_secret_manager"
     ) as mock_secret_manager:
-        mock_secret_manager.return_value.read_secret.return_value = {}
+        _mock_provider_secrets(mock_secret_manager, {})
         workflow = parser.parse(
             SINGLE_TENANT_UUID,
             workflow_yaml,
@@ -5,6 +5,7 @@ from keep.api.models.db.workflow import (
     WorkflowExecution,
     WorkflowExecutionLog,
 )
+from keep.contextmanager.contextmanager import ContextManager
 from keep.workflowmanager.workflowstore import WorkflowStore
 from keep.api.core.db import get_all_provisioned_workflows
 from tests.fixtures.client import test_app  # noqa
@@ -585,3 +586,104 @@ def test_get_workflow_run_logs_sorted_by_timestamp(db_session):
     for i, log in enumerate(logs):
         if i < len(logs) - 1:
             assert log.timestamp < logs[i + 1].timestamp
+
+
+PRINT_WORKFLOW = """
+workflow:
+  id: print-workflow
+  name: Print workflow
+  description: Print workflow
+  triggers:
+    - type: manual
+  actions:
+    - name: print-alert
+      provider:
+        type: console
+        with:
+          message: "{{ alert.name }}"
+"""
+
+
+def test_get_workflow_is_parsed_once_per_revision(db_session, mocker):
+    workflow = Workflow(
+        id="print-workflow",
+        name="print-workflow",
+        tenant_id=SINGLE_TENANT_UUID,
+        description="Print workflow",
+        created_by="test@keephq.dev",
+        interval=0,
+        workflow_raw=PRINT_WORKFLOW,
+    )
+    db_session.add(workflow)
+    db_session.commit()
+
+    workflowstore = WorkflowStore()
+    parse = mocker.spy(workflowstore.parser, "parse")
+
+    first = workflowstore.get_workflow(SINGLE_TENANT_UUID, "print-workflow")
+    second = workflowstore.get_workflow(SINGLE_TENANT_UUID, "print-workflow")
+    assert parse.call_count == 1
+
+    # every execution gets its own context, steps and providers
+    assert first is not second
+    assert first.context_manager is not second.context_manager
+    first.context_manager.set_event_context({"name": "first"})
+    assert second.context_manager.event_context == {}
+    first_action, second_action = first.workflow_actions[0], second.workflow_actions[0]
+    assert first_action.context_manager is first.context_manager
+    assert first_action.provider.context_manager is first.context_manager
+    assert second_action.provider.context_manager is second.context_manager
+    assert first_action.provider is not second_action.provider
+
+    workflow.revision += 1
+    db_session.add(workflow)
+    db_session.commit()
+    workflowstore.get_workflow(SINGLE_TENANT_UUID, "print-workflow")
+    assert parse.call_count == 2
+
+
+PRINT_WORKFLOWS = """
+workflows:
+  - id: print-workflow
+    name: Print workflow
+    description: Print workflow
+    triggers:
+      - type: manual
+    actions:
+      - name: print-alert
+        provider:
+          type: console
+          with:
+            message: "{{ alert.name }}"
+"""
+
+
+@pytest.mark.parametrize(
+    "workflow_raw",
+    [
+        PRINT_WORKFLOW,
+        # the list form, with a single workflow
+        PRINT_WORKFLOWS,
+    ],
+)
+def test_get_workflow_context_gets_workflow_dict(db_session, mocker, workflow_raw):
+    workflow = Workflow(
+        id="print-workflow",
+        name="print-workflow",
+        tenant_id=SINGLE_TENANT_UUID,
+        description="Print workflow",
+        created_by="test@keephq.dev",
+        interval=0,
+        workflow_raw=workflow_raw,
+    )
+    db_session.add(workflow)
+    db_session.commit()
+    context_manager = mocker.patch(
+        "keep.workflowmanager.workflowstore.ContextManager", wraps=ContextManager
+    )
+
+    for _ in range(2):
+        WorkflowStore().get_workflow(SINGLE_TENANT_UUID, "print-workflow")
+        workflow_dict = context_manager.call_args.kwargs["workflow"]
+        assert workflow_dict["id"] == "print-workflow"
+        assert workflow_dict["actions"][0]["name"] == "print-alert"